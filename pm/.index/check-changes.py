@@ -1,22 +1,25 @@
 #!/usr/bin/env python3
 """Check if PM system files have changed since last index generation.
 
-Uses Merkle tree root hash comparison for O(1) change detection.
-Outputs which files have changed if any.
+Stat-first: walks the tree once and only re-hashes files whose
+(mtime_ns, size, inode) differs from the machine-local stat cache written
+by generate-merkle.py. Outputs which files have changed if any. An index
+written by another index format version is always stale.
 """
 
-import hashlib
 import json
 import sys
 from pathlib import Path
 
 PM_DIR = Path(__file__).parent.parent
-INDEX_FILE = PM_DIR / ".index" / "merkle-tree.json"
+INDEX_DIR = PM_DIR / ".index"
+INDEX_FILE = INDEX_DIR / "merkle-tree.json"
 
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
 
-def hash_file(path: Path) -> str:
-    """SHA256 hash of file contents."""
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+from lib.index_builder import INDEX_VERSION
+from lib.merkle import StatCache, detect_changes
 
 
 def main():
@@ -25,30 +28,26 @@ def main():
         sys.exit(1)
 
     index = json.loads(INDEX_FILE.read_text())
+    version = index.get("version")
+    if version != INDEX_VERSION:
+        # Hashes in another format can't be compared; the whole index is stale
+        print(f"⚠️ Index is stale: format {version}, expected {INDEX_VERSION}")
+        print("\nRun: python3 .index/generate-merkle.py --full")
+        sys.exit(1)
+
     stored_files = index.get("files", {})
 
-    changed = []
-    added = []
-    removed = []
-
-    # Check existing indexed files
-    for rel_path, info in stored_files.items():
-        full_path = PM_DIR / rel_path
-        if not full_path.exists():
-            removed.append(rel_path)
-        else:
-            current_hash = hash_file(full_path)
-            if current_hash != info["hash"]:
-                changed.append(rel_path)
-
-    # Check for new files
-    for ext in ["*.md", "*.sh"]:
-        for path in PM_DIR.rglob(ext):
-            if ".index" in str(path) or ".git" in str(path):
-                continue
-            rel_path = str(path.relative_to(PM_DIR))
-            if rel_path not in stored_files:
-                added.append(rel_path)
+    stat_cache = StatCache.load(INDEX_DIR)
+    changes = detect_changes(PM_DIR, stored_files, stat_cache)
+
+    # Persist hashes confirmed for touched-but-unchanged files
+    if changes.rehashed:
+        try:
+            stat_cache.save()
+        except OSError:
+            pass
+
+    changed, added, removed = changes.changed, changes.added, changes.removed
 
     # Report
     if not changed and not added and not removed:
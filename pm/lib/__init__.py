@@ -2,6 +2,10 @@
 
 __version__ = "1.1.0"
 
+# Shared entity corpus
+from .corpus import Entity, EntityCorpus, get_corpus
+from .entity_index import EntityIndex, EntityRecord, get_entity_index, update_entity_indexes
+
 # Review pipeline exports
 from .review_generator import (
     Finding,
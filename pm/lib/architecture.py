@@ -2,6 +2,7 @@
 
 Generates:
 - Mermaid diagrams for documentation
+- ARCHITECTURE.md
 - Interactive HTML visualization
 - Dependency graphs
 """
@@ -11,7 +12,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .frontmatter import parse_file, extract_dependencies
+from .corpus import EntityCorpus, get_corpus
+from .frontmatter import extract_dependencies
 
 
 @dataclass
@@ -82,11 +84,12 @@ def classify_layer(file_path: str, frontmatter: dict) -> str:
     return "middleware"  # Default
 
 
-def scan_architecture(root: Path) -> Architecture:
+def scan_architecture(root: Path, corpus: EntityCorpus | None = None) -> Architecture:
     """Scan project and build architecture model.
 
     Args:
         root: Project root directory
+        corpus: Shared entity corpus (defaults to the process-wide one)
 
     Returns:
         Architecture object with all components
@@ -96,18 +99,18 @@ def scan_architecture(root: Path) -> Architecture:
         version="1.0.0",
     )
 
+    if corpus is None:
+        corpus = get_corpus()
+
     # Scan all markdown files
-    for md_file in root.rglob("*.md"):
+    for entity in corpus.iter_scan(root, "*.md"):
+        md_file = entity.path
         # Skip hidden and docs
         rel_path = str(md_file.relative_to(root))
         if rel_path.startswith(".git"):
             continue
 
-        try:
-            frontmatter = parse_file(md_file)
-        except Exception:
-            continue
-
+        frontmatter = entity.frontmatter
         if not frontmatter:
             continue
 
@@ -470,3 +473,143 @@ def generate_html(arch: Architecture) -> str:
 </body>
 </html>
 '''
+
+
+def generate_markdown(arch: Architecture) -> str:
+    """Generate ARCHITECTURE.md content (Mermaid diagram + component tables)."""
+    md_content = f"""---
+id: "ARCH-001"
+version: "{arch.version}"
+type: doc
+status: active
+created: 2026-02-11
+updated: 2026-02-11
+dependsOn: []
+dependedBy: []
+---
+
+# {arch.name} Architecture
+
+> Auto-generated - DO NOT EDIT MANUALLY
+>
+> Regenerate with: `python scripts/architecture/generate.py`
+
+## Organization Context
+
+```
+jadecli-ai/
+├── pm/              ← This repository
+│   ├── agents/      # AI agent definitions
+│   ├── entities/    # Work item hierarchy
+│   ├── lib/         # Shared code
+│   └── ...
+└── (future repos)
+```
+
+## System Layers
+
+| Layer | Purpose | Components |
+|-------|---------|------------|
+| **Frontend** | Documentation, UI | {len([c for c in arch.components if c.layer == 'frontend'])} |
+| **Middleware** | Agents, orchestration | {len([c for c in arch.components if c.layer == 'middleware'])} |
+| **Backend** | Scripts, tests, lib | {len([c for c in arch.components if c.layer == 'backend'])} |
+| **Data** | Entities, index | {len([c for c in arch.components if c.layer == 'data'])} |
+
+## Component Diagram
+
+{generate_mermaid(arch)}
+
+## Components by Layer
+
+### Frontend ({len([c for c in arch.components if c.layer == 'frontend'])})
+
+| Component | Type | Version | Status |
+|-----------|------|---------|--------|
+"""
+
+    for c in arch.components:
+        if c.layer == "frontend":
+            md_content += f"| {c.name} | {c.type} | {c.version} | {c.status} |\n"
+
+    md_content += f"""
+### Middleware ({len([c for c in arch.components if c.layer == 'middleware'])})
+
+| Component | Type | Version | Status |
+|-----------|------|---------|--------|
+"""
+
+    for c in arch.components:
+        if c.layer == "middleware":
+            md_content += f"| {c.name} | {c.type} | {c.version} | {c.status} |\n"
+
+    md_content += f"""
+### Backend ({len([c for c in arch.components if c.layer == 'backend'])})
+
+| Component | Type | Version | Status |
+|-----------|------|---------|--------|
+"""
+
+    for c in arch.components:
+        if c.layer == "backend":
+            md_content += f"| {c.name} | {c.type} | {c.version} | {c.status} |\n"
+
+    md_content += f"""
+### Data ({len([c for c in arch.components if c.layer == 'data'])})
+
+| Component | Type | Version | Status |
+|-----------|------|---------|--------|
+"""
+
+    for c in arch.components:
+        if c.layer == "data":
+            md_content += f"| {c.name} | {c.type} | {c.version} | {c.status} |\n"
+
+    md_content += """
+## Dependency Flow
+
+```
+Entities (Data) → Agents (Middleware) → Tests/Scripts (Backend) → Docs (Frontend)
+```
+
+## Interactive Visualization
+
+Open `ARCHITECTURE.html` in a browser for interactive exploration.
+
+## Updating
+
+This file is auto-generated on every PR merge via GitHub Actions.
+
+Manual regeneration:
+```bash
+python scripts/architecture/generate.py
+```
+"""
+
+    return md_content
+
+
+def write_architecture(root: Path, corpus: EntityCorpus | None = None) -> list[str]:
+    """Scan the project and write ARCHITECTURE.md, ARCHITECTURE.html and architecture.json.
+
+    Args:
+        root: Project root directory
+        corpus: Shared entity corpus (defaults to the process-wide one)
+
+    Returns:
+        Progress lines (same as scripts/architecture/generate.py prints)
+    """
+    log = ["Scanning architecture..."]
+    arch = scan_architecture(root, corpus)
+    log.append(f"Found {len(arch.components)} components")
+
+    (root / "ARCHITECTURE.md").write_text(generate_markdown(arch))
+    log.append("Generated: ARCHITECTURE.md")
+
+    (root / "ARCHITECTURE.html").write_text(generate_html(arch))
+    log.append("Generated: ARCHITECTURE.html")
+
+    (root / "architecture.json").write_text(json.dumps(arch.to_dict(), indent=2))
+    log.append("Generated: architecture.json")
+
+    log.append("Done!")
+    return log
@@ -5,22 +5,29 @@ that require serialized execution.
 
 schema: task
 depends_on:
-  - pm/lib/frontmatter.py
+  - pm/lib/corpus.py
+  - pm/lib/dependency_graph.py
+  - pm/lib/domains.py
   - pm/lib/review_generator.py
 depended_by:
   - pm/agents/assignment-manager.md
+  - pm/lib/review_runner.py
 semver: minor
 """
 
+import heapq
 import json
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from .frontmatter import parse_frontmatter, get_body
+from .corpus import EntityCorpus, get_corpus
+from .dependency_graph import DependencyGraph
+from .domains import DOMAIN_RULES, get_classifier
 
 
 # Domain to agent mapping
@@ -37,16 +44,23 @@ DOMAIN_AGENT_MAP: dict[str, str] = {
     "backend": "staff-engineer-1",  # Default fallback
 }
 
-# Path patterns for domain classification
-DOMAIN_PATTERNS: list[tuple[str, str]] = [
-    (r"src/auth/|src/middleware/auth", "auth"),
-    (r"src/api/|src/routes/", "api"),
-    (r"src/db/|migrations/|src/repositories/", "data"),
-    (r"app/|src/components/|src/pages/|src/views/", "frontend"),
-    (r"tests/|__tests__/|\.test\.|_test\.", "testing"),
-    (r"\.github/|scripts/|infra/|docker/|k8s/", "infrastructure"),
-    (r"src/utils/|src/lib/|src/shared/", "shared"),  # Conflict zone
-]
+# Path patterns for domain classification (see lib/domains.py)
+DOMAIN_PATTERNS: list[tuple[str, str]] = DOMAIN_RULES
+
+# Line span standing for "the whole file" (a reference without line numbers)
+WHOLE_FILE: tuple[int, int] = (1, sys.maxsize)
+
+# Line specs in file references: "42", "78-95", "10-20, 31"
+LINE_SPEC_RE = re.compile(r"^\s*\d+(?:\s*-\s*\d+)?(?:\s*,\s*\d+(?:\s*-\s*\d+)?)*\s*$")
+
+# Sort rank for task priorities (unknown priorities rank as P2)
+PRIORITY_ORDER: dict[str, int] = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
+# Hours assumed for a task without agentHours
+DEFAULT_TASK_HOURS = 0.5
+
+# Task priority rules for schedule_agents
+SCHEDULE_PRIORITIES = ("critical-path", "lpt")
 
 
 @dataclass
@@ -57,6 +71,9 @@ class TaskFiles:
     priority: str
     files: list[str] = field(default_factory=list)
     domain: str = ""
+    agent_hours: float = DEFAULT_TASK_HOURS
+    # file -> line spans it touches; files not listed touch the whole file
+    line_ranges: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
 
 
 @dataclass
@@ -78,6 +95,42 @@ class Conflict:
     tasks: list[str] = field(default_factory=list)
     resolution: str = ""
     blocked_by_added: dict[str, list[str]] = field(default_factory=dict)
+    lines: tuple[int, int] | None = None  # Overlapping span; None = whole file
+
+
+@dataclass
+class ParallelSchedule:
+    """Waves of tasks that can run together, plus what couldn't be scheduled."""
+
+    groups: list[list[str]] = field(default_factory=list)
+    cycles: list[list[str]] = field(default_factory=list)  # Tasks blocking each other
+    blocked: list[str] = field(default_factory=list)  # Waiting on a cycle, not in one
+
+    @property
+    def unschedulable(self) -> list[str]:
+        """Every task on or behind a cycle, sorted."""
+        return sorted([t for cycle in self.cycles for t in cycle] + self.blocked)
+
+
+@dataclass
+class ScheduledTask:
+    """One task placed on an agent's timeline (hours from plan start)."""
+
+    task_id: str
+    agent: str
+    start: float
+    end: float
+
+
+@dataclass
+class AgentSchedule:
+    """Timeline produced by schedule_agents."""
+
+    tasks: list[ScheduledTask] = field(default_factory=list)
+    makespan: float = 0.0
+    busy_hours: dict[str, float] = field(default_factory=dict)
+    utilisation: dict[str, float] = field(default_factory=dict)  # busy / (capacity * makespan)
+    unscheduled: list[str] = field(default_factory=list)  # On or behind a cycle
 
 
 @dataclass
@@ -89,6 +142,7 @@ class AssignmentResult:
     serialized: dict[str, dict[str, Any]] = field(default_factory=dict)
     conflicts: list[Conflict] = field(default_factory=list)
     parallel_groups: list[dict[str, Any]] = field(default_factory=list)
+    schedule: list[dict[str, Any]] = field(default_factory=list)
     stats: dict[str, Any] = field(default_factory=dict)
 
     def to_json(self) -> str:
@@ -113,12 +167,14 @@ class AssignmentResult:
             "conflicts": [
                 {
                     "file": c.file,
+                    **({"lines": list(c.lines)} if c.lines else {}),
                     "tasks": c.tasks,
                     "resolution": c.resolution,
                 }
                 for c in self.conflicts
             ],
             "parallel_groups": self.parallel_groups,
+            **({"schedule": self.schedule} if self.schedule else {}),
             "stats": self.stats,
         }
 
@@ -132,75 +188,207 @@ def classify_domain(file_path: str) -> str:
     Returns:
         Domain name (auth, api, data, frontend, testing, infrastructure, shared, backend)
     """
-    path = file_path.lower()
+    return get_classifier().classify(file_path)
 
-    for pattern, domain in DOMAIN_PATTERNS:
-        if re.search(pattern, path):
-            return domain
 
-    return "backend"  # Default
+def extract_files_from_task(
+    task_path: Path,
+    corpus: EntityCorpus | None = None,
+) -> list[str]:
+    """Extract file paths from a task entity's body.
 
+    Args:
+        task_path: Path to TASK-XXX.md file
+        corpus: Shared entity corpus (defaults to the process-wide one)
 
-def extract_files_from_task(task_path: Path) -> list[str]:
-    """Extract file paths from a task entity's body.
+    Returns:
+        List of file paths mentioned in the task
+    """
+    if corpus is None:
+        corpus = get_corpus()
+    return extract_files_from_body(corpus.get(task_path).read_body())
+
+
+def extract_files_from_body(body: str) -> list[str]:
+    """Extract file paths from a task entity's markdown body.
 
     Parses the Files section looking for patterns like:
     - `path/to/file.ts` - Create
     - `path/to/file.ts` - Modify
 
     Args:
-        task_path: Path to TASK-XXX.md file
+        body: Task body (content after frontmatter)
 
     Returns:
         List of file paths mentioned in the task
     """
-    content = task_path.read_text(encoding="utf-8", errors="ignore")
-    body = get_body(content)
+    return list(extract_file_ranges_from_body(body))
+
+
+def extract_file_ranges_from_body(body: str) -> dict[str, list[tuple[int, int]]]:
+    """Extract file paths and the line spans referenced for each.
 
-    files: list[str] = []
+    Recognises `path:lines` in the list and **File** patterns, where lines
+    is e.g. `42`, `78-95` or `10-20, 31`. A file that is mentioned anywhere
+    without lines maps to an empty list (the whole file).
+
+    Args:
+        body: Task body (content after frontmatter)
+
+    Returns:
+        Mapping of file path -> line spans, in order of first mention
+    """
+    refs: list[str] = []
 
     # Pattern: - `path/to/file` - Action
     file_list_pattern = r"-\s*`([^`]+)`\s*-\s*\w+"
-    files.extend(re.findall(file_list_pattern, body))
+    refs.extend(re.findall(file_list_pattern, body))
 
     # Pattern: **File**: `path/to/file:lines`
-    file_ref_pattern = r"\*\*File\*\*:\s*`([^`:]+)"
-    files.extend(re.findall(file_ref_pattern, body))
+    file_ref_pattern = r"\*\*File\*\*:\s*`([^`]+)"
+    refs.extend(re.findall(file_ref_pattern, body))
 
     # Pattern: in finding references like "in {file}"
     inline_pattern = r"in\s+`([^`]+\.[a-z]+)`"
-    files.extend(re.findall(inline_pattern, body, re.IGNORECASE))
+    refs.extend(re.findall(inline_pattern, body, re.IGNORECASE))
 
-    # Deduplicate while preserving order
-    seen = set()
-    unique_files = []
-    for f in files:
-        if f not in seen:
-            seen.add(f)
-            unique_files.append(f)
+    ranges: dict[str, list[tuple[int, int]] | None] = {}
+    for ref in refs:
+        path, spans = split_line_ref(ref)
+        if spans is None or ranges.get(path, []) is None:
+            ranges[path] = None  # Whole file wins
+        else:
+            ranges.setdefault(path, []).extend(spans)
 
-    return unique_files
+    return {path: spans or [] for path, spans in ranges.items()}
 
 
-def find_conflicts(task_files: dict[str, list[str]]) -> dict[str, list[str]]:
-    """Find files that appear in multiple tasks.
+def split_line_ref(ref: str) -> tuple[str, list[tuple[int, int]] | None]:
+    """Split "path:78-95" into ("path", [(78, 95)]); no lines gives None."""
+    path, sep, spec = ref.rpartition(":")
+    if not sep or not LINE_SPEC_RE.match(spec):
+        return ref.strip(), None
+    return path.strip(), parse_line_spec(spec)
+
+
+def parse_line_spec(spec: str) -> list[tuple[int, int]]:
+    """Parse "10-20, 31" into [(10, 20), (31, 31)] (reversed spans are swapped)."""
+    spans = []
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        start, end = int(first), int(last or first)
+        spans.append((min(start, end), max(start, end)))
+    return spans
+
+
+def index_files(task_files: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Invert task -> files into file -> tasks.
 
     Args:
         task_files: Mapping of task_id -> list of files
 
     Returns:
-        Mapping of file -> list of task_ids that reference it
+        Mapping of file -> task_ids referencing it, in task order
+        (a task listing a file twice appears once)
     """
     file_to_tasks: dict[str, list[str]] = defaultdict(list)
 
     for task_id, files in task_files.items():
-        for file in files:
+        for file in dict.fromkeys(files):
             file_to_tasks[file].append(task_id)
 
+    return dict(file_to_tasks)
+
+
+def find_conflicts(
+    task_files: dict[str, list[str]],
+    file_to_tasks: dict[str, list[str]] | None = None,
+) -> dict[str, list[str]]:
+    """Find files that appear in multiple tasks.
+
+    Args:
+        task_files: Mapping of task_id -> list of files
+        file_to_tasks: Precomputed index_files(task_files), if available
+
+    Returns:
+        Mapping of file -> list of task_ids that reference it
+    """
+    if file_to_tasks is None:
+        file_to_tasks = index_files(task_files)
+
     # Only return files with multiple tasks
     return {f: tasks for f, tasks in file_to_tasks.items() if len(tasks) > 1}
 
 
+def find_line_conflicts(
+    file_to_tasks: dict[str, list[str]],
+    line_ranges: dict[str, dict[str, list[tuple[int, int]]]],
+) -> dict[str, list[tuple[list[str], tuple[int, int] | None]]]:
+    """Split each shared file into clusters of tasks whose line spans overlap.
+
+    Per file, spans are sorted by start and swept once; overlapping spans
+    join their tasks (union-find, so a task with several spans can bridge
+    clusters). A task without spans for a file touches the whole file and
+    overlaps everything. Tasks on disjoint hunks end up in different
+    clusters and need no serialization.
+
+    Args:
+        file_to_tasks: Mapping of file -> task_ids (see index_files)
+        line_ranges: Mapping of task_id -> file -> line spans
+
+    Returns:
+        Mapping of file -> [(task_ids, span)] for every cluster of two or more
+        tasks, task_ids in file_to_tasks order and span None when a cluster
+        includes a whole-file reference
+    """
+    conflicts: dict[str, list[tuple[list[str], tuple[int, int] | None]]] = {}
+
+    for file, tasks in file_to_tasks.items():
+        if len(tasks) < 2:
+            continue
+
+        spans = []
+        for task in tasks:
+            for span in line_ranges.get(task, {}).get(file) or (WHOLE_FILE,):
+                spans.append((span[0], span[1], task))
+        spans.sort()
+
+        parent = {task: task for task in tasks}
+
+        def find(task: str) -> str:
+            while parent[task] != task:
+                parent[task] = parent[parent[task]]
+                task = parent[task]
+            return task
+
+        cluster_end = -1
+        cluster_task = ""
+        for start, end, task in spans:
+            if start <= cluster_end:
+                parent[find(task)] = find(cluster_task)
+                cluster_end = max(cluster_end, end)
+            else:
+                cluster_task, cluster_end = task, end
+
+        members: dict[str, list[str]] = defaultdict(list)
+        for task in tasks:
+            members[find(task)].append(task)
+        bounds: dict[str, list[int]] = {}
+        for start, end, task in spans:
+            bound = bounds.setdefault(find(task), [start, end])
+            bound[0], bound[1] = min(bound[0], start), max(bound[1], end)
+
+        clusters = []
+        for root, group in members.items():
+            if len(group) > 1:
+                start, end = bounds[root]
+                clusters.append((group, None if end == WHOLE_FILE[1] else (start, end)))
+        if clusters:
+            conflicts[file] = clusters
+
+    return conflicts
+
+
 def sort_tasks_by_priority(
     task_ids: list[str],
     task_priorities: dict[str, str],
@@ -216,80 +404,245 @@ def sort_tasks_by_priority(
     """
     def priority_key(task_id: str) -> tuple[int, str]:
         priority = task_priorities.get(task_id, "P2")
-        priority_order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
-        return (priority_order.get(priority, 2), task_id)
+        return (PRIORITY_ORDER.get(priority, 2), task_id)
 
     return sorted(task_ids, key=priority_key)
 
 
+def schedule_parallel_groups(
+    task_ids: list[str],
+    blocked_by: dict[str, set[str]],
+    max_group_size: int | None = None,
+) -> ParallelSchedule:
+    """Schedule tasks into parallel waves (Kahn's algorithm).
+
+    Each task's count of unfinished blockers is kept and decremented as
+    waves complete, so the whole schedule is O(tasks + dependencies).
+    Blockers outside task_ids are ignored (they are not part of this
+    plan). Tasks on a cycle are reported in `cycles`, and tasks waiting
+    on one in `blocked`; neither appears in a group.
+
+    Args:
+        task_ids: All task IDs
+        blocked_by: Mapping of task_id -> set of blocking task_ids
+        max_group_size: Most tasks per wave (e.g. available agents); tasks
+            that don't fit roll over to the next wave
+
+    Returns:
+        ParallelSchedule with groups in execution order
+    """
+    if max_group_size is not None and max_group_size < 1:
+        raise ValueError(f"max_group_size must be positive, got {max_group_size}")
+
+    tasks = set(task_ids)
+    pending: dict[str, int] = {}
+    unblocks: dict[str, list[str]] = defaultdict(list)
+    for task in tasks:
+        count = 0
+        for blocker in blocked_by.get(task, ()):
+            if blocker in tasks:
+                unblocks[blocker].append(task)
+                count += 1
+        pending[task] = count
+
+    schedule = ParallelSchedule()
+    ready = sorted(t for t, count in pending.items() if count == 0)
+
+    while ready:
+        group = ready if max_group_size is None else ready[:max_group_size]
+        carried = ready[len(group):]
+        schedule.groups.append(group)
+
+        released = []
+        for task in group:
+            del pending[task]
+            for waiting in unblocks.get(task, ()):
+                pending[waiting] -= 1
+                if pending[waiting] == 0:
+                    released.append(waiting)
+        # Rolled-over tasks go first so a full wave can't starve them
+        ready = carried + sorted(released)
+
+    if pending:
+        # Whatever is left is on a cycle or downstream of one
+        graph = DependencyGraph()
+        for task in pending:
+            for blocker in blocked_by.get(task, ()):
+                if blocker in pending:
+                    graph.add_edge(blocker, task)
+        schedule.cycles = graph.cycles()
+        on_cycle = {t for cycle in schedule.cycles for t in cycle}
+        schedule.blocked = sorted(t for t in pending if t not in on_cycle)
+
+    return schedule
+
+
 def form_parallel_groups(
     task_ids: list[str],
     blocked_by: dict[str, set[str]],
+    max_group_size: int | None = None,
 ) -> list[list[str]]:
     """Form groups of tasks that can execute in parallel.
 
     Uses topological sorting to group tasks with no dependencies
-    in the same group.
+    in the same group. Tasks on or behind a dependency cycle go in one
+    final group; use schedule_parallel_groups to tell them apart.
 
     Args:
         task_ids: All task IDs
         blocked_by: Mapping of task_id -> set of blocking task_ids
+        max_group_size: Most tasks per group (e.g. available agents)
 
     Returns:
         List of groups, each group can run in parallel
     """
-    groups: list[list[str]] = []
-    remaining = set(task_ids)
-    completed: set[str] = set()
-
-    while remaining:
-        # Find tasks with no blockers in remaining set
-        ready = {
-            t for t in remaining
-            if not (blocked_by.get(t, set()) - completed)
-        }
+    schedule = schedule_parallel_groups(task_ids, blocked_by, max_group_size)
+    unschedulable = schedule.unschedulable
+    return schedule.groups + [unschedulable] if unschedulable else schedule.groups
+
+
+def schedule_agents(
+    tasks: list[TaskFiles],
+    blocked_by: dict[str, set[str]],
+    agents: dict[str, int],
+    priority: str = "critical-path",
+) -> AgentSchedule:
+    """Place tasks on agent timelines to minimise total wall-clock time.
+
+    Event-driven list scheduling: whenever an agent slot is free, the
+    highest-priority ready task starts on it. Priority is either the
+    task's critical path (its agentHours plus the longest chain of
+    dependents behind it) or longest-processing-time-first. A free
+    agent that owns the task's domain is preferred, then the least
+    loaded one. File conflicts are honoured through blocked_by (see
+    assign_files_to_agents), so tasks sharing a file never overlap.
+
+    Args:
+        tasks: Tasks with agent_hours set
+        blocked_by: Mapping of task_id -> set of blocking task_ids
+        agents: Mapping of agent -> capacity (tasks it can run at once)
+        priority: "critical-path" or "lpt"
+
+    Returns:
+        AgentSchedule with the timeline, makespan and per-agent utilisation
 
-        if not ready:
-            # Circular dependency - shouldn't happen, but break to avoid infinite loop
-            groups.append(sorted(remaining))
+    Raises:
+        ValueError: If priority is unknown or no agent has capacity
+    """
+    if priority not in SCHEDULE_PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}, expected one of {SCHEDULE_PRIORITIES}")
+    free = {agent: capacity for agent, capacity in agents.items() if capacity > 0}
+    if not free:
+        raise ValueError("No agent with positive capacity")
+
+    by_id = {t.task_id: t for t in tasks}
+    hours = {t.task_id: max(t.agent_hours, 0.0) for t in tasks}
+    pending: dict[str, int] = {}
+    unblocks: dict[str, list[str]] = defaultdict(list)
+    for task_id in by_id:
+        blockers = [b for b in blocked_by.get(task_id, ()) if b in by_id]
+        for blocker in blockers:
+            unblocks[blocker].append(task_id)
+        pending[task_id] = len(blockers)
+
+    if priority == "lpt":
+        rank = hours
+    else:
+        # Longest chain from each task to the end, in reverse topological order
+        order = schedule_parallel_groups(list(by_id), blocked_by).groups
+        rank = {}
+        for group in reversed(order):
+            for task_id in group:
+                rank[task_id] = hours[task_id] + max(
+                    (rank[d] for d in unblocks.get(task_id, ()) if d in rank), default=0.0
+                )
+
+    schedule = AgentSchedule(busy_hours={agent: 0.0 for agent in free})
+    ready = [(-rank.get(t, 0.0), t) for t, count in pending.items() if count == 0]
+    heapq.heapify(ready)
+    running: list[tuple[float, str, str]] = []  # (end, task_id, agent)
+    now = 0.0
+
+    while ready or running:
+        while ready and any(free.values()):
+            _, task_id = heapq.heappop(ready)
+            agent = _pick_agent(by_id[task_id].domain, free, schedule.busy_hours)
+            free[agent] -= 1
+            end = now + hours[task_id]
+            schedule.busy_hours[agent] += hours[task_id]
+            schedule.tasks.append(ScheduledTask(task_id, agent, now, end))
+            heapq.heappush(running, (end, task_id, agent))
+
+        if not running:
             break
 
-        groups.append(sorted(ready))
-        completed.update(ready)
-        remaining -= ready
+        # Advance to the next completion, finishing everything that ends then
+        now = running[0][0]
+        while running and running[0][0] <= now:
+            _, done, agent = heapq.heappop(running)
+            free[agent] += 1
+            for waiting in unblocks.get(done, ()):
+                pending[waiting] -= 1
+                if pending[waiting] == 0:
+                    heapq.heappush(ready, (-rank.get(waiting, 0.0), waiting))
+
+    placed = {t.task_id for t in schedule.tasks}
+    schedule.unscheduled = sorted(t for t in by_id if t not in placed)
+    schedule.makespan = max((t.end for t in schedule.tasks), default=0.0)
+    schedule.utilisation = {
+        agent: round(busy / (agents[agent] * schedule.makespan), 3) if schedule.makespan else 0.0
+        for agent, busy in schedule.busy_hours.items()
+    }
+    return schedule
+
 
-    return groups
+def _pick_agent(domain: str, free: dict[str, int], busy: dict[str, float]) -> str:
+    """Free agent for a task: its domain owner if free, else the least loaded."""
+    owner = DOMAIN_AGENT_MAP.get(domain or "")
+    if owner is not None and free.get(owner, 0) > 0:
+        return owner
+    return min((a for a, slots in free.items() if slots > 0), key=lambda a: (busy[a], a))
 
 
 def assign_files_to_agents(
     tasks: list[TaskFiles],
     branch: str,
+    max_group_size: int | None = None,
+    agents: dict[str, int] | None = None,
+    priority: str = "critical-path",
 ) -> AssignmentResult:
     """Main assignment algorithm.
 
     Assigns files to agents by domain, detects conflicts,
     and creates serialization order for shared files.
 
+    With `agents`, tasks are instead placed on those agents' timelines by
+    schedule_agents (load-balanced, using each task's agentHours), and the
+    stats report the expected makespan and per-agent utilisation.
+
     Args:
         tasks: List of TaskFiles with their file lists
         branch: Branch name for the result
+        max_group_size: Cap on tasks per parallel group (e.g. available agents)
+        agents: Available agents and their capacity (scheduling mode)
+        priority: Scheduling priority, "critical-path" or "lpt"
 
     Returns:
         AssignmentResult with assignments and conflict info
     """
     result = AssignmentResult(branch=branch)
 
-    # Build task -> files mapping
+    # Build task -> files mapping, and the inverted file -> tasks index
     task_files: dict[str, list[str]] = {t.task_id: t.files for t in tasks}
     task_priorities: dict[str, str] = {t.task_id: t.priority for t in tasks}
+    task_domains: dict[str, str] = {t.task_id: t.domain for t in tasks}
+    file_to_tasks = index_files(task_files)
 
     # Get all unique files
-    all_files: set[str] = set()
-    for files in task_files.values():
-        all_files.update(files)
+    all_files = file_to_tasks.keys()
 
     # Classify files by domain
-    file_domains: dict[str, str] = {f: classify_domain(f) for f in all_files}
+    file_domains: dict[str, str] = get_classifier().classify_many(all_files)
 
     # Initial assignment by domain
     agent_files: dict[str, set[str]] = defaultdict(set)
@@ -300,21 +653,23 @@ def assign_files_to_agents(
 
         # Handle shared domain - assign to first task's domain agent
         if domain == "shared":
-            for task in tasks:
-                if file in task.files:
-                    task_domain = task.domain or "backend"
-                    agent = DOMAIN_AGENT_MAP.get(task_domain, "staff-engineer-1")
-                    break
+            task_domain = task_domains[file_to_tasks[file][0]] or "backend"
+            agent = DOMAIN_AGENT_MAP.get(task_domain, "staff-engineer-1")
 
         agent_files[agent].add(file)
         if agent not in agent_domains:
             agent_domains[agent] = domain
 
-    # Find conflicts
-    conflicts = find_conflicts(task_files)
+    # Find conflicts: tasks whose line spans overlap within a shared file
+    line_ranges = {t.task_id: t.line_ranges for t in tasks}
+    clusters = [
+        (file, conflicting_tasks, lines)
+        for file, file_clusters in find_line_conflicts(file_to_tasks, line_ranges).items()
+        for conflicting_tasks, lines in file_clusters
+    ]
     blocked_by: dict[str, set[str]] = defaultdict(set)
 
-    for file, conflicting_tasks in conflicts.items():
+    for file, conflicting_tasks, lines in clusters:
         # Sort by priority
         ordered = sort_tasks_by_priority(conflicting_tasks, task_priorities)
 
@@ -330,40 +685,69 @@ def assign_files_to_agents(
                 ordered[i]: [ordered[i - 1]]
                 for i in range(1, len(ordered))
             },
+            lines=lines,
         )
         result.conflicts.append(conflict)
 
-        # Record in serialized
-        result.serialized[file] = {
+        # Record in serialized (keyed by file, or file:span for a hunk)
+        key = file if lines is None else f"{file}:{lines[0]}-{lines[1]}"
+        result.serialized[key] = {
             "tasks": ordered,
             "order": ordered,
-            "reason": "Shared file requires sequential execution",
+            "reason": (
+                "Shared file requires sequential execution" if lines is None
+                else "Overlapping lines require sequential execution"
+            ),
             "blockedBy_added": conflict.blocked_by_added,
         }
 
-    # Build assignments
-    for agent, files in agent_files.items():
-        # Find tasks that touch these files
-        agent_tasks = []
-        for task in tasks:
-            if any(f in files for f in task.files):
-                if task.task_id not in agent_tasks:
-                    agent_tasks.append(task.task_id)
-
-        # Estimate hours (0.5 per task)
-        hours = len(agent_tasks) * 0.5
-
-        result.assignments[agent] = Assignment(
-            agent=agent,
-            domain=agent_domains.get(agent, "backend"),
-            files=sorted(files),
-            tasks=agent_tasks,
-            estimated_hours=hours,
-        )
+    task_hours = {t.task_id: t.agent_hours for t in tasks}
+    timeline: AgentSchedule | None = None
+
+    if agents is not None:
+        # Scheduling mode: agents come from the timeline, not the domain map
+        timeline = schedule_agents(tasks, blocked_by, agents, priority)
+        by_id = {t.task_id: t for t in tasks}
+        for entry in timeline.tasks:
+            assignment = result.assignments.get(entry.agent)
+            if assignment is None:
+                assignment = result.assignments[entry.agent] = Assignment(
+                    agent=entry.agent,
+                    domain=by_id[entry.task_id].domain or "backend",
+                )
+            assignment.tasks.append(entry.task_id)
+            assignment.files.extend(by_id[entry.task_id].files)
+            assignment.estimated_hours += task_hours[entry.task_id]
+            result.schedule.append({
+                "task": entry.task_id,
+                "agent": entry.agent,
+                "start": entry.start,
+                "end": entry.end,
+            })
+        for assignment in result.assignments.values():
+            assignment.files = sorted(set(assignment.files))
+    else:
+        # Tasks touching each agent's files, in task order
+        file_agent = {f: agent for agent, files in agent_files.items() for f in files}
+        agent_tasks: dict[str, dict[str, None]] = {agent: {} for agent in agent_files}
+        for task_id, files in task_files.items():
+            for file in files:
+                agent_tasks[file_agent[file]][task_id] = None
+
+        # Build assignments
+        for agent, files in agent_files.items():
+            result.assignments[agent] = Assignment(
+                agent=agent,
+                domain=agent_domains.get(agent, "backend"),
+                files=sorted(files),
+                tasks=list(agent_tasks[agent]),
+                estimated_hours=sum(task_hours[t] for t in agent_tasks[agent]),
+            )
 
     # Form parallel groups
     all_task_ids = [t.task_id for t in tasks]
-    groups = form_parallel_groups(all_task_ids, blocked_by)
+    schedule = schedule_parallel_groups(all_task_ids, blocked_by, max_group_size)
+    groups = schedule.groups
 
     for i, group in enumerate(groups, 1):
         result.parallel_groups.append({
@@ -371,54 +755,90 @@ def assign_files_to_agents(
             "tasks": group,
             "can_start_immediately": i == 1,
         })
+    unschedulable = schedule.unschedulable
+    if unschedulable:
+        # Kept as a final group so readers of parallel_groups still see them
+        result.parallel_groups.append({
+            "group": len(groups) + 1,
+            "tasks": unschedulable,
+            "can_start_immediately": False,
+            "unschedulable": True,
+        })
 
     # Stats
     result.stats = {
         "total_files": len(all_files),
         "total_tasks": len(tasks),
         "agents_needed": len(result.assignments),
-        "conflicts_found": len(conflicts),
+        "conflicts_found": len(clusters),
         "max_parallelism": max(len(g) for g in groups) if groups else 0,
+        "cycles": schedule.cycles,
+        "unscheduled": len(unschedulable),
     }
+    if timeline is not None:
+        result.stats.update({
+            "makespan_hours": timeline.makespan,
+            "total_hours": sum(task_hours.values()),
+            "utilisation": timeline.utilisation,
+        })
 
     return result
 
 
-def load_tasks_from_directory(task_dir: Path) -> list[TaskFiles]:
+def load_tasks_from_directory(
+    task_dir: Path,
+    corpus: EntityCorpus | None = None,
+) -> list[TaskFiles]:
     """Load TaskFiles from a directory of TASK-*.md files.
 
     Args:
         task_dir: Directory containing task entity files
+        corpus: Shared entity corpus (defaults to the process-wide one)
 
     Returns:
         List of TaskFiles with extracted file lists
     """
     tasks: list[TaskFiles] = []
+    if corpus is None:
+        corpus = get_corpus()
 
-    for task_path in task_dir.glob("TASK-*.md"):
-        content = task_path.read_text(encoding="utf-8", errors="ignore")
-        frontmatter = parse_frontmatter(content)
+    for entity in corpus.iter_scan(task_dir, "TASK-*.md", recursive=False):
+        frontmatter = entity.frontmatter
 
-        task_id = frontmatter.get("id", task_path.stem)
+        task_id = frontmatter.get("id", entity.path.stem)
         priority = frontmatter.get("priority", "P2")
         domain = frontmatter.get("domain", "")
 
-        files = extract_files_from_task(task_path)
+        ranges = extract_file_ranges_from_body(entity.read_body())
 
         tasks.append(TaskFiles(
             task_id=task_id,
             priority=priority,
-            files=files,
+            files=list(ranges),
             domain=domain,
+            agent_hours=_parse_hours(frontmatter.get("agentHours")),
+            line_ranges={f: spans for f, spans in ranges.items() if spans},
         ))
 
     return tasks
 
 
+def _parse_hours(value: Any) -> float:
+    """agentHours from frontmatter (a string), falling back to the default."""
+    try:
+        hours = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_TASK_HOURS
+    return hours if hours >= 0 else DEFAULT_TASK_HOURS
+
+
 def process_assignments(
     task_dir: Path,
     output_path: Path,
     branch: str,
+    max_group_size: int | None = None,
+    agents: dict[str, int] | None = None,
+    priority: str = "critical-path",
 ) -> AssignmentResult:
     """Full pipeline: load tasks, assign, write output.
 
@@ -426,12 +846,15 @@ def process_assignments(
         task_dir: Directory containing TASK-*.md files
         output_path: Path to write assignments.json
         branch: Branch name
+        max_group_size: Cap on tasks per parallel group (e.g. available agents)
+        agents: Available agents and their capacity (scheduling mode)
+        priority: Scheduling priority, "critical-path" or "lpt"
 
     Returns:
         AssignmentResult
     """
     tasks = load_tasks_from_directory(task_dir)
-    result = assign_files_to_agents(tasks, branch)
+    result = assign_files_to_agents(tasks, branch, max_group_size, agents, priority)
 
     output_path.write_text(result.to_json(), encoding="utf-8")
 
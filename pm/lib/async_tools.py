@@ -0,0 +1,323 @@
+"""Async PM tools - streaming, cancellable make targets and staged pipelines.
+
+`PMTools` blocks, caps output at 500 characters and kills anything that
+runs longer than 30 s. `AsyncPMTools` runs the same make targets as
+asyncio subprocesses so an orchestrator can overlap other work, read
+output line by line as it is produced, cancel a run, and follow L2/L3
+pipelines stage by stage (stopping at the first failing stage).
+
+Usage:
+    tools = AsyncPMTools(timeout=600)
+    result = await tools.l3_full(on_progress=print, on_output=print)
+
+    async for line in tools.stream("l0-test"):
+        print(line)
+
+schema: N/A (core library)
+depends_on:
+  - lib/tools.py
+  - Makefile
+depended_by: []
+semver: minor
+"""
+
+import asyncio
+import os
+import re
+import signal
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable
+
+from .tools import ToolResult
+
+
+# Targets run stage by stage by AsyncPMTools.pipeline
+PIPELINES = ("l2-pr-open", "l2-pr-merge", "l2-release", "l3-ci", "l3-cd", "l3-full")
+
+TARGET_RE = re.compile(r"^([\w-]+):")
+SUB_MAKE_RE = re.compile(r"^\t@?\$\(MAKE\) -s ([\w-]+)(?: && echo .*)?$")
+ECHO_RE = re.compile(r"^\t@?echo ")
+
+
+def load_pipeline_stages(makefile: Path) -> dict[str, list[str]]:
+    """Expand each of PIPELINES into the make targets it runs, from the Makefile.
+
+    A recipe made only of `$(MAKE) -s <target>` calls (and echo lines) is
+    split into those targets, recursing into sub-pipelines, so each stage
+    runs as its own subprocess and progress is reported between them. Any
+    other recipe (e.g. l2-pr-merge's inline git commands) is one stage.
+
+    Raises:
+        OSError: If the Makefile can't be read
+    """
+    recipes: dict[str, list[str]] = {}
+    current = None
+    for line in makefile.read_text().splitlines():
+        match = TARGET_RE.match(line)
+        if match:
+            current = match.group(1)
+            recipes[current] = []
+        elif line.startswith("\t") and current is not None:
+            recipes[current].append(line)
+        elif line.strip():
+            current = None
+
+    def expand(name: str) -> list[str]:
+        targets = []
+        for line in recipes.get(name, []):
+            if ECHO_RE.match(line):
+                continue
+            match = SUB_MAKE_RE.match(line)
+            if match is None:
+                return [name]
+            targets.append(match.group(1))
+        return [stage for t in targets for stage in (expand(t) if t in PIPELINES else [t])]
+
+    return {name: expand(name) for name in PIPELINES}
+
+
+@dataclass
+class StageProgress:
+    """Progress event emitted before and after each pipeline stage."""
+    pipeline: str
+    stage: str
+    index: int  # 1-based
+    total: int
+    status: str  # "started", "passed", "failed" or "timeout"
+    elapsed: float  # Seconds since the pipeline started
+
+
+OutputCallback = Callable[[str], None]
+ProgressCallback = Callable[[StageProgress], None]
+
+
+class AsyncPMTools:
+    """Asyncio counterpart of PMTools for long-running targets.
+
+    Output is returned in full (no 500-character cap). `timeout` is a
+    default in seconds (None = no limit); every call can override it.
+    Cancelling the awaiting task kills the make process group.
+    """
+
+    def __init__(self, project_root: Path | str = None, timeout: float | None = None):
+        self.root = Path(project_root) if project_root else Path(__file__).parent.parent
+        self.timeout = timeout
+        self._stages: dict[str, list[str]] | None = None
+
+    @property
+    def pipeline_stages(self) -> dict[str, list[str]]:
+        """Stages of each pipeline, read from the project Makefile once."""
+        if self._stages is None:
+            self._stages = load_pipeline_stages(self.root / "Makefile")
+        return self._stages
+
+    async def _exec(
+        self,
+        cmd: list[str],
+        level: int,
+        tool: str,
+        on_output: OutputCallback | None = None,
+        timeout: float | None = None,
+    ) -> ToolResult:
+        """Run a command, feeding each output line to on_output as it arrives."""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=self.root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,  # Own process group, so make's children die too
+        )
+        lines: list[str] = []
+
+        async def pump() -> int:
+            async for raw in proc.stdout:
+                line = raw.decode("utf-8", errors="replace").rstrip("\n")
+                lines.append(line)
+                if on_output is not None:
+                    on_output(line)
+            return await proc.wait()
+
+        try:
+            returncode = await asyncio.wait_for(pump(), timeout)
+        except asyncio.TimeoutError:
+            await _kill(proc)
+            return ToolResult(False, "\n".join(lines + ["timeout"]), level, tool, len(lines) + 1)
+        except BaseException:
+            # Cancelled by the caller (or the loop is shutting down)
+            await _kill(proc)
+            raise
+
+        output = "\n".join(lines).strip()
+        return ToolResult(
+            success=returncode == 0,
+            output=output,
+            level=level,
+            tool=tool,
+            tokens_approx=len(output.split())
+        )
+
+    async def make(
+        self,
+        target: str,
+        level: int,
+        on_output: OutputCallback | None = None,
+        timeout: float | None = None,
+        **kwargs: str,
+    ) -> ToolResult:
+        """Run one make target.
+
+        Args:
+            target: Make target name (e.g. "l0-test")
+            level: Tool level recorded on the result
+            on_output: Called with each output line as it is produced
+            timeout: Seconds before the process is killed (defaults to self.timeout)
+            **kwargs: Make variables (e.g. FILE="...")
+
+        Returns:
+            ToolResult with the full, uncapped output
+        """
+        cmd = ["make", "-s", target, *(f"{k}={v}" for k, v in kwargs.items())]
+        return await self._exec(cmd, level, target, on_output, _pick(timeout, self.timeout))
+
+    async def stream(self, target: str, level: int = -1, **kwargs: str) -> AsyncIterator[str]:
+        """Yield a make target's output lines as they are produced.
+
+        Leaving the loop early (break, aclose) kills the process.
+
+        Example:
+            async for line in tools.stream("l0-test"):
+                print(line)
+        """
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        task = asyncio.create_task(self.make(target, level, on_output=queue.put_nowait, **kwargs))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (line := await queue.get()) is not None:
+                yield line
+            await task  # Surface exceptions from the subprocess
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    async def pipeline(
+        self,
+        name: str,
+        on_progress: ProgressCallback | None = None,
+        on_output: OutputCallback | None = None,
+        timeout: float | None = None,
+    ) -> ToolResult:
+        """Run an L2/L3 pipeline stage by stage, stopping at the first failure.
+
+        Args:
+            name: Pipeline name, one of PIPELINES (e.g. "l3-ci")
+            on_progress: Called with a StageProgress before and after each stage
+            on_output: Called with each output line as it is produced
+            timeout: Seconds for the whole pipeline (defaults to self.timeout)
+
+        Returns:
+            ToolResult for the pipeline; output is every stage's output in order
+
+        Raises:
+            KeyError: If name is not a known pipeline
+        """
+        stages = self.pipeline_stages[name]
+        level = int(name[1])
+        timeout = _pick(timeout, self.timeout)
+        start = time.monotonic()
+        outputs: list[str] = []
+        success = True
+
+        def report(i: int, stage: str, status: str) -> None:
+            if on_progress is not None:
+                on_progress(StageProgress(name, stage, i, len(stages), status,
+                                          time.monotonic() - start))
+
+        for i, stage in enumerate(stages, 1):
+            remaining = None if timeout is None else timeout - (time.monotonic() - start)
+            if remaining is not None and remaining <= 0:
+                report(i, stage, "timeout")
+                outputs.append("timeout")
+                success = False
+                break
+
+            report(i, stage, "started")
+            result = await self.make(stage, level, on_output, remaining)
+            outputs.append(result.output)
+            if not result.success:
+                timed_out = timeout is not None and time.monotonic() - start >= timeout
+                report(i, stage, "timeout" if timed_out else "failed")
+                success = False
+                break
+            report(i, stage, "passed")
+
+        output = "\n".join(o for o in outputs if o)
+        return ToolResult(
+            success=success,
+            output=output,
+            level=level,
+            tool=name,
+            tokens_approx=len(output.split())
+        )
+
+    # =========================================================================
+    # LEVEL 0/1: single targets
+    # =========================================================================
+
+    async def l0_test(self, on_output: OutputCallback | None = None) -> ToolResult:
+        """Run tests."""
+        return await self.make("l0-test", 0, on_output)
+
+    async def l1_validate(self, on_output: OutputCallback | None = None) -> ToolResult:
+        """Run tests + check index."""
+        return await self.make("l1-validate", 1, on_output)
+
+    # =========================================================================
+    # LEVEL 2/3: staged pipelines
+    # =========================================================================
+
+    async def l2_pr_open(self, on_progress: ProgressCallback | None = None,
+                         on_output: OutputCallback | None = None) -> ToolResult:
+        """Full PR open checks."""
+        return await self.pipeline("l2-pr-open", on_progress, on_output)
+
+    async def l2_pr_merge(self, on_progress: ProgressCallback | None = None,
+                          on_output: OutputCallback | None = None) -> ToolResult:
+        """PR merge automation."""
+        return await self.pipeline("l2-pr-merge", on_progress, on_output)
+
+    async def l2_release(self, on_progress: ProgressCallback | None = None,
+                         on_output: OutputCallback | None = None) -> ToolResult:
+        """Release workflow."""
+        return await self.pipeline("l2-release", on_progress, on_output)
+
+    async def l3_ci(self, on_progress: ProgressCallback | None = None,
+                    on_output: OutputCallback | None = None) -> ToolResult:
+        """Full CI pipeline."""
+        return await self.pipeline("l3-ci", on_progress, on_output)
+
+    async def l3_cd(self, on_progress: ProgressCallback | None = None,
+                    on_output: OutputCallback | None = None) -> ToolResult:
+        """Full CD pipeline."""
+        return await self.pipeline("l3-cd", on_progress, on_output)
+
+    async def l3_full(self, on_progress: ProgressCallback | None = None,
+                      on_output: OutputCallback | None = None) -> ToolResult:
+        """Full pipeline with release."""
+        return await self.pipeline("l3-full", on_progress, on_output)
+
+
+def _pick(value: float | None, default: float | None) -> float | None:
+    return default if value is None else value
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a process and its process group, then reap it."""
+    if proc.returncode is None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    await proc.wait()
@@ -3,7 +3,8 @@
 schema: N/A (core library)
 depends_on:
   - lib/prompt_adapter.py
-  - lib/frontmatter.py
+  - lib/corpus.py
+  - lib/entity_index.py
 depended_by:
   - agents/vp-product.md
 semver: minor
@@ -12,12 +13,22 @@ semver: minor
 import json
 import os
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+if __package__:
+    from .corpus import EntityCorpus
+    from .entity_index import EntityIndex, get_entity_index
+else:
+    # Running as a script: python3 lib/chain_detector.py "..."
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from lib.corpus import EntityCorpus
+    from lib.entity_index import EntityIndex, get_entity_index
+
 
 class ChainDecision(str, Enum):
     """Decision on how to handle the prompt."""
@@ -56,49 +67,32 @@ CONTINUE_WORK_PATTERNS = [
 # Entity ID patterns
 ENTITY_ID_PATTERN = r'(EPIC|STORY|TASK|SUBTASK|SPRINT)-\d{3,4}'
 
+# Statuses that count as open work
+ACTIVE_STATUSES = ('in_progress', 'pending', 'blocked')
+
 
-def find_active_entities(entities_dir: Path) -> dict[str, list[dict]]:
+def find_active_entities(
+    entities_dir: Path,
+    corpus: Optional[EntityCorpus] = None,
+    index: Optional[EntityIndex] = None,
+) -> dict[str, list[dict]]:
     """Find all in-progress entities grouped by type."""
-    active = {
-        'epic': [],
-        'story': [],
-        'task': [],
-        'subtask': [],
-        'sprint': [],
-    }
+    if index is None:
+        index = get_entity_index(entities_dir, corpus)
+
+    # The index keys absolute paths; report them relative to entities_dir as given
+    base = os.path.abspath(entities_dir)
 
-    if not entities_dir.exists():
-        return active
-
-    for entity_file in entities_dir.rglob('*.md'):
-        try:
-            content = entity_file.read_text()
-            # Extract frontmatter
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    # Simple YAML parsing for status and id
-                    frontmatter = parts[1]
-                    status_match = re.search(r'^status:\s*["\']?(\w+)', frontmatter, re.MULTILINE)
-                    id_match = re.search(r'^id:\s*["\']?([\w-]+)', frontmatter, re.MULTILINE)
-                    type_match = re.search(r'^type:\s*["\']?(\w+)', frontmatter, re.MULTILINE)
-
-                    if status_match and id_match and type_match:
-                        status = status_match.group(1)
-                        entity_id = id_match.group(1)
-                        entity_type = type_match.group(1)
-
-                        if status in ('in_progress', 'pending', 'blocked'):
-                            if entity_type in active:
-                                active[entity_type].append({
-                                    'id': entity_id,
-                                    'status': status,
-                                    'file': str(entity_file),
-                                })
-        except Exception:
-            pass  # Skip files we can't parse
-
-    return active
+    def display(path: str) -> str:
+        return os.path.join(str(entities_dir), os.path.relpath(path, base))
+
+    return {
+        entity_type: [
+            {'id': r.id, 'status': r.status, 'file': display(r.path)}
+            for r in index.find(type=entity_type, status=ACTIVE_STATUSES)
+        ]
+        for entity_type in ('epic', 'story', 'task', 'subtask', 'sprint')
+    }
 
 
 def extract_referenced_entities(text: str) -> list[str]:
@@ -106,19 +100,20 @@ def extract_referenced_entities(text: str) -> list[str]:
     return re.findall(ENTITY_ID_PATTERN, text)
 
 
-def calculate_recency_score(entities_dir: Path) -> float:
+def calculate_recency_score(
+    entities_dir: Path,
+    corpus: Optional[EntityCorpus] = None,
+    index: Optional[EntityIndex] = None,
+) -> float:
     """Calculate how recently work was done (0-1 scale)."""
     now = datetime.now()
-    newest_mtime = None
 
-    if entities_dir.exists():
-        for entity_file in entities_dir.rglob('*.md'):
-            mtime = datetime.fromtimestamp(entity_file.stat().st_mtime)
-            if newest_mtime is None or mtime > newest_mtime:
-                newest_mtime = mtime
-
-    if newest_mtime is None:
+    if index is None:
+        index = get_entity_index(entities_dir, corpus)
+    newest_ns = index.newest_mtime_ns()
+    if not newest_ns:
         return 0.0
+    newest_mtime = datetime.fromtimestamp(newest_ns / 1e9)
 
     age = now - newest_mtime
 
@@ -137,6 +132,7 @@ def detect_chain(
     raw_input: str,
     entities_dir: Path,
     recent_context: Optional[str] = None,
+    corpus: Optional[EntityCorpus] = None,
 ) -> ChainContext:
     """
     Detect whether a prompt extends existing work or starts new.
@@ -145,14 +141,16 @@ def detect_chain(
         raw_input: The developer's raw input
         entities_dir: Path to entities directory
         recent_context: Recent conversation context if available
+        corpus: Shared entity corpus (defaults to the process-wide one)
 
     Returns:
         ChainContext with decision and confidence
     """
     text_lower = raw_input.lower()
 
-    # Find active entities
-    active = find_active_entities(entities_dir)
+    # Find active entities (one refresh of the shared index serves both lookups)
+    index = get_entity_index(entities_dir, corpus)
+    active = find_active_entities(entities_dir, index=index)
 
     # Check for explicit entity references
     referenced = extract_referenced_entities(raw_input)
@@ -162,7 +160,7 @@ def detect_chain(
     continue_score = sum(1 for p in CONTINUE_WORK_PATTERNS if re.search(p, text_lower))
 
     # Calculate recency (work done recently = more likely to continue)
-    recency = calculate_recency_score(entities_dir)
+    recency = calculate_recency_score(entities_dir, index=index)
 
     # Determine decision
     decision: ChainDecision
@@ -268,8 +266,6 @@ def generate_chain_xml(context: ChainContext) -> str:
 
 # CLI interface for testing
 if __name__ == '__main__':
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: python chain_detector.py '<raw prompt>'")
         sys.exit(1)
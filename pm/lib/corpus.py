@@ -0,0 +1,215 @@
+"""Entity corpus - reads and parses each markdown file once per process.
+
+Every consumer that walks the tree for entity files (chain detection,
+architecture scanning, assignment loading, the Merkle index) shares the
+same in-memory objects instead of re-reading and re-parsing the same
+files.
+
+Only the frontmatter and digests are kept per file, so the corpus stays
+small in long-running processes (indexd); bodies are read on demand with
+`Entity.read_body()`. Review files are not loaded through the corpus.
+
+schema: N/A (core library)
+depends_on:
+  - lib/frontmatter.py
+  - lib/merkle.py
+  - lib/parse_cache.py
+depended_by:
+  - lib/chain_detector.py
+  - lib/architecture.py
+  - lib/assignment_algorithm.py
+  - lib/validators.py
+  - .index/generate-merkle.py
+semver: minor
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .frontmatter import parse_frontmatter, get_body
+from .merkle import MAX_HASH_WORKERS, FileDigest, digest_bytes
+from .parse_cache import head_digest
+
+
+@dataclass
+class Entity:
+    """A markdown file read and parsed once; only metadata is kept."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    digest: FileDigest  # SHA256 and line count of the whole file
+    head_sha256: str  # ParseCache key (SHA256 of the frontmatter block)
+    frontmatter: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> tuple[str, int, int]:
+        """Cache key: (path, mtime_ns, size)."""
+        return (str(self.path), self.mtime_ns, self.size)
+
+    def read_body(self) -> str:
+        """Read the markdown body (everything after the frontmatter) from disk.
+
+        Not cached. If the file changed since it was loaded, the current
+        body is returned.
+
+        Raises:
+            FileNotFoundError: If the file no longer exists
+        """
+        return get_body(self.path.read_text(encoding="utf-8", errors="ignore"))
+
+    @property
+    def lines(self) -> int:
+        """Number of lines in the file."""
+        return self.digest.lines
+
+
+class EntityCorpus:
+    """Process-wide cache of parsed entity files.
+
+    Entries are keyed by absolute path and revalidated against the file's
+    (mtime_ns, size) on every lookup, so a stale entry is never served.
+
+    Usage:
+        corpus = get_corpus()
+        for entity in corpus.scan(Path("entities"), "*.md"):
+            print(entity.frontmatter.get("id"))
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[str, Entity] = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, path: Path | str) -> bool:
+        return os.path.abspath(path) in self._entities
+
+    def get(self, path: Path | str) -> Entity:
+        """Return the parsed entity for a path, reading it only if changed.
+
+        Args:
+            path: Path to a markdown file
+
+        Returns:
+            Entity with frontmatter and body parsed
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        path = Path(path)
+        stat = path.stat()
+        return self._get(path, stat.st_mtime_ns, stat.st_size)
+
+    def get_many(
+        self,
+        paths: Iterable[Path | str],
+        max_workers: int | None = None,
+    ) -> dict[Path, Entity]:
+        """Load many files, reading and hashing changed ones in parallel.
+
+        Unchanged entries are served from the cache; the rest are read,
+        parsed and digested on a thread pool.
+
+        Args:
+            paths: Files to load
+            max_workers: Thread pool size
+
+        Returns:
+            Mapping of path -> Entity, in input order
+
+        Raises:
+            OSError: If any file can't be read
+        """
+        paths = [Path(p) for p in paths]
+        if len(paths) <= 1:
+            return {p: self.get(p) for p in paths}
+
+        with ThreadPoolExecutor(max_workers=max_workers or MAX_HASH_WORKERS) as pool:
+            return dict(zip(paths, pool.map(self.get, paths)))
+
+    def scan(
+        self,
+        directory: Path | str,
+        pattern: str = "*.md",
+        recursive: bool = True,
+    ) -> list[Entity]:
+        """Load all files matching a pattern under a directory.
+
+        Files that disappear or can't be read mid-scan are skipped.
+
+        Args:
+            directory: Directory to search
+            pattern: Glob pattern (e.g. "*.md", "TASK-*.md")
+            recursive: Use rglob instead of glob
+
+        Returns:
+            List of entities in glob order
+        """
+        return list(self.iter_scan(directory, pattern, recursive))
+
+    def iter_scan(
+        self,
+        directory: Path | str,
+        pattern: str = "*.md",
+        recursive: bool = True,
+    ) -> Iterator[Entity]:
+        """Lazily yield entities matching a pattern under a directory."""
+        directory = Path(directory)
+        if not directory.exists():
+            return
+
+        paths = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        for path in paths:
+            try:
+                yield self.get(path)
+            except OSError:
+                continue
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Drop one cached entry, or all of them when path is None."""
+        if path is None:
+            self._entities.clear()
+        else:
+            self._entities.pop(os.path.abspath(path), None)
+
+    def _get(self, path: Path, mtime_ns: int, size: int) -> Entity:
+        key = os.path.abspath(path)
+        cached = self._entities.get(key)
+        if cached is not None and cached.mtime_ns == mtime_ns and cached.size == size:
+            return cached
+
+        entity = load_entity(path, mtime_ns, size)
+        self._entities[key] = entity
+        return entity
+
+
+def load_entity(path: Path, mtime_ns: int, size: int) -> Entity:
+    """Read and parse a single file into an Entity (uncached).
+
+    The file is read once; its bytes are dropped after hashing and parsing.
+    """
+    raw = path.read_bytes()
+    return Entity(
+        path=path,
+        mtime_ns=mtime_ns,
+        size=size,
+        digest=digest_bytes(raw),
+        head_sha256=head_digest(raw),
+        frontmatter=parse_frontmatter(raw.decode("utf-8", errors="ignore")),
+    )
+
+
+# Singleton shared by all consumers in the process
+_corpus: EntityCorpus | None = None
+
+
+def get_corpus() -> EntityCorpus:
+    """Get the process-wide EntityCorpus instance."""
+    global _corpus
+    if _corpus is None:
+        _corpus = EntityCorpus()
+    return _corpus
@@ -0,0 +1,421 @@
+"""Dependency graph - cycles, critical path and transitive blockers.
+
+Builds a directed graph from entity `blocks` / `blockedBy` / `dependsOn`
+fields, with an edge A -> B meaning "A must finish before B". Every
+analysis is linear in nodes + edges, so sprint plans with tens of
+thousands of tasks are analysed in one pass:
+
+- cycles: Tarjan's strongly connected components (iterative, no recursion limit)
+- critical path: longest `agentHours`-weighted chain through the DAG of components
+- transitive blockers / dependents: reachability from one entity
+- inconsistencies: `A blocks B` without `B blockedBy A`, and the reverse
+
+Usage:
+    graph = DependencyGraph.from_directory(Path("entities"))
+    graph.cycles()                      # [["TASK-2", "TASK-3"], ...]
+    graph.critical_path()               # (hours, ["TASK-1", "TASK-4", ...])
+    graph.transitive_blockers("TASK-9")
+
+    python3 scripts/dependency-graph.py entities --json
+
+schema: N/A (core library)
+depends_on:
+  - lib/entity_index.py
+  - lib/validators.py
+depended_by:
+  - lib/assignment_algorithm.py
+  - scripts/dependency-graph.py
+semver: minor
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from .corpus import EntityCorpus
+from .entity_index import get_entity_index
+from .validators import EXTERNAL_PREFIXES
+
+
+@dataclass
+class Inconsistency:
+    """One side of a blocks/blockedBy pair that the other side doesn't list."""
+    source: str  # Entity whose field names the other
+    target: str
+    field: str  # "blocks" or "blockedBy"
+    message: str
+
+
+@dataclass
+class GraphReport:
+    """Result of DependencyGraph.analyze()."""
+    nodes: int
+    edges: int
+    cycles: list[list[str]] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)
+    critical_hours: float = 0.0
+    inconsistencies: list[Inconsistency] = field(default_factory=list)
+    unknown: dict[str, list[str]] = field(default_factory=dict)  # id -> unknown refs
+
+    @property
+    def ok(self) -> bool:
+        """No cycles (inconsistencies and unknown refs are warnings)."""
+        return not self.cycles
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class DependencyGraph:
+    """Directed "must finish before" graph over entity IDs.
+
+    Nodes are interned to integers so the algorithms run on flat lists.
+    References to IDs without an entity still become nodes (weight 0),
+    so a missing task in the middle of a chain doesn't hide the chain;
+    `unknown` records them. External refs (npm:, pip:, file paths) are
+    ignored.
+    """
+
+    def __init__(self) -> None:
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self._succ: list[list[int]] = []
+        self._pred: list[list[int]] = []
+        self._edges: set[tuple[int, int]] = set()
+        self.hours: dict[str, float] = {}
+        self.known: set[str] = set()
+        # Declared fields, kept for the consistency check
+        self._blocks: dict[str, list[str]] = {}
+        self._blocked_by: dict[str, list[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_frontmatter(
+        cls,
+        frontmatters: Iterable[dict[str, Any]],
+        depends_on: bool = True,
+    ) -> "DependencyGraph":
+        """Build a graph from parsed frontmatter dicts.
+
+        Args:
+            frontmatters: One dict per entity (entities without an id are skipped)
+            depends_on: Also treat internal `dependsOn` IDs as prerequisites
+        """
+        graph = cls()
+        for fm in frontmatters:
+            graph.add_entity(fm, depends_on)
+        return graph
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path | str,
+        corpus: EntityCorpus | None = None,
+        depends_on: bool = True,
+    ) -> "DependencyGraph":
+        """Build a graph from every entity under a directory."""
+        index = get_entity_index(directory, corpus)
+        return cls.from_frontmatter((r.frontmatter for r in index), depends_on)
+
+    def _node(self, entity_id: str) -> int:
+        node = self._index.get(entity_id)
+        if node is None:
+            node = self._index[entity_id] = len(self._ids)
+            self._ids.append(entity_id)
+            self._succ.append([])
+            self._pred.append([])
+        return node
+
+    def add_entity(self, frontmatter: dict[str, Any], depends_on: bool = True) -> None:
+        """Add one entity's node, weight and edges."""
+        entity_id = frontmatter.get("id")
+        if not isinstance(entity_id, str) or not entity_id:
+            return
+
+        self._node(entity_id)
+        self.known.add(entity_id)
+        self.hours.setdefault(entity_id, _hours(frontmatter.get("agentHours")))
+
+        blocks = _refs(frontmatter.get("blocks"))
+        blocked_by = _refs(frontmatter.get("blockedBy"))
+        self._blocks.setdefault(entity_id, []).extend(blocks)
+        self._blocked_by.setdefault(entity_id, []).extend(blocked_by)
+
+        for target in blocks:
+            self.add_edge(entity_id, target)
+        for source in blocked_by:
+            self.add_edge(source, entity_id)
+        if depends_on:
+            for source in _refs(frontmatter.get("dependsOn")):
+                self.add_edge(source, entity_id)
+
+    def add_edge(self, before: str, after: str) -> None:
+        """Record that `before` must finish before `after` (duplicates ignored)."""
+        edge = (self._node(before), self._node(after))
+        if edge in self._edges:
+            return
+        self._edges.add(edge)
+        self._succ[edge[0]].append(edge[1])
+        self._pred[edge[1]].append(edge[0])
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._index
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def successors(self, entity_id: str) -> list[str]:
+        """IDs directly unblocked by entity_id."""
+        node = self._index.get(entity_id)
+        return [] if node is None else [self._ids[n] for n in self._succ[node]]
+
+    def predecessors(self, entity_id: str) -> list[str]:
+        """IDs directly blocking entity_id."""
+        node = self._index.get(entity_id)
+        return [] if node is None else [self._ids[n] for n in self._pred[node]]
+
+    # ------------------------------------------------------------------
+    # Strongly connected components
+    # ------------------------------------------------------------------
+
+    def _tarjan(self) -> list[list[int]]:
+        """Tarjan's SCC algorithm with an explicit stack.
+
+        Returns components in reverse topological order (sinks first),
+        which is the order Tarjan discovers them in.
+        """
+        n = len(self._ids)
+        succ = self._succ
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+
+        for start in range(n):
+            if index[start] != -1:
+                continue
+            # Work stack of (node, next successor position)
+            work = [(start, 0)]
+            index[start] = low[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack[start] = True
+
+            while work:
+                node, pos = work[-1]
+                edges = succ[node]
+                if pos < len(edges):
+                    work[-1] = (node, pos + 1)
+                    child = edges[pos]
+                    if index[child] == -1:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = True
+                        work.append((child, 0))
+                    elif on_stack[child] and index[child] < low[node]:
+                        low[node] = index[child]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """All components, in topological order (prerequisites first)."""
+        return [sorted(self._ids[n] for n in c) for c in reversed(self._tarjan())]
+
+    def cycles(self) -> list[list[str]]:
+        """Components that form a cycle (size > 1, or a self-dependency)."""
+        found = []
+        for component in reversed(self._tarjan()):
+            if len(component) > 1 or component[0] in self._succ[component[0]]:
+                found.append(sorted(self._ids[n] for n in component))
+        return found
+
+    def topological_order(self) -> list[str]:
+        """IDs with prerequisites before dependents.
+
+        Members of a cycle have no valid order; they are emitted together
+        at the position of their component.
+        """
+        order = []
+        for component in reversed(self._tarjan()):
+            order.extend(sorted(self._ids[n] for n in component))
+        return order
+
+    # ------------------------------------------------------------------
+    # Critical path
+    # ------------------------------------------------------------------
+
+    def critical_path(self) -> tuple[float, list[str]]:
+        """Longest agentHours-weighted chain of dependent entities.
+
+        A cycle is collapsed to one step whose weight is the sum of its
+        members (it can't be scheduled in parallel anyway), so the result
+        is defined even when the plan has cycles.
+
+        Returns:
+            (total hours, IDs along the path in execution order)
+        """
+        components = list(reversed(self._tarjan()))  # topological order
+        if not components:
+            return 0.0, []
+
+        comp_of = [0] * len(self._ids)
+        for c, members in enumerate(components):
+            for node in members:
+                comp_of[node] = c
+
+        weight = [sum(self.hours.get(self._ids[n], 0.0) for n in members)
+                  for members in components]
+        best = weight[:]  # Longest path ending at each component
+        via = [-1] * len(components)
+
+        for c, members in enumerate(components):
+            for node in members:
+                for child in self._succ[node]:
+                    d = comp_of[child]
+                    if d != c and best[c] + weight[d] > best[d]:
+                        best[d] = best[c] + weight[d]
+                        via[d] = c
+
+        end = max(range(len(components)), key=best.__getitem__)
+        chain = []
+        c = end
+        while c != -1:
+            chain.append(c)
+            c = via[c]
+
+        path = []
+        for c in reversed(chain):
+            path.extend(sorted(self._ids[n] for n in components[c]))
+        return best[end], path
+
+    # ------------------------------------------------------------------
+    # Reachability
+    # ------------------------------------------------------------------
+
+    def _reach(self, entity_id: str, edges: list[list[int]]) -> set[str]:
+        start = self._index.get(entity_id)
+        if start is None:
+            return set()
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            for nxt in edges[frontier.pop()]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    frontier.append(nxt)
+        seen.discard(start)
+        return {self._ids[n] for n in seen}
+
+    def transitive_blockers(self, entity_id: str) -> set[str]:
+        """Everything that must finish before entity_id, directly or not."""
+        return self._reach(entity_id, self._pred)
+
+    def transitive_dependents(self, entity_id: str) -> set[str]:
+        """Everything that waits on entity_id, directly or not."""
+        return self._reach(entity_id, self._succ)
+
+    # ------------------------------------------------------------------
+    # Consistency
+    # ------------------------------------------------------------------
+
+    def inconsistencies(self) -> list[Inconsistency]:
+        """blocks/blockedBy pairs declared on only one side.
+
+        Only pairs where both entities exist are reported; references to
+        unknown IDs are listed by unknown_references().
+        """
+        blocks = {k: set(v) for k, v in self._blocks.items()}
+        blocked_by = {k: set(v) for k, v in self._blocked_by.items()}
+        found = []
+
+        for source, targets in self._blocks.items():
+            for target in dict.fromkeys(targets):
+                if target in self.known and source not in blocked_by.get(target, ()):
+                    found.append(Inconsistency(
+                        source, target, "blocks",
+                        f"{source} blocks {target}, but {target} is not blockedBy {source}",
+                    ))
+
+        for target, sources in self._blocked_by.items():
+            for source in dict.fromkeys(sources):
+                if source in self.known and target not in blocks.get(source, ()):
+                    found.append(Inconsistency(
+                        target, source, "blockedBy",
+                        f"{target} is blockedBy {source}, but {source} does not block {target}",
+                    ))
+
+        return found
+
+    def unknown_references(self) -> dict[str, list[str]]:
+        """Referenced IDs that have no entity, keyed by the referencing entity."""
+        unknown: dict[str, list[str]] = {}
+        for node, entity_id in enumerate(self._ids):
+            if entity_id in self.known:
+                continue
+            for other in self._pred[node] + self._succ[node]:
+                unknown.setdefault(self._ids[other], []).append(entity_id)
+        return {k: sorted(set(v)) for k, v in sorted(unknown.items())}
+
+    def analyze(self) -> GraphReport:
+        """Run every check and return one report."""
+        hours, path = self.critical_path()
+        return GraphReport(
+            nodes=len(self),
+            edges=self.edge_count,
+            cycles=self.cycles(),
+            critical_path=path,
+            critical_hours=hours,
+            inconsistencies=self.inconsistencies(),
+            unknown=self.unknown_references(),
+        )
+
+
+def _refs(value: Any) -> list[str]:
+    """Internal entity IDs from a dependency field.
+
+    External refs are dropped: package specs (npm:, pip:) and paths
+    (agents/..., entities/*.schema.md).
+    """
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [
+        v for v in value
+        if isinstance(v, str) and v and v != "null"
+        and not v.startswith(EXTERNAL_PREFIXES) and ":" not in v and "/" not in v
+    ]
+
+
+def _hours(value: Any) -> float:
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
@@ -0,0 +1,151 @@
+"""Domain classifier - maps file paths to ownership domains.
+
+One rule table shared by assignment (`classify_domain`) and review task
+generation (`infer_domain`). Rules are ordered (first match wins) and
+compiled once: a rule that is only an alternation of literal path
+fragments (all the built-in ones) becomes plain substring tests, anything
+else a precompiled regex. Results are memoized per path.
+
+Projects can add rules in `domains.yaml` at the PM root; they are
+checked before the built-in ones:
+
+    default: backend          # optional, domain when nothing matches
+    rules:
+      payments:
+        - "src/payments/"
+        - "src/billing/"
+      auth: ["src/sso/"]
+
+Patterns are regular expressions searched in the lower-cased path.
+
+Usage:
+    get_classifier().classify("src/auth/jwt.ts")   # "auth"
+
+schema: N/A (core library)
+depends_on:
+  - lib/frontmatter.py
+depended_by:
+  - lib/assignment_algorithm.py
+  - lib/review_generator.py
+semver: minor
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from .frontmatter import parse_yaml
+
+
+PM_DIR = Path(__file__).parent.parent
+DEFAULT_RULES_PATH = PM_DIR / "domains.yaml"
+
+# Built-in (pattern, domain) rules, in priority order
+DOMAIN_RULES: list[tuple[str, str]] = [
+    (r"src/auth/|src/middleware/auth", "auth"),
+    (r"src/api/|src/routes/", "api"),
+    (r"src/db/|migrations/|src/repositories/", "data"),
+    (r"app/|src/components/|src/pages/|src/views/", "frontend"),
+    (r"tests/|__tests__/|\.test\.|_test\.", "testing"),
+    (r"\.github/|scripts/|infra/|docker/|k8s/", "infrastructure"),
+    (r"src/utils/|src/lib/|src/shared/", "shared"),  # Conflict zone
+]
+
+DEFAULT_DOMAIN = "backend"
+
+# Distinct paths remembered per classifier
+CACHE_SIZE = 1 << 17
+
+# One alternative of a rule that is a literal fragment (escapes allowed only
+# for punctuation, e.g. "\.test\.")
+LITERAL_RE = re.compile(r"^(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+$")
+
+
+class DomainClassifier:
+    """First-match-wins path classifier over an ordered rule table.
+
+    Args:
+        rules: (pattern, domain) pairs in priority order
+        default: Domain for paths no rule matches
+
+    Raises:
+        re.error: If a pattern is not a valid regular expression
+    """
+
+    def __init__(self, rules: Iterable[tuple[str, str]], default: str = DEFAULT_DOMAIN):
+        self.rules = list(rules)
+        self.default = default
+        # (literal fragments, regex search, domain); exactly one matcher is set
+        self._matchers: list[tuple[tuple[str, ...] | None, Any, str]] = [
+            _compile(pattern) + (domain,) for pattern, domain in self.rules
+        ]
+        self.classify = lru_cache(maxsize=CACHE_SIZE)(self._classify)
+
+    @classmethod
+    def from_yaml(
+        cls,
+        path: Path | str,
+        base: Iterable[tuple[str, str]] = DOMAIN_RULES,
+    ) -> "DomainClassifier":
+        """Classifier with a YAML file's rules ahead of `base`.
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If `rules` is not a mapping of domain -> patterns
+        """
+        config = parse_yaml(Path(path).read_text(encoding="utf-8"))
+        rules = config.get("rules", {})
+        if not isinstance(rules, dict):
+            raise ValueError(f"{path}: 'rules' must map domains to patterns")
+
+        custom: list[tuple[str, str]] = []
+        for domain, patterns in rules.items():
+            if isinstance(patterns, str):
+                patterns = [patterns]
+            if not isinstance(patterns, list):
+                raise ValueError(f"{path}: patterns for {domain!r} must be a list")
+            custom.extend((p, domain) for p in patterns if isinstance(p, str) and p)
+
+        default = config.get("default")
+        return cls(custom + list(base), default if isinstance(default, str) and default
+                   else DEFAULT_DOMAIN)
+
+    def _classify(self, file_path: str) -> str:
+        """Classify a path (memoized through self.classify)."""
+        path = file_path.lower()
+        for literals, search, domain in self._matchers:
+            if literals is not None:
+                for literal in literals:
+                    if literal in path:
+                        return domain
+            elif search(path):
+                return domain
+        return self.default
+
+    def classify_many(self, paths: Iterable[str]) -> dict[str, str]:
+        """Classify several paths at once."""
+        classify = self.classify
+        return {path: classify(path) for path in paths}
+
+
+def _compile(pattern: str) -> tuple[tuple[str, ...] | None, Any]:
+    """Substring fragments for a literal-only alternation, else a regex search."""
+    parts = pattern.split("|")
+    if all(LITERAL_RE.match(part) for part in parts):
+        return tuple(re.sub(r"\\(.)", r"\1", part) for part in parts), None
+    return None, re.compile(pattern).search
+
+
+_classifier: DomainClassifier | None = None
+
+
+def get_classifier() -> DomainClassifier:
+    """Get the process-wide classifier (built-in rules plus domains.yaml)."""
+    global _classifier
+    if _classifier is None:
+        if DEFAULT_RULES_PATH.exists():
+            _classifier = DomainClassifier.from_yaml(DEFAULT_RULES_PATH)
+        else:
+            _classifier = DomainClassifier(DOMAIN_RULES)
+    return _classifier
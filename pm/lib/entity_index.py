@@ -0,0 +1,360 @@
+"""Entity index - in-memory secondary indexes over the entity corpus.
+
+Built once from the corpus and kept current incrementally, so queries like
+"all in-progress tasks under EPIC-001" are dictionary lookups and set
+intersections instead of tree scans. Lookups never rescan: the index is
+updated from known changed paths (indexd passes the Merkle refresh's
+changes to `update_entity_indexes`) or by an explicit `refresh()`.
+
+Usage:
+    index = get_entity_index(Path("entities"))
+    index.find(type="task", status="in_progress", under="EPIC-001")
+    index.blocked_by("TASK-005")
+
+schema: N/A (core library)
+depends_on:
+  - lib/corpus.py
+depended_by:
+  - lib/chain_detector.py
+  - lib/dependency_graph.py
+  - lib/indexd.py
+semver: minor
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .corpus import Entity, EntityCorpus, get_corpus
+
+
+@dataclass
+class EntityRecord:
+    """Indexed view of one entity file."""
+    path: str
+    id: str
+    type: str
+    status: str
+    parent: str
+    owner: str
+    blocks: tuple[str, ...]
+    blocked_by: tuple[str, ...]
+    mtime_ns: int
+    frontmatter: dict[str, Any] = field(repr=False)
+    seq: int = 0  # Insertion order, so results follow scan order
+
+    @classmethod
+    def from_entity(cls, entity: Entity) -> "EntityRecord":
+        fm = entity.frontmatter
+        return cls(
+            path=os.path.abspath(entity.path),
+            id=_text(fm.get("id")),
+            type=_text(fm.get("type")),
+            status=_text(fm.get("status")),
+            parent=_text(fm.get("parent")),
+            owner=_text(fm.get("owner")),
+            blocks=_ids(fm.get("blocks")),
+            blocked_by=_ids(fm.get("blockedBy")),
+            mtime_ns=entity.mtime_ns,
+            frontmatter=fm,
+        )
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) and value != "null" else ""
+
+
+def _ids(value: Any) -> tuple[str, ...]:
+    if isinstance(value, list):
+        return tuple(v for v in value if isinstance(v, str) and v)
+    return (value,) if isinstance(value, str) and value and value != "null" else ()
+
+
+class EntityIndex:
+    """Entities keyed by path, with secondary indexes on common fields.
+
+    Secondary indexes map a field value to the set of paths holding it
+    (paths, not IDs, so duplicate IDs don't corrupt the index). blocks /
+    blockedBy adjacency merges both directions: A lists B in `blocks`, or
+    B lists A in `blockedBy`, both mean A blocks B.
+    """
+
+    FIELDS = ("id", "type", "status", "parent", "owner")
+
+    def __init__(self) -> None:
+        self._records: dict[str, EntityRecord] = {}
+        self._by: dict[str, dict[str, set[str]]] = {f: {} for f in self.FIELDS}
+        # target id -> paths that name it in their blocks / blockedBy lists
+        self._named_in_blocks: dict[str, set[str]] = {}
+        self._named_in_blocked_by: dict[str, set[str]] = {}
+        self._seq = 0
+        # path -> Entity last indexed (entities and non-entities alike)
+        self._indexed: dict[str, Entity] = {}
+
+    # ------------------------------------------------------------------
+    # Building and updating
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        directory: Path | str,
+        corpus: EntityCorpus | None = None,
+        pattern: str = "*.md",
+    ) -> "EntityIndex":
+        """Index every entity under a directory."""
+        index = cls()
+        index.refresh(directory, corpus, pattern)
+        return index
+
+    def refresh(
+        self,
+        directory: Path | str,
+        corpus: EntityCorpus | None = None,
+        pattern: str = "*.md",
+    ) -> list[str]:
+        """Re-sync with a directory, re-indexing only changed files.
+
+        The corpus revalidates each file by (mtime, size) and hands back the
+        same Entity object when unchanged, so unchanged files cost a stat.
+
+        Returns:
+            Paths that were added, changed or removed
+        """
+        if corpus is None:
+            corpus = get_corpus()
+        directory = os.path.abspath(directory)
+
+        seen: set[str] = set()
+        changed: list[str] = []
+        for entity in corpus.iter_scan(directory, pattern):
+            path = os.path.abspath(entity.path)
+            seen.add(path)
+            if self._indexed.get(path) is entity:
+                continue
+            self.add(entity)
+            changed.append(path)
+
+        prefix = directory + os.sep
+        for path in [p for p in self._indexed if p.startswith(prefix) and p not in seen]:
+            self.remove(path)
+            changed.append(path)
+
+        return changed
+
+    def add(self, entity: Entity) -> EntityRecord | None:
+        """Index (or re-index) one entity; files without an id are skipped."""
+        path = os.path.abspath(entity.path)
+        self._indexed[path] = entity
+        previous = self._records.pop(path, None)
+        if previous is not None:
+            self._unlink(previous)
+
+        record = EntityRecord.from_entity(entity)
+        if not record.id:
+            return None
+
+        if previous is not None:
+            record.seq = previous.seq
+        else:
+            self._seq += 1
+            record.seq = self._seq
+
+        self._records[path] = record
+        for name in self.FIELDS:
+            value = getattr(record, name)
+            if value:
+                self._by[name].setdefault(value, set()).add(path)
+        for target in record.blocks:
+            self._named_in_blocks.setdefault(target, set()).add(path)
+        for target in record.blocked_by:
+            self._named_in_blocked_by.setdefault(target, set()).add(path)
+        return record
+
+    def update(self, paths: Iterable[Path | str], corpus: EntityCorpus | None = None) -> None:
+        """Re-index specific files; missing files are removed."""
+        if corpus is None:
+            corpus = get_corpus()
+        for path in paths:
+            try:
+                self.add(corpus.get(path))
+            except OSError:
+                self.remove(path)
+
+    def remove(self, path: Path | str) -> None:
+        """Drop one file from the index."""
+        path = os.path.abspath(path)
+        self._indexed.pop(path, None)
+        record = self._records.pop(path, None)
+        if record is not None:
+            self._unlink(record)
+
+    def _unlink(self, record: EntityRecord) -> None:
+        for name in self.FIELDS:
+            _discard(self._by[name], getattr(record, name), record.path)
+        for target in record.blocks:
+            _discard(self._named_in_blocks, target, record.path)
+        for target in record.blocked_by:
+            _discard(self._named_in_blocked_by, target, record.path)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._by["id"]
+
+    def __iter__(self) -> Iterator[EntityRecord]:
+        return iter(sorted(self._records.values(), key=lambda r: r.seq))
+
+    @property
+    def ids(self) -> set[str]:
+        """All indexed IDs (e.g. for validators.check_dependencies)."""
+        return set(self._by["id"])
+
+    def get(self, entity_id: str) -> EntityRecord | None:
+        """Record for an ID (the first indexed one if the ID is duplicated)."""
+        paths = self._by["id"].get(entity_id)
+        if not paths:
+            return None
+        return min((self._records[p] for p in paths), key=lambda r: r.seq)
+
+    def children(self, entity_id: str) -> list[EntityRecord]:
+        """Direct children (entities whose parent is entity_id)."""
+        return self._ordered(self._by["parent"].get(entity_id, ()))
+
+    def descendants(self, entity_id: str) -> list[EntityRecord]:
+        """All entities below entity_id in the parent hierarchy."""
+        return self._ordered(self._descendant_paths(entity_id))
+
+    def _descendant_paths(self, entity_id: str) -> set[str]:
+        found: set[str] = set()
+        frontier = [entity_id]
+        while frontier:
+            parent = frontier.pop()
+            for path in self._by["parent"].get(parent, ()):
+                if path not in found:
+                    found.add(path)
+                    frontier.append(self._records[path].id)
+        return found
+
+    def find(
+        self,
+        type: str | Iterable[str] | None = None,
+        status: str | Iterable[str] | None = None,
+        parent: str | None = None,
+        owner: str | None = None,
+        under: str | None = None,
+    ) -> list[EntityRecord]:
+        """Entities matching every given filter, in scan order.
+
+        Args:
+            type: Entity type, or several
+            status: Status, or several
+            parent: Direct parent ID
+            owner: Owner
+            under: Ancestor ID anywhere above the entity
+
+        Example:
+            index.find(type="task", status="in_progress", under="EPIC-001")
+        """
+        candidates: list[set[str]] = []
+        for name, value in (("type", type), ("status", status), ("parent", parent), ("owner", owner)):
+            if value is not None:
+                candidates.append(self._lookup(name, value))
+        if under is not None:
+            candidates.append(self._descendant_paths(under))
+
+        if not candidates:
+            return list(self)
+
+        candidates.sort(key=len)
+        paths = candidates[0].intersection(*candidates[1:])
+        return self._ordered(paths)
+
+    def _lookup(self, name: str, value: str | Iterable[str]) -> set[str]:
+        index = self._by[name]
+        if isinstance(value, str):
+            return index.get(value, set())
+        return set().union(*(index.get(v, ()) for v in value))
+
+    def _ordered(self, paths: Iterable[str]) -> list[EntityRecord]:
+        return sorted((self._records[p] for p in paths), key=lambda r: r.seq)
+
+    # ------------------------------------------------------------------
+    # Dependency adjacency
+    # ------------------------------------------------------------------
+
+    def blocks(self, entity_id: str) -> set[str]:
+        """IDs that entity_id blocks (from either side of the relation)."""
+        result: set[str] = set()
+        for path in self._by["id"].get(entity_id, ()):
+            result.update(self._records[path].blocks)
+        for path in self._named_in_blocked_by.get(entity_id, ()):
+            result.add(self._records[path].id)
+        return result
+
+    def blocked_by(self, entity_id: str) -> set[str]:
+        """IDs (or external refs like npm:...) that block entity_id."""
+        result: set[str] = set()
+        for path in self._by["id"].get(entity_id, ()):
+            result.update(self._records[path].blocked_by)
+        for path in self._named_in_blocks.get(entity_id, ()):
+            result.add(self._records[path].id)
+        return result
+
+    def newest_mtime_ns(self) -> int:
+        """Most recent modification time across scanned files (0 if none)."""
+        return max((e.mtime_ns for e in self._indexed.values()), default=0)
+
+
+def _discard(index: dict[str, set[str]], key: str, path: str) -> None:
+    paths = index.get(key)
+    if paths is None:
+        return
+    paths.discard(path)
+    if not paths:
+        del index[key]
+
+
+# One index per scanned directory, shared by all consumers in the process
+_indexes: dict[str, EntityIndex] = {}
+
+
+def get_entity_index(
+    directory: Path | str,
+    corpus: EntityCorpus | None = None,
+    refresh: bool = False,
+) -> EntityIndex:
+    """Get the process-wide EntityIndex for a directory.
+
+    The first call builds it with one scan. Later calls return it as is,
+    without touching the tree; it is kept current by
+    update_entity_indexes, or rescanned when `refresh` is set.
+    """
+    key = os.path.abspath(directory)
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = EntityIndex()
+    elif not refresh:
+        return index
+    index.refresh(key, corpus)
+    return index
+
+
+def update_entity_indexes(
+    paths: Iterable[Path | str],
+    corpus: EntityCorpus | None = None,
+) -> None:
+    """Apply changed paths (modified, added or removed) to every shared index.
+
+    Only *.md paths under an index's directory are applied to it.
+    """
+    changed = [os.path.abspath(p) for p in paths if str(p).endswith(".md")]
+    for directory, index in _indexes.items():
+        prefix = directory + os.sep
+        index.update([p for p in changed if p.startswith(prefix)], corpus)
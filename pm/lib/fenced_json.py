@@ -0,0 +1,214 @@
+"""Fenced JSON blocks in markdown - linear scanning and streaming decode.
+
+Reviews carry their structured findings in a ```json fenced block that
+can sit after megabytes of prose. `iter_fenced_blocks` finds blocks with
+`str.find` (one left-to-right pass, no regex backtracking), blocks that
+can't contain the wanted key are skipped without being decoded, and
+decoding uses orjson when it is installed.
+
+`iter_array_items` reads a file in chunks and yields the elements of a
+top-level array (e.g. "findings") one at a time, so memory is bounded by
+one element plus one chunk rather than by the document.
+
+Usage:
+    data = find_json_block(body, "findings")
+
+    with open(path, encoding="utf-8") as f:
+        for finding in iter_array_items(f, "findings"):
+            ...
+
+schema: N/A (core library)
+depends_on: []
+depended_by:
+  - lib/review_generator.py
+semver: minor
+"""
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+
+# Characters read per refill when streaming
+CHUNK_SIZE = 1 << 16
+
+WS_RE = re.compile(r"[ \t\n\r]*")
+
+_decoder = json.JSONDecoder()
+
+
+def loads(text: str) -> Any:
+    """Decode JSON with orjson if available, else the standard library.
+
+    Raises:
+        ValueError: If text is not valid JSON
+    """
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def iter_fenced_blocks(text: str, lang: str = "json") -> Iterator[str]:
+    """Contents of each ```lang fenced block, in order.
+
+    A block opens with "```lang" plus a newline and closes at the next
+    newline followed by "```".
+    """
+    opening = f"```{lang}\n"
+    pos = 0
+    while True:
+        start = text.find(opening, pos)
+        if start < 0:
+            return
+        start += len(opening)
+        end = text.find("\n```", start)
+        if end < 0:
+            return
+        yield text[start:end]
+        pos = end + 4
+
+
+def find_json_block(text: str, key: str) -> dict[str, Any] | None:
+    """First fenced JSON object with a top-level `key`, decoded."""
+    marker = f'"{key}"'
+    for block in iter_fenced_blocks(text):
+        if marker not in block:
+            continue  # Can't hold the key; don't decode it
+        try:
+            data = loads(block)
+        except ValueError:
+            continue
+        if isinstance(data, dict) and key in data:
+            return data
+    return None
+
+
+class _Reader:
+    """Sliding text buffer over a stream, compacted as it is consumed."""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read one more chunk; False at end of stream."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > self.chunk_size:
+            self.buf, self.pos = self.buf[self.pos:], 0
+        self.buf += chunk
+        return True
+
+    def find(self, needle: str) -> int:
+        """Move just past the next `needle`; -1 if the stream ends first."""
+        while True:
+            i = self.buf.find(needle, self.pos)
+            if i >= 0:
+                self.pos = i + len(needle)
+                return self.pos
+            # Keep a tail that could hold the start of a split needle
+            self.pos = max(self.pos, len(self.buf) - len(needle) + 1)
+            if not self.fill():
+                return -1
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream)."""
+        while True:
+            self.pos = WS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def value(self) -> Any:
+        """Decode one JSON value at the cursor, reading more as needed.
+
+        Raises:
+            ValueError: If the value is malformed (not merely incomplete)
+        """
+        self.peek()  # raw_decode doesn't skip leading whitespace
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                # Once the block's closing fence is buffered more input can't help
+                if self.buf.find("\n```", self.pos) >= 0 or not self.fill():
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array_items(
+    stream: TextIO,
+    key: str,
+    extras: dict[str, Any] | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Stream the elements of `key` from the first fenced JSON block having it.
+
+    Blocks are decoded member by member; only one array element (or one
+    other top-level value) is held at a time. Malformed blocks, and blocks
+    whose top-level object lacks `key`, are skipped; if the array itself
+    turns out malformed, iteration stops after the items already yielded.
+    Items are yielded before the closing fence is seen, so a block left
+    unterminated still yields every item complete at end of stream.
+
+    Args:
+        stream: Text stream positioned anywhere before the block
+        key: Top-level key whose array to stream
+        extras: If given, filled with the block's other top-level members
+            that precede the array
+        chunk_size: Characters read per refill
+    """
+    reader = _Reader(stream, chunk_size)
+    started = False
+    while reader.find("```json\n") >= 0:
+        found: dict[str, Any] = {}
+        try:
+            if reader.peek() != "{":
+                continue
+            reader.pos += 1
+            while reader.peek() == "\"":
+                name = reader.value()
+                if reader.peek() != ":":
+                    break
+                reader.pos += 1
+                if name != key:
+                    value = reader.value()
+                    if extras is not None:
+                        found[name] = value
+                    if reader.peek() == ",":
+                        reader.pos += 1
+                    continue
+
+                if reader.peek() != "[":
+                    break
+                reader.pos += 1
+                if extras is not None:
+                    extras.update(found)
+                if reader.peek() == "]":
+                    return
+                started = True
+                while True:
+                    yield reader.value()
+                    sep = reader.peek()
+                    if sep != ",":
+                        return  # "]" or malformed: the array ends here either way
+                    reader.pos += 1
+        except ValueError:
+            if started:
+                return  # Items were already yielded; don't mix in another block
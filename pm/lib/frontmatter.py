@@ -6,87 +6,420 @@ Shared across:
 - scripts/architecture/generate.py
 """
 
+import os
 import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+
+
+# Bump whenever parse_frontmatter output changes; invalidates ParseCache
+PARSER_VERSION = "2"
+
+# Bytes read per step when scanning a file for its closing fence
+HEADER_CHUNK = 4096
+
+OPEN_FENCE = "---\n"
+CLOSE_FENCE = "\n---"
+
+# One match per header line: (indent, dash, key, value)
+LINE_RE = re.compile(
+    r"^( *)"                                   # indent
+    r"(?:(-)(?: +|$))?"                        # list item marker
+    r"(?:([^\s#:'\"\[{,][^:\n]*?|\"[^\"\n]*\"|'[^'\n]*')"  # key
+    r"[ \t]*:(?:[ \t]+|$))?"                   # key separator
+    r"(.*?)[ \t\r]*$",                         # value
+    re.MULTILINE,
+)
+
+# A complete single- or double-quoted scalar at the start of a value
+QUOTED_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\']|\'\')*\'')
+
+# Items of an inline flow list/map, honouring quotes
+FLOW_ITEM_RE = re.compile(r"(?:\"[^\"]*\"|'[^']*'|[^,\"'])+")
+
+BLOCK_INDICATORS = {"|", "|-", "|+", ">", ">-", ">+"}
+
+
+def read_head(path: Path) -> bytes:
+    """Read a file only up to the end of its frontmatter block.
+
+    Reads in HEADER_CHUNK steps and stops at the closing fence, so the
+    body of a large file is never read.
+
+    Args:
+        path: Path to markdown file
+
+    Returns:
+        Leading bytes including both fences, or b"" if the file doesn't
+        start with frontmatter
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        head = os.read(fd, HEADER_CHUNK)
+        if not head.startswith(b"---"):
+            return b""
+        end = head.find(b"\n---", 3)
+        while end < 0:
+            chunk = os.read(fd, HEADER_CHUNK)
+            if not chunk:
+                return head
+            # Re-scan the seam in case the fence straddles two chunks
+            start = max(len(head) - 3, 3)
+            head += chunk
+            end = head.find(b"\n---", start)
+        return head[:end + 4]
+    finally:
+        os.close(fd)
+
+
+def head_of(raw: bytes) -> bytes:
+    """The leading bytes `read_head` would return for a file with contents `raw`."""
+    if not raw.startswith(b"---"):
+        return b""
+    end = raw.find(b"\n---", 3)
+    return raw if end < 0 else raw[:end + 4]
+
+
+def split_frontmatter(content: str) -> tuple[str | None, int]:
+    """Locate the frontmatter block.
+
+    Returns:
+        (header text between the fences or None, offset where the body starts)
+    """
+    if not content.startswith(OPEN_FENCE):
+        return None, 0
+    end = content.find(CLOSE_FENCE, 3)
+    if end < 0:
+        return None, 0
+    body_start = end + 4
+    if content.startswith("\n", body_start):
+        body_start += 1
+    return content[4:end], body_start
 
 
 def parse_frontmatter(content: str) -> dict[str, Any]:
     """Extract YAML frontmatter from markdown content.
 
+    Supports the YAML subset used by entity and agent files: scalars
+    (always returned as strings), nested maps, block lists at any indent
+    (including lists of maps), inline `[a, b]` / `{a: b}` collections and
+    `|` / `>` multi-line scalars. A key with no value and no children is
+    an empty list.
+
     Args:
-        content: Full markdown file content
+        content: Markdown content (the whole file, or just its head)
 
     Returns:
         Dict of frontmatter fields, empty if no frontmatter
-
-    Raises:
-        ValueError: If frontmatter is malformed
     """
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    header, _ = split_frontmatter(content)
+    if not header:
         return {}
+    result = _parse_flat(header)
+    return result if result is not None else _Parser(header).parse()
+
 
-    frontmatter = {}
-    current_key = None
-    current_list = None
+def parse_yaml(text: str) -> dict[str, Any]:
+    """Parse a standalone YAML document (e.g. a config file).
+
+    Same subset and conventions as parse_frontmatter, without the
+    `---` fences.
+    """
+    return _Parser(text.replace("\r\n", "\n").strip("\n")).parse()
 
-    for line in match.group(1).split("\n"):
-        line = line.rstrip()
 
-        # Skip empty lines
+def _parse_flat(header: str) -> dict[str, Any] | None:
+    """Single-pass fast path for flat headers (top-level keys and scalar lists).
+
+    Returns None as soon as it meets anything else (nested maps, lists of
+    maps, block scalars, quoted keys) so the caller can use the full parser.
+    The common cases are handled inline; this loop is the hot path when
+    scanning large corpora.
+    """
+    result: dict[str, Any] = {}
+    current: list[Any] | None = None
+    item_indent = -1
+
+    for line in header.split("\n"):
         if not line:
             continue
+        first = line[0]
 
-        # List item
-        if line.startswith("  - "):
-            if current_list is not None:
-                current_list.append(line[4:].strip().strip('"').strip("'"))
-            continue
+        if first == " " or first == "-":
+            item = line.lstrip(" ") if first == " " else line
+            if not item or item[0] == "#" or item == "\r":
+                continue
+            if item[0] != "-" or current is None:
+                return None
+            if len(line) - len(item) != item_indent:
+                if current:
+                    return None  # Items at mixed indents
+                item_indent = len(line) - len(item)
+            value = item[1:].strip()
+            if not value:
+                current.append("")
+                continue
+            if item[1] != " " or value[0] == "-" or ": " in value or value[-1] == ":":
+                return None  # Nested list or list of maps
+        else:
+            if first == "#":
+                continue
+            if first == '"' or first == "'":
+                return None
+            key, sep, value = line.partition(":")
+            if not sep:
+                return None
+            if value:
+                if value[0] not in " \t\r":
+                    return None
+                value = value.strip()
+            if not value:
+                current = result[key.rstrip()] = []
+                continue
+            current = None
 
-        # New key
-        if ":" in line:
-            # Save previous list if any
-            if current_key and current_list is not None:
-                frontmatter[current_key] = current_list
-                current_list = None
-
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Check if starting a list
-            if value == "" or value == "[]":
-                current_key = key
-                current_list = []
+        first = value[0]
+        if first == '"':
+            value = value[1:-1] if value[-1] == '"' and value.count('"') == 2 else _quoted(value)
+        elif first in "'[{":
+            value = SCALAR_HANDLERS[first](value)
+        elif first in "|>" and value in BLOCK_INDICATORS:
+            return None
+        elif " #" in value:
+            value = _plain(value)
+
+        if current is None:
+            result[key.rstrip()] = value
+        else:
+            current.append(value)
+
+    return result
+
+
+class _Parser:
+    """Indentation-driven parser over pre-tokenized header lines."""
+
+    def __init__(self, header: str):
+        self.lines = header.split("\n")
+        # (indent, is_item, key, value); None for blank and comment lines
+        self.tokens: list[tuple[int, bool, str, str] | None] = []
+        append = self.tokens.append
+        for indent, dash, key, value in LINE_RE.findall(header):
+            if key or dash:
+                append((len(indent), bool(dash), key, value))
+            elif value and value[0] != "#":
+                append((len(indent), False, "", value))
             else:
-                # Scalar value
-                value = value.strip('"').strip("'")
-                frontmatter[key] = value
-                current_key = key
+                append(None)
+        self.pos = 0
+
+    def parse(self) -> dict[str, Any]:
+        result = self._mapping(0)
+        return result if isinstance(result, dict) else {}
+
+    def _peek(self) -> tuple[int, bool, str, str] | None:
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            token = tokens[self.pos]
+            if token is not None:
+                return token
+            self.pos += 1
+        return None
+
+    def _mapping(self, indent: int) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        while (token := self._peek()) is not None:
+            tok_indent, is_item, key, value = token
+            if tok_indent < indent:
+                break
+            self.pos += 1
+            if is_item or not key or tok_indent > indent:
+                continue  # Stray line - skip rather than guess
+            result[_unquote(key)] = self._value(tok_indent, value)
+        return result
+
+    def _sequence(self, indent: int) -> list[Any]:
+        result: list[Any] = []
+        while (token := self._peek()) is not None:
+            tok_indent, is_item, key, value = token
+            if tok_indent != indent or not is_item:
+                if tok_indent > indent:
+                    self.pos += 1
+                    continue
+                break
+
+            if key:
+                # "- key: value" starts a map; its keys align after the dash
+                line = self.lines[self.pos]
+                rest = line[indent + 1:]
+                column = indent + 1 + len(rest) - len(rest.lstrip(" "))
+                self.tokens[self.pos] = (column, False, key, value)
+                result.append(self._mapping(column))
+            else:
+                self.pos += 1
+                result.append(self._value(indent, value) if value else "")
+        return result
+
+    def _value(self, indent: int, value: str) -> Any:
+        if value in BLOCK_INDICATORS:
+            return self._block_scalar(indent, value)
+        if value:
+            return _scalar(value)
+
+        # Empty value: nested block, or an empty list
+        token = self._peek()
+        if token is not None:
+            tok_indent, is_item, _, _ = token
+            if is_item and tok_indent >= indent:
+                return self._sequence(tok_indent)
+            if tok_indent > indent:
+                return self._mapping(tok_indent)
+        return []
+
+    def _block_scalar(self, indent: int, indicator: str) -> str:
+        """Collect a literal (|) or folded (>) block scalar."""
+        lines = self.lines
+        collected: list[str] = []
+        block_indent = None
+        while self.pos < len(lines):
+            line = lines[self.pos].rstrip("\r")
+            stripped = line.lstrip(" ")
+            if stripped:
+                line_indent = len(line) - len(stripped)
+                if line_indent <= indent:
+                    break
+                if block_indent is None:
+                    block_indent = line_indent
+                collected.append(line[min(block_indent, line_indent):])
+            else:
+                collected.append("")
+            self.pos += 1
+
+        # Trailing blank lines belong to chomping, not content
+        content = collected
+        trailing = 0
+        while content and not content[-1]:
+            content = content[:-1]
+            trailing += 1
+
+        if indicator[0] == "|":
+            text = "\n".join(content)
+        else:
+            text = _fold(content)
+
+        chomp = indicator[1:]
+        if chomp == "-" or not text:
+            return text
+        if chomp == "+":
+            return text + "\n" * (trailing + 1)
+        return text + "\n"
+
+
+def _fold(lines: list[str]) -> str:
+    """Join folded-scalar lines: single breaks become spaces, blank lines newlines."""
+    out: list[str] = []
+    for line in lines:
+        if not line:
+            out.append("\n")
+        elif out and out[-1] != "\n":
+            out.append(" " + line)
+        else:
+            out.append(line)
+    return "".join(out)
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        inner = value[1:-1]
+        return inner.replace("''", "'") if value[0] == "'" else inner.replace('\\"', '"')
+    return value
+
+
+def _flow_items(inner: str) -> list[str]:
+    items = [item.strip() for item in inner.split(",")]
+    if "'" in inner or '"' in inner:
+        if any(item.count('"') % 2 or item.count("'") % 2 for item in items):
+            # A quoted item contains a comma (or escaped quote) - split properly
+            items = [item.strip() for item in FLOW_ITEM_RE.findall(inner)]
+        return [_unquote(item) for item in items if item]
+    return [item for item in items if item]
+
+
+def _flow_list(value: str) -> list[str]:
+    return _flow_items(value[1:-1])
+
+
+def _flow_map(value: str) -> dict[str, str]:
+    result = {}
+    for item in _flow_items(value[1:-1]):
+        key, _, val = item.partition(":")
+        result[_unquote(key.strip())] = _unquote(val.strip())
+    return result
 
-    # Save final list if any
-    if current_key and current_list is not None:
-        frontmatter[current_key] = current_list
 
-    return frontmatter
+def _plain(value: str) -> str:
+    # " #" starts a trailing comment in plain (unquoted) scalars
+    comment = value.find(" #")
+    return value[:comment].rstrip() if comment >= 0 else value
 
 
-def parse_file(path: Path) -> dict[str, Any]:
+def _quoted(value: str) -> str:
+    # A quoted scalar may be followed by a trailing comment
+    match = QUOTED_RE.match(value)
+    if match is None:
+        return value
+    rest = value[match.end():].lstrip()
+    return _unquote(match.group(0)) if not rest or rest[0] == "#" else value
+
+
+def _flow(value: str) -> Any:
+    # [a, b] or {a: b}, optionally followed by a trailing comment
+    value = _plain(value)
+    if value[0] == "[" and value.endswith("]"):
+        return _flow_list(value)
+    if value[0] == "{" and value.endswith("}"):
+        return _flow_map(value)
+    return value
+
+
+# Scalar handlers keyed by first character; plain text is the default
+SCALAR_HANDLERS: dict[str, Callable[[str], Any]] = {
+    "[": _flow,
+    "{": _flow,
+    '"': _quoted,
+    "'": _quoted,
+}
+
+
+def _scalar(value: str) -> Any:
+    handler = SCALAR_HANDLERS.get(value[0])
+    return handler(value) if handler else _plain(value)
+
+
+def parse_file(path: Path, cache: "ParseCache | None" = None) -> dict[str, Any]:
     """Parse frontmatter from a file path.
 
+    Only the frontmatter block is read from disk (see read_head).
+
     Args:
         path: Path to markdown file
+        cache: Optional persistent ParseCache to skip parsing unchanged files
 
     Returns:
         Dict of frontmatter fields
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If frontmatter is malformed
     """
-    content = path.read_text(encoding="utf-8", errors="ignore")
-    return parse_frontmatter(content)
+    if cache is not None:
+        return cache.parse_file(path)
+    return parse_frontmatter(read_head(path).decode("utf-8", errors="ignore"))
 
 
 def extract_dependencies(frontmatter: dict[str, Any]) -> dict[str, list[str]]:
@@ -112,7 +445,5 @@ def get_body(content: str) -> str:
     Returns:
         Body content without frontmatter
     """
-    match = re.match(r"^---\n.*?\n---\n?", content, re.DOTALL)
-    if match:
-        return content[match.end():]
-    return content
+    header, body_start = split_frontmatter(content)
+    return content if header is None else content[body_start:]
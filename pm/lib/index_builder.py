@@ -0,0 +1,438 @@
+"""Merkle index builder for the PM system.
+
+Builds and incrementally updates `.index/merkle-tree.json`. Shared by the
+`generate-merkle.py` CLI and the long-running index daemon.
+
+schema: N/A (core library)
+depends_on:
+  - lib/corpus.py
+  - lib/merkle.py
+  - lib/parse_cache.py
+depended_by:
+  - .index/generate-merkle.py
+  - lib/indexd.py
+semver: minor
+"""
+
+import json
+import stat
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .corpus import EntityCorpus, get_corpus
+from .merkle import (
+    FileDigest,
+    StatCache,
+    build_directories,
+    detect_changes,
+    digest_files,
+    is_index_path,
+    iter_index_files,
+    root_hash,
+    update_directories,
+)
+from .parse_cache import ParseCache
+
+
+INDEX_DIR_NAME = ".index"
+INDEX_FILE_NAME = "merkle-tree.json"
+SUMMARY_FILE_NAME = "AGENT-INDEX.md"
+
+
+def classify_file(rel_path: str, frontmatter: dict) -> tuple[str, str]:
+    """Classify file type and purpose."""
+    if rel_path.startswith("entities/examples/"):
+        entity_type = frontmatter.get("type", "unknown")
+        entity_id = frontmatter.get("id", "unknown")
+        return "entity", f"entity:{entity_type}:{entity_id}"
+    elif rel_path.startswith("entities/") and rel_path.endswith(".schema.md"):
+        name = Path(rel_path).stem.replace(".schema", "")
+        return "schema", f"schema:{name}"
+    elif rel_path.startswith("agents/"):
+        name = frontmatter.get("name", "unknown")
+        model = frontmatter.get("model", "unknown")
+        return "agent", f"agent:{name}:{model}"
+    elif rel_path.startswith("tests/"):
+        name = Path(rel_path).stem
+        return "test", f"test:{name}"
+    elif rel_path.endswith(".sh"):
+        name = Path(rel_path).stem
+        return "script", f"script:{name}"
+    else:
+        name = Path(rel_path).stem
+        return "doc", f"doc:{name}"
+
+
+# Bump when the index layout or hashing scheme changes; older indexes are
+# rebuilt in full instead of updated incrementally
+INDEX_VERSION = "2.0.0"
+
+
+def index_entry(
+    rel_path: str,
+    digest: FileDigest,
+    frontmatter: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the index entry for one file from its digest and frontmatter."""
+    file_type, purpose = classify_file(rel_path, frontmatter or {})
+    entry = {
+        "hash": digest.sha256,
+        "lines": digest.lines,
+        "type": file_type,
+        "purpose": purpose,
+    }
+
+    # Add frontmatter fields for entities
+    if frontmatter and file_type in ("entity", "agent"):
+        for key in ("id", "version", "status", "name", "model"):
+            if key in frontmatter:
+                entry[key] = frontmatter[key]
+
+    return entry
+
+
+def index_files(
+    root: Path,
+    rel_paths: list[str],
+    corpus: EntityCorpus,
+) -> dict[str, tuple[dict[str, Any], tuple[str, dict[str, Any]] | None]]:
+    """Index many files in parallel, reading each file exactly once.
+
+    Markdown goes through the shared corpus (one read yields hash, line
+    count and frontmatter); everything else is streamed by the hashing
+    engine.
+
+    Returns:
+        Mapping of rel_path -> (entry, parsed), where parsed is the
+        (parse-cache key, frontmatter) pair for markdown and None otherwise
+    """
+    md_paths = [root / p for p in rel_paths if p.endswith(".md")]
+    other_paths = [root / p for p in rel_paths if not p.endswith(".md")]
+
+    entities = corpus.get_many(md_paths)
+    digests = digest_files(other_paths)
+
+    results = {}
+    for rel_path in rel_paths:
+        path = root / rel_path
+        if path in entities:
+            entity = entities[path]
+            results[rel_path] = (
+                index_entry(rel_path, entity.digest, entity.frontmatter),
+                (entity.head_sha256, entity.frontmatter),
+            )
+        else:
+            results[rel_path] = (index_entry(rel_path, digests[path], None), None)
+    return results
+
+
+def build_index(
+    root: Path,
+    corpus: EntityCorpus | None = None,
+    parse_cache: ParseCache | None = None,
+    stat_cache: StatCache | None = None,
+) -> dict:
+    """Build the complete Merkle tree index.
+
+    When a ParseCache is given, it is warmed with the frontmatter of every
+    indexed markdown file, keyed by the hash computed here. When a StatCache
+    is given, it is refreshed with each file's stat tuple and hash so
+    check-changes.py can skip re-hashing unchanged files.
+    """
+    if corpus is None:
+        corpus = get_corpus()
+    stats = dict(iter_index_files(root))
+
+    if stat_cache is not None:
+        stat_cache.entries.clear()
+
+    # Index all files
+    files = {}
+    parsed = []
+    for rel_path, (entry, item) in index_files(root, list(stats), corpus).items():
+        files[rel_path] = entry
+        if item is not None:
+            parsed.append(item)
+        if stat_cache is not None:
+            stat_cache.record(rel_path, stats[rel_path], entry["hash"])
+
+    if parse_cache is not None:
+        parse_cache.put_many(parsed)
+
+    # Bottom-up directory hashes; root covers the whole tree
+    directories = build_directories(files)
+
+    return {
+        "version": INDEX_VERSION,
+        "generated": datetime.now().isoformat(),
+        "root": root_hash(directories),
+        "files": dict(sorted(files.items())),
+        "directories": directories,
+        "semanticIndex": build_semantic_index(),
+    }
+
+
+def update_index(
+    root: Path,
+    index: dict,
+    changed_paths: list[str],
+    corpus: EntityCorpus | None = None,
+    parse_cache: ParseCache | None = None,
+    stat_cache: StatCache | None = None,
+) -> dict:
+    """Update an existing index from a list of changed paths.
+
+    Only the listed files are re-read; only their ancestor directories are
+    re-hashed. Paths that no longer exist (or are no longer regular files)
+    are removed from the index; paths the index doesn't track (excluded
+    directories, non-matching names) are ignored. An index written by
+    another INDEX_VERSION can't be patched and is rebuilt in full.
+
+    Args:
+        root: PM root directory
+        index: Previously generated index
+        changed_paths: Paths relative to root that were modified, added or removed
+
+    Returns:
+        Updated index
+    """
+    if index.get("version") != INDEX_VERSION:
+        return build_index(root, corpus, parse_cache, stat_cache)
+    if corpus is None:
+        corpus = get_corpus()
+    files = dict(index["files"])
+    stats = {}
+
+    # Explicit paths may name anything; keep only what a full build would index
+    changed_paths = [p for p in changed_paths if is_index_path(p)]
+    for rel_path in changed_paths:
+        try:
+            st = (root / rel_path).stat()
+        except OSError:
+            st = None
+        if st is not None and stat.S_ISREG(st.st_mode):
+            stats[rel_path] = st
+            continue
+        files.pop(rel_path, None)
+        if stat_cache is not None:
+            stat_cache.entries.pop(rel_path, None)
+
+    parsed = []
+    for rel_path, (entry, item) in index_files(root, list(stats), corpus).items():
+        files[rel_path] = entry
+        if item is not None:
+            parsed.append(item)
+        if stat_cache is not None:
+            stat_cache.record(rel_path, stats[rel_path], entry["hash"])
+
+    if parse_cache is not None:
+        parse_cache.put_many(parsed)
+
+    directories = update_directories(files, index["directories"], changed_paths)
+
+    return {
+        **index,
+        "generated": datetime.now().isoformat(),
+        "root": root_hash(directories),
+        "files": dict(sorted(files.items())),
+        "directories": directories,
+    }
+
+
+def build_semantic_index() -> dict:
+    """Static semantic index describing the PM system layout."""
+    return {
+        "entryPoints": ["ENTRYPOINT.md", "README.md"],
+        "agents": {
+            "vp-product": {"model": "opus", "owns": ["epics"], "file": "agents/vp-product.md"},
+            "sdm": {"model": "sonnet", "owns": ["stories", "tasks"], "file": "agents/sdm.md"},
+            "staff-engineer": {"model": "sonnet", "owns": ["tasks", "subtasks"], "file": "agents/staff-engineer.md"},
+            "sprint-master": {"model": "haiku", "owns": ["ceremonies"], "file": "agents/sprint-master.md"},
+        },
+        "entityHierarchy": ["epic", "story", "task", "subtask"],
+        "schemas": {
+            "epic": "entities/epic.schema.md",
+            "story": "entities/story.schema.md",
+            "task": "entities/task.schema.md",
+            "subtask": "entities/subtask.schema.md",
+        },
+        "claudeCodeAlignment": {
+            "taskFields": ["subject", "activeForm", "status", "blockedBy", "blocks"],
+            "tools": ["TaskCreate", "TaskUpdate", "TaskGet", "TaskList"],
+        },
+        "tests": {
+            "runner": "tests/run-tests.sh",
+            "validator": "tests/validate-entity.sh",
+            "alignment": "tests/claude-code-alignment.md",
+        },
+    }
+
+
+def load_index(path: Path) -> dict | None:
+    """Load an existing index if it can be updated incrementally."""
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def build_agent_summary() -> str:
+    """Build a compact summary for agents to quickly understand the system."""
+    return """# PM System Index (Pre-computed)
+
+## Quick Reference
+
+```
+pm/
+├── ENTRYPOINT.md          # Start here - agent team launch guide
+├── README.md              # System overview
+├── agents/                # Agent definitions
+│   ├── vp-product.md      # Opus - owns Epics
+│   ├── sdm.md             # Sonnet - owns Stories/Tasks
+│   ├── staff-engineer.md  # Sonnet - owns Tasks/Subtasks
+│   └── sprint-master.md   # Haiku - ceremonies
+├── entities/              # Work item schemas
+│   ├── epic.schema.md     # Strategic initiatives
+│   ├── story.schema.md    # User features
+│   ├── task.schema.md     # Implementation units (Claude Code aligned)
+│   ├── subtask.schema.md  # Atomic work
+│   └── examples/          # Live entity instances
+└── tests/                 # Integration tests
+    └── run-tests.sh       # Validates all entities
+```
+
+## Entity → Claude Code Mapping
+
+| Entity Field | TaskCreate | TaskUpdate |
+|--------------|------------|------------|
+| subject | subject | subject |
+| description | description | description |
+| activeForm | activeForm | activeForm |
+| status | - | status |
+| blockedBy | - | addBlockedBy |
+| blocks | - | addBlocks |
+
+## Frontmatter Template (Task)
+
+```yaml
+---
+id: "TASK-XXX"
+version: "1.0.0"
+type: task
+status: pending
+parent: "STORY-XXX"
+dependsOn: []
+blockedBy: []
+blocks: []
+owner: null
+size: M
+agentHours: 3
+subject: "Implement feature X"
+activeForm: "Implementing feature X"
+---
+```
+
+## Version Bumps
+
+- PATCH (+0.0.1): status change, typo fix
+- MINOR (+0.1.0): completion, new dependency
+- MAJOR (+1.0.0): scope change, breaking AC
+
+## Workflow
+
+1. VP Product creates Epic → `entities/examples/EPIC-XXX.md`
+2. SDM breaks into Stories → creates Task entities
+3. Staff Engineer: `TaskCreate(subject, description, activeForm)`
+4. Work → `TaskUpdate(status="in_progress")`
+5. Done → `TaskUpdate(status="completed")` + entity version bump
+"""
+
+
+def write_agent_summary(root: Path) -> Path:
+    """Write AGENT-INDEX.md next to the index and return its path."""
+    output = root / INDEX_DIR_NAME / SUMMARY_FILE_NAME
+    output.write_text(build_agent_summary())
+    return output
+
+
+@dataclass
+class RefreshResult:
+    """Outcome of refresh_index."""
+
+    index: dict
+    mode: str  # "full" or "incremental"
+    changed: list[str]
+
+    def summary(self) -> str:
+        """One-line status, e.g. for tool output."""
+        root = self.index["root"][:16]
+        if self.mode == "full":
+            return f"✓ Index rebuilt ({len(self.index['files'])} files, root: {root}...)"
+        if self.changed:
+            return f"✓ Index updated ({len(self.changed)} changed, root: {root}...)"
+        return f"✅ Index is current (root: {root}...)"
+
+
+def refresh_index(
+    root: Path,
+    paths: list[str] | None = None,
+    full: bool = False,
+    corpus: EntityCorpus | None = None,
+    parse_cache: ParseCache | None = None,
+    write: bool = True,
+    previous: dict | None = None,
+) -> RefreshResult:
+    """Bring merkle-tree.json up to date, incrementally when possible.
+
+    Args:
+        root: PM root directory
+        paths: Known changed paths (relative to root); detected when omitted
+        full: Force a full rebuild
+        corpus: Shared entity corpus
+        parse_cache: Persistent parse cache to warm
+        write: Write merkle-tree.json if anything changed (the machine-local
+            stat cache is saved either way, so re-hashed files stay cached)
+        previous: Index already held in memory (skips re-reading the JSON)
+
+    Returns:
+        RefreshResult with the new index and what changed
+    """
+    index_dir = root / INDEX_DIR_NAME
+    index_dir.mkdir(exist_ok=True)
+    output_json = index_dir / INDEX_FILE_NAME
+
+    stat_cache = StatCache.load(index_dir)
+    cached_stats = dict(stat_cache.entries)
+    if full:
+        previous = None
+    elif previous is None or previous.get("version") != INDEX_VERSION:
+        previous = load_index(output_json)
+
+    if previous is None:
+        index = build_index(root, corpus, parse_cache, stat_cache)
+        result = RefreshResult(index=index, mode="full", changed=sorted(index["files"]))
+    else:
+        if paths is None:
+            changes = detect_changes(root, previous["files"], stat_cache)
+            paths = changes.changed + changes.added + changes.removed
+        paths = [p for p in paths if is_index_path(p)]
+        index = update_index(root, previous, paths, corpus, parse_cache, stat_cache)
+        old_files = previous["files"]
+        changed = [p for p in paths if index["files"].get(p) != old_files.get(p)]
+        if not changed:
+            index = previous  # Keep the old "generated" stamp; nothing to write
+        result = RefreshResult(index=index, mode="incremental", changed=changed)
+
+    if stat_cache.entries != cached_stats:
+        stat_cache.save()
+    if write:
+        # merkle-tree.json is tracked; rewriting it unchanged would dirty the tree
+        if index is not previous:
+            output_json.write_text(json.dumps(index, indent=2))
+
+    return result
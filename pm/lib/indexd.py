@@ -0,0 +1,305 @@
+"""Index daemon - keeps the Merkle index, entity corpus and architecture hot.
+
+A long-running process that watches the PM tree and answers L0/L1 queries
+over a Unix socket, so tools don't pay for a fresh interpreter, a full
+rescan and a re-import of `lib` on every call.
+
+Protocol: one JSON object per line in each direction.
+    -> {"cmd": "hash", "file": "entities/examples/TASK-004.md"}
+    <- {"ok": true, "output": "a1b2c3d4e5f6a7b8"}
+
+Usage:
+    python3 -m lib.indexd                  # run the daemon (make indexd)
+    python3 -m lib.indexd query root       # query a running daemon
+
+schema: N/A (core library)
+depends_on:
+  - lib/index_builder.py
+  - lib/merkle.py
+  - lib/corpus.py
+  - lib/entity_index.py
+  - lib/architecture.py
+  - lib/validators.py
+depended_by:
+  - lib/tools.py
+  - Makefile (indexd)
+semver: minor
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from .architecture import scan_architecture
+from .corpus import EntityCorpus, get_corpus
+from .entity_index import update_entity_indexes
+from .index_builder import RefreshResult, refresh_index
+from .merkle import iter_index_files, stat_key
+from .validators import ValidationError, validate_entity
+
+
+PM_DIR = Path(__file__).parent.parent
+DEFAULT_SOCKET = PM_DIR / ".index" / "indexd.sock"
+
+# Seconds between filesystem polls
+DEFAULT_INTERVAL = 1.0
+
+
+class PollingWatcher:
+    """Detects file changes by comparing stat tuples between polls.
+
+    Stdlib-only and portable; a poll over 10k files is a single scandir
+    walk with no file reads.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> dict[str, tuple[int, int, int]]:
+        return {rel: stat_key(st) for rel, st in iter_index_files(self.root)}
+
+    def poll(self) -> list[str]:
+        """Return paths modified, added or removed since the last poll."""
+        current = self._take_snapshot()
+        previous = self._snapshot
+        self._snapshot = current
+
+        changed = [p for p, key in current.items() if previous.get(p) != key]
+        changed.extend(p for p in previous if p not in current)
+        return sorted(changed)
+
+
+@dataclass
+class DaemonState:
+    """In-memory state served by the daemon."""
+
+    index: dict = field(default_factory=dict)
+    updated: float = 0.0
+    updates: int = 0
+
+
+class IndexDaemon:
+    """Watches the tree and keeps index, corpus and architecture.json current."""
+
+    def __init__(
+        self,
+        root: Path = PM_DIR,
+        socket_path: Path = DEFAULT_SOCKET,
+        interval: float = DEFAULT_INTERVAL,
+        corpus: EntityCorpus | None = None,
+    ):
+        self.root = root
+        self.socket_path = socket_path
+        self.interval = interval
+        if corpus is None:
+            corpus = get_corpus()
+        self.corpus = corpus
+        self.state = DaemonState()
+        self.lock = threading.RLock()
+        self._stop = threading.Event()
+
+        self.commands: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "ping": lambda req: "pong",
+            "root": lambda req: self.state.index.get("root", ""),
+            "status": self._cmd_status,
+            "index": self._cmd_index,
+            "hash": self._cmd_hash,
+            "frontmatter": self._cmd_frontmatter,
+            "lint": self._cmd_lint,
+            "shutdown": self._cmd_shutdown,
+        }
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, paths: list[str] | None = None) -> RefreshResult:
+        """Update index, corpus and architecture for changed paths."""
+        with self.lock:
+            result = refresh_index(
+                self.root,
+                paths=paths,
+                corpus=self.corpus,
+                previous=self.state.index or None,
+            )
+            self.state.index = result.index
+            self.state.updated = time.time()
+            self.state.updates += 1
+
+            if any(p.endswith(".md") for p in result.changed):
+                update_entity_indexes((self.root / p for p in result.changed), self.corpus)
+                self._write_architecture()
+
+            return result
+
+    def _write_architecture(self) -> None:
+        arch = scan_architecture(self.root, self.corpus)
+        content = json.dumps(arch.to_dict(), indent=2)
+        output = self.root / "architecture.json"
+        # Only touch the file when it actually changes
+        try:
+            if output.read_text() == content:
+                return
+        except OSError:
+            pass
+        output.write_text(content)
+
+    def _watch(self, watcher: PollingWatcher) -> None:
+        while not self._stop.wait(self.interval):
+            changed = watcher.poll()
+            if changed:
+                self.refresh(changed)
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def _resolve(self, request: dict[str, Any]) -> Path:
+        path = Path(request.get("file", ""))
+        return path if path.is_absolute() else self.root / path
+
+    def _cmd_status(self, request: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "root": self.state.index.get("root", ""),
+            "files": len(self.state.index.get("files", {})),
+            "entities": len(self.corpus),
+            "updated": self.state.updated,
+            "updates": self.state.updates,
+        }
+
+    def _cmd_index(self, request: dict[str, Any]) -> str:
+        return self.refresh().summary()
+
+    def _cmd_hash(self, request: dict[str, Any]) -> str:
+        path = self._resolve(request)
+        if not path.exists():
+            return "not-found"
+        return self.corpus.get(path).digest.sha256[:16]
+
+    def _cmd_frontmatter(self, request: dict[str, Any]) -> str:
+        return json.dumps(self.corpus.get(self._resolve(request)).frontmatter, indent=2)
+
+    def _cmd_lint(self, request: dict[str, Any]) -> str:
+        try:
+            validate_entity(self._resolve(request))
+        except (ValidationError, OSError):
+            return f"✗ {request.get('file', '')}"
+        return "✓"
+
+    def _cmd_shutdown(self, request: dict[str, Any]) -> str:
+        # The socket handler stops the server once this reply is sent
+        self._stop.set()
+        return "bye"
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one request to its command handler."""
+        handler = self.commands.get(request.get("cmd", ""))
+        if handler is None:
+            return {"ok": False, "output": f"Unknown command: {request.get('cmd')}"}
+        try:
+            with self.lock:
+                return {"ok": True, "output": handler(request)}
+        except Exception as e:
+            return {"ok": False, "output": str(e)[:100]}
+
+    # ------------------------------------------------------------------
+    # Serving
+    # ------------------------------------------------------------------
+
+    def serve_forever(self) -> None:
+        """Build initial state, start the watcher and serve the socket."""
+        self.refresh()
+        watcher = PollingWatcher(self.root)
+        threading.Thread(target=self._watch, args=(watcher,), daemon=True).start()
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        request = json.loads(line)
+                    except ValueError:
+                        response = {"ok": False, "output": "invalid JSON"}
+                    else:
+                        response = daemon.handle(request)
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+                    if daemon._stop.is_set():
+                        threading.Thread(target=self.server.shutdown).start()
+                        return
+
+        with socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler) as server:
+            server.daemon_threads = True
+            try:
+                server.serve_forever()
+            finally:
+                self._stop.set()
+                self.socket_path.unlink(missing_ok=True)
+
+
+def query(
+    cmd: str,
+    socket_path: Path = DEFAULT_SOCKET,
+    timeout: float = 2.0,
+    **args: Any,
+) -> dict[str, Any] | None:
+    """Send one command to a running daemon.
+
+    Returns:
+        Response dict, or None if no daemon is listening
+    """
+    if not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps({"cmd": cmd, **args}).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+
+    return json.loads(line) if line else None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="PM index daemon")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL)
+    sub = parser.add_subparsers(dest="action")
+    q = sub.add_parser("query", help="Query a running daemon")
+    q.add_argument("cmd")
+    q.add_argument("file", nargs="?")
+    args = parser.parse_args(argv)
+
+    if args.action == "query":
+        extra = {"file": args.file} if args.file else {}
+        response = query(args.cmd, args.socket, **extra)
+        if response is None:
+            print("indexd not running", file=sys.stderr)
+            sys.exit(2)
+        output = response["output"]
+        print(output if isinstance(output, str) else json.dumps(output, indent=2))
+        sys.exit(0 if response["ok"] else 1)
+
+    print(f"indexd: watching {PM_DIR} (pid {os.getpid()}, socket {args.socket})")
+    IndexDaemon(socket_path=args.socket, interval=args.interval).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""Merkle index utilities.
+
+Shared across:
+- .index/generate-merkle.py
+- .index/check-changes.py
+
+Directory hashes form a real bottom-up Merkle tree: each directory hash
+covers its files and its child directories, and the root hash is the
+hash of ".". After a change only the ancestors of touched paths are
+recomputed.
+
+Hashing is done by a small engine that streams files in fixed-size
+chunks (counting lines in the same pass) and fans out across a thread
+pool; hashlib releases the GIL while digesting.
+
+Change detection is stat-first: every indexed file's (mtime_ns, size, inode)
+is recorded in a machine-local sidecar (`.index/stat-cache.json`), and only
+files whose stat tuple differs are re-hashed. The committed
+`merkle-tree.json` stays free of machine-specific stat data.
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+# File patterns included in the index
+INDEX_PATTERNS = ("*.md", "*.sh")
+
+# Path fragments excluded from the index
+EXCLUDED_FRAGMENTS = (".index", ".git")
+
+STAT_CACHE_NAME = "stat-cache.json"
+STAT_CACHE_VERSION = 1
+
+# Read size for streaming hashes
+CHUNK_SIZE = 1 << 20
+
+# Default thread pool size for digest_files
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+@dataclass(frozen=True)
+class FileDigest:
+    """SHA256 and line count of a file, computed in one pass."""
+
+    sha256: str
+    lines: int
+    size: int
+
+
+def _count_lines(newlines: int, size: int, last_byte: int | None) -> int:
+    # A trailing fragment without "\n" still counts as a line
+    if size and last_byte != 0x0A:
+        return newlines + 1
+    return newlines
+
+
+def digest_bytes(data: bytes) -> FileDigest:
+    """Digest in-memory file contents."""
+    return FileDigest(
+        sha256=hashlib.sha256(data).hexdigest(),
+        lines=_count_lines(data.count(b"\n"), len(data), data[-1] if data else None),
+        size=len(data),
+    )
+
+
+def digest_file(path: Path, chunk_size: int = CHUNK_SIZE) -> FileDigest:
+    """Stream a file once, computing its SHA256 and line count.
+
+    Reads into a reusable buffer so memory stays at chunk_size regardless
+    of file size.
+    """
+    sha = hashlib.sha256()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    newlines = 0
+    size = 0
+    last_byte = None
+
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            sha.update(view[:n])
+            newlines += buf.count(b"\n", 0, n)
+            size += n
+            last_byte = buf[n - 1]
+
+    return FileDigest(
+        sha256=sha.hexdigest(),
+        lines=_count_lines(newlines, size, last_byte),
+        size=size,
+    )
+
+
+def digest_files(
+    paths: Iterable[Path],
+    max_workers: int | None = None,
+) -> dict[Path, FileDigest]:
+    """Digest many files concurrently.
+
+    Args:
+        paths: Files to digest
+        max_workers: Thread pool size (defaults to MAX_HASH_WORKERS)
+
+    Returns:
+        Mapping of path -> FileDigest, in input order
+
+    Raises:
+        OSError: If any file can't be read
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return {p: digest_file(p) for p in paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers or MAX_HASH_WORKERS) as pool:
+        return dict(zip(paths, pool.map(digest_file, paths)))
+
+
+def hash_file(path: Path) -> str:
+    """SHA256 hash of file contents (streamed)."""
+    return digest_file(path).sha256
+
+
+def hash_string(s: str) -> str:
+    """SHA256 hash of string."""
+    return hashlib.sha256(s.encode()).hexdigest()
+
+
+def parent_dir(rel_path: str) -> str:
+    """Parent directory of an index path ("." for top-level entries)."""
+    return posixpath.dirname(rel_path) or "."
+
+
+def ancestors(rel_path: str) -> Iterator[str]:
+    """Yield every directory above rel_path, deepest first, ending at "."."""
+    current = parent_dir(rel_path)
+    while True:
+        yield current
+        if current == ".":
+            return
+        current = parent_dir(current)
+
+
+def _children(
+    files: dict[str, dict[str, Any]],
+) -> tuple[dict[str, list[str]], dict[str, set[str]]]:
+    """Group files by directory and link every directory to its parent."""
+    dir_files: dict[str, list[str]] = defaultdict(list)
+    dir_subdirs: dict[str, set[str]] = defaultdict(set)
+
+    for rel_path in files:
+        directory = parent_dir(rel_path)
+        dir_files[directory].append(rel_path)
+        while directory != ".":
+            parent = parent_dir(directory)
+            if directory in dir_subdirs[parent]:
+                break  # Rest of the chain already linked
+            dir_subdirs[parent].add(directory)
+            directory = parent
+
+    return dir_files, dir_subdirs
+
+
+def _depth(directory: str) -> int:
+    return 0 if directory == "." else directory.count("/") + 1
+
+
+def _hash_directory(
+    directory: str,
+    files: dict[str, dict[str, Any]],
+    directories: dict[str, dict[str, Any]],
+    dir_files: dict[str, list[str]],
+    dir_subdirs: dict[str, set[str]],
+) -> dict[str, Any]:
+    """Hash one directory from its files and (already hashed) subdirectories."""
+    entries = [
+        f"f {posixpath.basename(f)} {files[f]['hash']}"
+        for f in dir_files.get(directory, [])
+    ]
+    entries.extend(
+        f"d {posixpath.basename(d)} {directories[d]['hash']}"
+        for d in dir_subdirs.get(directory, ())
+    )
+    entries.sort()
+
+    return {
+        "hash": hash_string("\n".join(entries)) if entries else "empty",
+        "files": len(dir_files.get(directory, [])),
+        "dirs": len(dir_subdirs.get(directory, ())),
+    }
+
+
+def build_directories(files: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Build all directory nodes bottom-up from file hashes.
+
+    Args:
+        files: Mapping of rel_path -> {"hash": ..., ...}
+
+    Returns:
+        Mapping of directory -> {"hash", "files", "dirs"}, including "."
+    """
+    dir_files, dir_subdirs = _children(files)
+    all_dirs = {"."} | set(dir_files) | set(dir_subdirs)
+
+    directories: dict[str, dict[str, Any]] = {}
+    for directory in sorted(all_dirs, key=_depth, reverse=True):
+        directories[directory] = _hash_directory(
+            directory, files, directories, dir_files, dir_subdirs
+        )
+
+    return dict(sorted(directories.items()))
+
+
+def update_directories(
+    files: dict[str, dict[str, Any]],
+    directories: dict[str, dict[str, Any]],
+    changed_paths: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Recompute only the ancestors of changed paths.
+
+    `files` must already reflect the change (entries updated, added or
+    removed). Directories left without files or subdirectories are dropped.
+
+    Args:
+        files: Current rel_path -> file entry mapping
+        directories: Previous directory nodes
+        changed_paths: Files that were modified, added or removed
+
+    Returns:
+        Updated directory mapping
+    """
+    dirty: set[str] = set()
+    for rel_path in changed_paths:
+        dirty.update(ancestors(rel_path))
+
+    if not dirty:
+        return directories
+
+    dir_files, dir_subdirs = _children(files)
+    directories = dict(directories)
+
+    for directory in sorted(dirty, key=_depth, reverse=True):
+        if directory != "." and directory not in dir_files and directory not in dir_subdirs:
+            directories.pop(directory, None)
+            continue
+        directories[directory] = _hash_directory(
+            directory, files, directories, dir_files, dir_subdirs
+        )
+
+    return dict(sorted(directories.items()))
+
+
+def root_hash(directories: dict[str, dict[str, Any]]) -> str:
+    """Root of the Merkle tree (the hash of ".")."""
+    return directories.get(".", {}).get("hash", "empty")
+
+
+def stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    """Stat tuple used for change detection: (mtime_ns, size, inode)."""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def is_index_path(rel_path: str) -> bool:
+    """Whether a path relative to root is one the index tracks."""
+    if any(frag in rel_path for frag in EXCLUDED_FRAGMENTS):
+        return False
+    name = posixpath.basename(rel_path)
+    return any(fnmatch(name, p) for p in INDEX_PATTERNS)
+
+
+def iter_index_files(root: Path) -> Iterator[tuple[str, os.stat_result]]:
+    """Walk root once, yielding (rel_path, stat) for every indexable file.
+
+    Uses os.scandir so directory entries are listed once and only matching
+    files are stat'ed.
+    """
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(root / rel_dir if rel_dir else root))
+        except OSError:
+            continue
+
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if any(frag in rel_path for frag in EXCLUDED_FRAGMENTS):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(rel_path)
+                elif any(fnmatch(entry.name, p) for p in INDEX_PATTERNS):
+                    yield rel_path, entry.stat()
+            except OSError:
+                continue
+
+
+@dataclass
+class StatCache:
+    """Machine-local map of rel_path -> (mtime_ns, size, inode, sha256)."""
+
+    path: Path
+    entries: dict[str, tuple[int, int, int, str]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "StatCache":
+        """Load the sidecar, returning an empty cache if missing or invalid."""
+        path = index_dir / STAT_CACHE_NAME
+        cache = cls(path=path)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return cache
+
+        if data.get("version") != STAT_CACHE_VERSION:
+            return cache
+
+        cache.entries = {
+            rel: tuple(entry) for rel, entry in data.get("files", {}).items()
+        }
+        return cache
+
+    def save(self) -> None:
+        """Write the sidecar (compact JSON) atomically.
+
+        Each call writes its own temporary file before renaming it into
+        place, so concurrent savers (e.g. PMTools.parallel) never share one.
+        """
+        data = {"version": STAT_CACHE_VERSION, "files": dict(self.entries)}
+        tmp = tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f"{self.path.stem}.", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp.name, self.path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
+    def lookup(self, rel_path: str, st: os.stat_result) -> str | None:
+        """Return the cached hash if the file's stat tuple is unchanged."""
+        entry = self.entries.get(rel_path)
+        if entry is not None and tuple(entry[:3]) == stat_key(st):
+            return entry[3]
+        return None
+
+    def record(self, rel_path: str, st: os.stat_result, file_hash: str) -> None:
+        """Remember the hash for a file at its current stat tuple."""
+        self.entries[rel_path] = (*stat_key(st), file_hash)
+
+
+@dataclass
+class ChangeSet:
+    """Result of comparing the tree against a stored index."""
+
+    changed: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    rehashed: int = 0  # Files whose stat tuple changed and had to be hashed
+
+    @property
+    def is_clean(self) -> bool:
+        return not (self.changed or self.added or self.removed)
+
+
+def detect_changes(
+    root: Path,
+    stored_files: dict[str, dict[str, Any]],
+    stat_cache: StatCache,
+) -> ChangeSet:
+    """Compare the tree with the stored index, hashing only stat-changed files.
+
+    Files whose hash is confirmed unchanged are re-recorded in the stat
+    cache so the next run can skip them.
+
+    Args:
+        root: PM root directory
+        stored_files: The "files" mapping from merkle-tree.json
+        stat_cache: Sidecar stat cache (updated in place)
+
+    Returns:
+        ChangeSet with modified, added and removed paths
+    """
+    changes = ChangeSet()
+    seen: set[str] = set()
+    to_hash: dict[Path, tuple[str, os.stat_result]] = {}
+
+    for rel_path, st in iter_index_files(root):
+        seen.add(rel_path)
+        info = stored_files.get(rel_path)
+        if info is None:
+            changes.added.append(rel_path)
+            continue
+
+        current_hash = stat_cache.lookup(rel_path, st)
+        if current_hash is None:
+            to_hash[root / rel_path] = (rel_path, st)
+        elif current_hash != info["hash"]:
+            changes.changed.append(rel_path)
+
+    # Re-hash stat-changed files in parallel
+    for path, digest in digest_files(to_hash).items():
+        rel_path, st = to_hash[path]
+        stat_cache.record(rel_path, st, digest.sha256)
+        if digest.sha256 != stored_files[rel_path]["hash"]:
+            changes.changed.append(rel_path)
+    changes.rehashed = len(to_hash)
+
+    changes.removed = [f for f in stored_files if f not in seen]
+    for rel_path in [f for f in stat_cache.entries if f not in seen]:
+        del stat_cache.entries[rel_path]
+
+    changes.changed.sort()
+    changes.added.sort()
+    changes.removed.sort()
+    return changes
@@ -0,0 +1,159 @@
+"""MinHash signatures and LSH banding for near-duplicate text.
+
+Finds candidate pairs of similar documents without comparing every pair:
+each document is reduced to a fixed-size MinHash signature whose slots
+agree with probability equal to the Jaccard similarity of the shingle
+sets, and signatures are split into bands hashed into buckets. Only
+documents sharing a bucket are compared exactly.
+
+Shingles are word k-grams hashed to 64-bit integers (CRC32 per word,
+combined FNV-style), so sets and signatures never build k-gram strings.
+Signatures use one-permutation hashing (each shingle lands in one of
+`num_perm` bins, keeping the minimum; empty bins borrow from the next
+non-empty one), so building one is linear in the number of shingles.
+Hashes are stable across processes.
+
+Usage:
+    index = LSHIndex(threshold=0.6)
+    for key, text in documents:
+        index.add(key, shingles(text))
+    for a, b in index.candidates():
+        if jaccard(sets[a], sets[b]) >= 0.6: ...
+
+schema: N/A (core library)
+depends_on: []
+depended_by:
+  - lib/review_generator.py
+semver: minor
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Hashable, Iterable, Iterator
+
+
+# Signature length (bins)
+NUM_PERM = 64
+
+# Buckets up to this size are fully paired; larger ones are chained
+MAX_PAIRWISE_BUCKET = 32
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+# Added per bin of distance when an empty bin borrows a neighbour's value,
+# so borrowed slots don't collide with the neighbour itself
+_ROTATION = 0x9E3779B97F4A7C15
+_MASK = 0xFFFFFFFFFFFFFFFF
+_FNV_PRIME = 0x100000001B3
+
+
+def shingles(text: str, k: int = 2) -> frozenset[int]:
+    """Hashed word k-gram shingles of lower-cased text (single words if shorter)."""
+    hashes = [zlib.crc32(token.encode()) for token in TOKEN_RE.findall(text.lower())]
+    if len(hashes) < k:
+        return frozenset(hashes)
+    if k == 2:
+        return frozenset([(a * _FNV_PRIME ^ b) & _MASK for a, b in zip(hashes, hashes[1:])])
+    result = set()
+    for i in range(len(hashes) - k + 1):
+        h = 0
+        for token in hashes[i:i + k]:
+            h = (h * _FNV_PRIME ^ token) & _MASK
+        result.add(h)
+    return frozenset(result)
+
+
+def jaccard(a: frozenset | set, b: frozenset | set) -> float:
+    """Exact Jaccard similarity of two sets (1.0 for two empty sets)."""
+    if not a and not b:
+        return 1.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def signature(items: Iterable[int], num_perm: int = NUM_PERM) -> tuple[int, ...]:
+    """One-permutation MinHash signature of a hashed shingle set."""
+    bins = [-1] * num_perm
+    for h in items:
+        slot = h % num_perm
+        value = h // num_perm
+        current = bins[slot]
+        if current < 0 or value < current:
+            bins[slot] = value
+
+    if all(v < 0 for v in bins):
+        return tuple(bins)
+
+    # Densify: an empty bin takes the next non-empty bin's value (circularly),
+    # rotated by the distance. One right-to-left sweep over two laps.
+    filled = bins[:]
+    next_value = next_pos = -1
+    for pos in range(2 * num_perm - 1, -1, -1):
+        value = bins[pos % num_perm]
+        if value >= 0:
+            next_value, next_pos = value, pos
+        elif pos < num_perm and next_value >= 0:
+            filled[pos] = (next_value + _ROTATION * (next_pos - pos)) & _MASK
+    return tuple(filled)
+
+
+def choose_bands(threshold: float, num_perm: int = NUM_PERM) -> tuple[int, int]:
+    """Pick (bands, rows) so candidates start appearing below `threshold`.
+
+    The LSH S-curve crosses 50% near (1/bands)^(1/rows); the widest rows
+    keeping that point at least 0.1 under the threshold keeps recall high
+    while still pruning most pairs.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold - 0.1:
+            best = (bands, rows)
+    return best
+
+
+class LSHIndex:
+    """Banded LSH buckets over MinHash signatures.
+
+    Args:
+        threshold: Target Jaccard similarity (tunes bands/rows)
+        num_perm: Signature length
+    """
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = NUM_PERM):
+        self.num_perm = num_perm
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        self._buckets: dict[tuple[Hashable, int, int], list[Hashable]] = defaultdict(list)
+
+    def add(self, key: Hashable, items: Iterable[int], scope: Hashable = None) -> None:
+        """Index a document's shingles; only documents with equal scope can pair."""
+        sig = signature(items, self.num_perm)
+        if sig and sig[0] < 0:
+            return  # No shingles, nothing to compare
+        rows = self.rows
+        buckets = self._buckets
+        for band, start in enumerate(range(0, self.num_perm, rows)):
+            buckets[(scope, band, hash(sig[start:start + rows]))].append(key)
+
+    def candidates(self) -> Iterator[tuple[Hashable, Hashable]]:
+        """Candidate pairs sharing a bucket, each yielded once.
+
+        Small buckets yield every pair. Buckets larger than
+        MAX_PAIRWISE_BUCKET (typically boilerplate text) are chained, each
+        member paired with the previous one, so they cost linear time;
+        callers merging with union-find still connect such a bucket when
+        the chained pairs verify.
+        """
+        seen: set[tuple[Hashable, Hashable]] = set()
+        for members in self._buckets.values():
+            if len(members) <= MAX_PAIRWISE_BUCKET:
+                pairs = ((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+            else:
+                pairs = zip(members, members[1:])
+            for pair in pairs:
+                if pair[0] != pair[1] and pair not in seen:
+                    seen.add(pair)
+                    yield pair
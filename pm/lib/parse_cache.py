@@ -0,0 +1,178 @@
+"""Persistent frontmatter parse cache.
+
+Maps the SHA256 of a file's frontmatter block (see `head_digest`) to its
+parsed frontmatter in a small sqlite database
+under `.index/`, so unchanged files skip parsing across processes (every
+`make l0-*` target starts a fresh interpreter).
+
+The cache is tagged with `frontmatter.PARSER_VERSION` and KEY_VERSION
+and clears itself when the parser or the keying scheme changes.
+
+schema: N/A (core library)
+depends_on:
+  - lib/frontmatter.py
+depended_by:
+  - lib/validators.py
+  - .index/generate-merkle.py
+  - Makefile (l0-lint, l0-frontmatter)
+semver: minor
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+from .frontmatter import PARSER_VERSION, head_of, parse_frontmatter, read_head
+
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".index" / "parse-cache.sqlite"
+
+# Bump when what the cache is keyed by changes (2: frontmatter block, not whole file)
+KEY_VERSION = "2"
+
+CACHE_VERSION = f"{PARSER_VERSION}:{KEY_VERSION}"
+
+
+def head_digest(raw: bytes) -> str:
+    """Cache key for a file's full contents: SHA256 of its frontmatter block.
+
+    Matches the key `ParseCache.parse_file` looks up, so callers holding
+    whole files (e.g. the index builder) can warm the cache.
+    """
+    return hashlib.sha256(head_of(raw)).hexdigest()
+
+
+class ParseCache:
+    """Frontmatter SHA256 -> parsed frontmatter, persisted in sqlite.
+
+    Any sqlite failure (locked, read-only, corrupt) degrades to an
+    uncached parse rather than failing the caller. One connection is shared
+    by all threads and serialized with a lock.
+
+    Usage:
+        cache = ParseCache()
+        frontmatter = cache.parse_file(Path("entities/examples/TASK-004.md"))
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS frontmatter "
+                "(sha256 TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'parser_version'"
+            ).fetchone()
+            if row is None or row[0] != CACHE_VERSION:
+                # Parser or keying changed - every cached row is suspect or unreachable
+                conn.execute("DELETE FROM frontmatter")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('parser_version', ?)",
+                    (CACHE_VERSION,),
+                )
+            conn.commit()
+        except sqlite3.Error:
+            self._disabled = True
+            return None
+
+        self._conn = conn
+        return conn
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        """Look up parsed frontmatter by `head_digest` key."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT data FROM frontmatter WHERE sha256 = ?", (digest,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        return json.loads(row[0]) if row else None
+
+    def put(self, digest: str, frontmatter: dict[str, Any]) -> None:
+        """Store parsed frontmatter under a `head_digest` key."""
+        self.put_many([(digest, frontmatter)])
+
+    def put_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Store many (head_digest, frontmatter) pairs in one transaction."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO frontmatter (sha256, data) VALUES (?, ?)",
+                    ((digest, json.dumps(fm)) for digest, fm in items),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def parse_bytes(self, raw: bytes, digest: str | None = None) -> dict[str, Any]:
+        """Parse frontmatter from file bytes, consulting the cache first.
+
+        Args:
+            raw: File contents, or just its frontmatter block
+            digest: Precomputed head_digest(raw), if the caller has one
+
+        Returns:
+            Dict of frontmatter fields
+        """
+        digest = digest or head_digest(raw)
+        cached = self.get(digest)
+        if cached is not None:
+            return cached
+
+        frontmatter = parse_frontmatter(raw.decode("utf-8", errors="ignore"))
+        self.put(digest, frontmatter)
+        return frontmatter
+
+    def parse_file(self, path: Path) -> dict[str, Any]:
+        """Parse frontmatter from a file path, consulting the cache first.
+
+        Only the frontmatter block is read; the cache key is its SHA256.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        return self.parse_bytes(read_head(Path(path)))
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM frontmatter")
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
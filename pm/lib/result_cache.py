@@ -0,0 +1,175 @@
+"""Memoized tool results keyed by the state they were computed from.
+
+Single-file reads such as `l0_lint`, `l0_hash` and `l0_frontmatter` are
+pure functions of their target file, so a result is reused while the
+file's stat (plus a stat fingerprint of the Python/Makefile code that
+produces it) is unchanged. Tools with side effects are never cached.
+
+Two tiers: an in-memory LRU per process, backed by a small sqlite table
+under `.index/` shared across processes and sessions.
+
+schema: N/A (core library)
+depends_on:
+  - lib/merkle.py
+depended_by:
+  - lib/tools.py
+semver: minor
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / ".index" / "tool-cache.sqlite"
+
+# In-memory LRU size (entries)
+MAX_MEMORY_ENTRIES = 256
+
+# On-disk LRU size (entries); least recently used rows are evicted
+MAX_DISK_ENTRIES = 4096
+
+# Code that tool output depends on but the Merkle index doesn't hash
+CODE_PATTERNS = ("lib/*.py", ".index/*.py", "scripts/**/*.py", "Makefile")
+
+
+def code_fingerprint(root: Path) -> str:
+    """Stat-only fingerprint of the code behind the tools (no file reads)."""
+    h = hashlib.sha256()
+    for pattern in CODE_PATTERNS:
+        for path in sorted(root.glob(pattern)):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            h.update(f"{path.relative_to(root)}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def cache_key(tool: str, args: dict[str, Any], code: str = "") -> str:
+    """Stable key for one tool invocation; args must include the input state."""
+    payload = json.dumps([tool, args, code], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """Two-tier (memory + sqlite) LRU cache of tool results.
+
+    Values are plain dicts (e.g. `dataclasses.asdict(ToolResult)`). Like
+    ParseCache, any sqlite failure degrades to the memory tier only.
+
+    Usage:
+        cache = ResultCache()
+        key = cache_key("l0-lint", {"file": file, "stat": stat_key(st)})
+        hit = cache.get(key)
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = DEFAULT_CACHE_PATH,
+        max_entries: int = MAX_MEMORY_ENTRIES,
+        max_disk_entries: int = MAX_DISK_ENTRIES,
+    ):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = self.path is None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, data TEXT NOT NULL, used REAL NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error:
+            self._disabled = True
+            return None
+
+        self._conn = conn
+        return conn
+
+    def _remember(self, key: str, value: dict[str, Any]) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Look up a result, promoting disk hits into memory."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+            except sqlite3.Error:
+                return None
+
+            value = json.loads(row[0])
+            self._remember(key, value)
+            return value
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        """Store a result in both tiers, evicting least recently used rows."""
+        with self._lock:
+            self._remember(key, value)
+
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, data, used) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM results WHERE key NOT IN "
+                    "(SELECT key FROM results ORDER BY used DESC LIMIT ?)",
+                    (self.max_disk_entries,),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def clear(self) -> None:
+        """Remove all cached results from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM results")
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -5,20 +5,47 @@ that align with Claude Code's TaskCreate system.
 
 schema: task
 depends_on:
+  - pm/lib/domains.py
+  - pm/lib/fenced_json.py
   - pm/lib/frontmatter.py
+  - pm/lib/minhash.py
+  - pm/lib/task_ids.py
 depended_by:
   - pm/agents/review-synthesizer.md
+  - pm/lib/review_runner.py
+  - pm/lib/review_synthesis.py
 semver: minor
 """
 
-import json
+import heapq
+import io
+import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
-from .frontmatter import parse_frontmatter, get_body
+from .domains import get_classifier
+from .fenced_json import find_json_block, iter_array_items
+from .frontmatter import get_body, parse_frontmatter, read_head
+from .minhash import LSHIndex, jaccard, shingles
+from .task_ids import TaskIdAllocator, get_task_id_allocator
+
+
+# Tasks generated per process_reviews run
+MAX_GENERATED_TASKS = 10
+
+# Review files parsed concurrently in streaming mode
+STREAM_WORKERS = 4
+
+# Default Jaccard similarity for deduplicate_findings(mode="similar")
+SIMILARITY_THRESHOLD = 0.6
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 @dataclass
@@ -37,6 +64,31 @@ class Finding:
     source_review: str = ""
     generated_task: str | None = None
 
+    @property
+    def line_spec(self) -> str:
+        """Lines as a span ("45" or "45-67"), or "" if unknown."""
+        span = self.line_span
+        if span is None:
+            return ""
+        start, end = span
+        return str(start) if start == end else f"{start}-{end}"
+
+    @property
+    def rank(self) -> tuple[int, int]:
+        """Sort key: P0 first, then highest confidence."""
+        return (0 if self.priority == "P0" else 1, -self.confidence)
+
+    @property
+    def line_span(self) -> tuple[int, int] | None:
+        """(first, last) line, or None when the finding covers the whole file."""
+        lines = [n for n in self.lines if isinstance(n, int)]
+        return (min(lines), max(lines)) if lines else None
+
+    @property
+    def text(self) -> str:
+        """Title, description and suggestion, for similarity matching."""
+        return " ".join((self.title, self.description, self.suggestion))
+
     @property
     def is_task_eligible(self) -> bool:
         """Check if finding qualifies for automatic task generation."""
@@ -77,18 +129,51 @@ class Review:
 
     @classmethod
     def from_file(cls, path: Path) -> "Review":
-        """Parse Review from markdown file."""
-        content = path.read_text(encoding="utf-8", errors="ignore")
-        frontmatter = parse_frontmatter(content)
-        body = get_body(content)
+        """Parse Review from markdown file.
 
-        review = cls(
+        Reviews can be megabytes of prose, so they are read directly
+        rather than through the shared entity corpus.
+        """
+        content = Path(path).read_text(encoding="utf-8", errors="ignore")
+        return cls.from_parts(path, parse_frontmatter(content), get_body(content))
+
+    @classmethod
+    def read(cls, path: Path) -> "Review":
+        """Parse Review from a file without keeping it in the shared corpus.
+
+        Used by streaming ingestion, where caching every review would make
+        memory grow with the number of files. Only the frontmatter is read
+        whole; findings are decoded one at a time from the body, which is
+        never held in memory (metrics are kept if they precede findings).
+        """
+        head = read_head(path)
+        review = cls.from_frontmatter(path, parse_frontmatter(head.decode("utf-8", errors="ignore")))
+        extras: dict[str, Any] = {}
+        with open(path, "rb") as raw:
+            raw.seek(len(head))
+            with io.TextIOWrapper(raw, encoding="utf-8", errors="ignore") as stream:
+                for f_data in iter_array_items(stream, "findings", extras):
+                    if isinstance(f_data, dict):
+                        review.findings.append(Finding.from_dict(f_data, review.id))
+        metrics = extras.get("metrics")
+        review.metrics = metrics if isinstance(metrics, dict) else {}
+        return review
+
+    @classmethod
+    def from_frontmatter(cls, path: Path, frontmatter: dict[str, Any]) -> "Review":
+        """A Review with its metadata set and no findings yet."""
+        return cls(
             id=frontmatter.get("id", path.stem),
             review_type=frontmatter.get("review_type", "unknown"),
             branch=frontmatter.get("branch", ""),
             commit=frontmatter.get("commit", ""),
         )
 
+    @classmethod
+    def from_parts(cls, path: Path, frontmatter: dict[str, Any], body: str) -> "Review":
+        """Build a Review from parsed frontmatter and body."""
+        review = cls.from_frontmatter(path, frontmatter)
+
         # Extract findings JSON from body
         findings_json = extract_findings_json(body)
         if findings_json:
@@ -114,11 +199,18 @@ class TaskEntity:
     source_review: str = ""
     source_finding: str = ""
     tags: list[str] = field(default_factory=list)
+    file: str = ""  # File the finding points at
+    lines: str = ""  # Line span in that file, e.g. "45-67"
 
     def to_markdown(self) -> str:
         """Generate markdown file content for the task entity."""
         now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         tags_yaml = "\n".join(f'  - "{tag}"' for tag in self.tags) if self.tags else ""
+        if self.file:
+            ref = f"{self.file}:{self.lines}" if self.lines else self.file
+            files_md = f"**File**: `{ref}`"
+        else:
+            files_md = "<!-- Files to modify based on finding -->"
 
         return f'''---
 id: "{self.id}"
@@ -166,7 +258,7 @@ tags:
 
 ## Files
 
-<!-- Files to modify based on finding -->
+{files_md}
 
 ## Test Requirements
 
@@ -177,48 +269,27 @@ tags:
 def extract_findings_json(body: str) -> dict[str, Any] | None:
     """Extract JSON block containing findings from review body.
 
-    Looks for fenced JSON blocks with findings array.
+    Looks for fenced JSON blocks with findings array. Blocks are found in
+    one linear pass and only those mentioning "findings" are decoded.
     """
-    # Match ```json ... ``` blocks
-    json_blocks = re.findall(r"```json\n(.*?)\n```", body, re.DOTALL)
-
-    for block in json_blocks:
-        try:
-            data = json.loads(block)
-            if "findings" in data:
-                return data
-        except json.JSONDecodeError:
-            continue
-
-    return None
+    return find_json_block(body, "findings")
 
 
 def infer_domain(file_path: str) -> str:
     """Infer domain from file path.
 
-    Maps file paths to domains for task assignment.
+    Maps file paths to domains for task assignment, using the same
+    rules as assignment_algorithm.classify_domain.
     """
-    path = file_path.lower()
-
-    domain_patterns = [
-        (r"src/auth/|src/middleware/auth", "auth"),
-        (r"src/api/|src/routes/", "api"),
-        (r"src/db/|migrations/", "data"),
-        (r"app/|src/components/|src/pages/", "frontend"),
-        (r"tests/", "testing"),
-        (r"\.github/|scripts/|infra/", "infrastructure"),
-    ]
-
-    for pattern, domain in domain_patterns:
-        if re.search(pattern, path):
-            return domain
-
-    return "backend"  # Default
+    return get_classifier().classify(file_path)
 
 
 def generate_task_id(existing_ids: set[str]) -> str:
     """Generate next available TASK-XXX id.
 
+    Scans every ID on each call and is not coordinated across processes;
+    batch generation goes through a TaskIdAllocator instead.
+
     Args:
         existing_ids: Set of existing task IDs
 
@@ -237,17 +308,19 @@ def generate_task_id(existing_ids: set[str]) -> str:
 def generate_task_from_finding(
     finding: Finding,
     existing_task_ids: set[str],
+    task_id: str | None = None,
 ) -> TaskEntity:
     """Create TaskEntity from a review finding.
 
     Args:
         finding: The finding to convert
         existing_task_ids: Set of existing task IDs to avoid collisions
+        task_id: Pre-allocated ID (existing_task_ids is then not scanned)
 
     Returns:
         TaskEntity ready to write to file
     """
-    task_id = generate_task_id(existing_task_ids)
+    task_id = task_id or generate_task_id(existing_task_ids)
 
     # Determine sizing based on priority
     if finding.priority == "P0":
@@ -276,6 +349,8 @@ def generate_task_from_finding(
         source_review=finding.source_review,
         source_finding=finding.id,
         tags=["review-fix", finding.category, finding.priority.lower()],
+        file=finding.file,
+        lines=finding.line_spec,
     )
 
 
@@ -283,24 +358,62 @@ def process_reviews(
     review_dir: Path,
     output_dir: Path,
     existing_task_ids: set[str] | None = None,
+    streaming: bool = False,
+    allocator: TaskIdAllocator | None = None,
 ) -> list[TaskEntity]:
     """Process all reviews in a directory and generate tasks.
 
+    Task IDs come from the shared allocator (.index/task-ids.sqlite), so
+    concurrent runs never reuse a number; IDs in existing_task_ids and
+    TASK-*.md files already in output_dir are never handed out.
+
     Args:
         review_dir: Directory containing REVIEW-*.md files
         output_dir: Directory to write generated TASK-*.md files
         existing_task_ids: Optional set of existing task IDs
+        streaming: Parse reviews concurrently and keep only the top
+            findings in memory (see stream_review_tasks)
+        allocator: ID allocator (default: get_task_id_allocator())
 
     Returns:
         List of generated TaskEntity objects
     """
-    if existing_task_ids is None:
-        existing_task_ids = set()
+    if streaming:
+        return list(stream_review_tasks(
+            review_dir, output_dir, existing_task_ids, allocator=allocator
+        ))
+
+    return process_review_files(
+        sorted(review_dir.glob("REVIEW-*.md")), output_dir, existing_task_ids, allocator
+    )
+
+
+def process_review_files(
+    review_files: Iterable[Path],
+    output_dir: Path,
+    existing_task_ids: set[str] | None = None,
+    allocator: TaskIdAllocator | None = None,
+    limit: int = MAX_GENERATED_TASKS,
+) -> list[TaskEntity]:
+    """Generate tasks from specific review files (see process_reviews).
+
+    Lets a caller feed reviews one at a time as they are written, e.g.
+    the parallel review runner.
+
+    Args:
+        review_files: REVIEW-*.md files to read
+        output_dir: Directory to write generated TASK-*.md files
+        existing_task_ids: Optional set of existing task IDs
+        allocator: ID allocator (default: get_task_id_allocator())
+        limit: Maximum number of tasks to generate
 
+    Returns:
+        List of generated TaskEntity objects
+    """
     # Collect all findings
     all_findings: list[Finding] = []
 
-    for review_file in review_dir.glob("REVIEW-*.md"):
+    for review_file in review_files:
         review = Review.from_file(review_file)
         all_findings.extend(review.findings)
 
@@ -308,53 +421,200 @@ def process_reviews(
     eligible = [f for f in all_findings if f.is_task_eligible]
 
     # Sort by priority (P0 first) then confidence (highest first)
-    eligible.sort(
-        key=lambda f: (0 if f.priority == "P0" else 1, -f.confidence)
+    eligible.sort(key=lambda f: f.rank)
+
+    # Generate up to `limit` tasks, claiming their IDs in one reservation
+    selected = eligible[:max(0, limit)]
+    allocator = _prepare_allocator(allocator, existing_task_ids, output_dir)
+    if selected:
+        allocator.reserve(len(selected))
+    try:
+        return [write_task(f, output_dir, allocator) for f in selected]
+    finally:
+        allocator.release()
+
+
+def stream_review_tasks(
+    review_dir: Path,
+    output_dir: Path,
+    existing_task_ids: set[str] | None = None,
+    limit: int | None = MAX_GENERATED_TASKS,
+    max_workers: int = STREAM_WORKERS,
+    allocator: TaskIdAllocator | None = None,
+) -> Iterator[TaskEntity]:
+    """Generate tasks from reviews in bounded memory, yielding each as written.
+
+    Review files are parsed on a thread pool with a bounded window of
+    files in flight, and are not cached. Eligible findings pass through a
+    heap holding at most `limit` findings, so memory is O(limit + window)
+    however many reviews there are. With `limit=None` every eligible
+    finding becomes a task as soon as its review is parsed.
+
+    Args:
+        review_dir: Directory containing REVIEW-*.md files
+        output_dir: Directory to write generated TASK-*.md files
+        existing_task_ids: Optional set of existing task IDs
+        limit: Keep only the best N findings (None = no limit, no buffering)
+        max_workers: Review files parsed concurrently
+        allocator: ID allocator (default: get_task_id_allocator()); with
+            limit=None IDs are claimed in batches as tasks are written
+
+    Yields:
+        Each TaskEntity after its file has been written
+    """
+    allocator = _prepare_allocator(allocator, existing_task_ids, output_dir)
+    findings = iter_review_findings(review_dir, max_workers)
+    eligible = (f for f in findings if f.is_task_eligible)
+
+    try:
+        if limit is None:
+            for finding in eligible:
+                yield write_task(finding, output_dir, allocator)
+            return
+
+        selected = top_findings(eligible, limit)
+        if selected:
+            allocator.reserve(len(selected))
+        for finding in selected:
+            yield write_task(finding, output_dir, allocator)
+    finally:
+        allocator.release()
+
+
+def iter_review_findings(review_dir: Path, max_workers: int = STREAM_WORKERS) -> Iterator[Finding]:
+    """Findings from every REVIEW-*.md in a directory, parsed concurrently.
+
+    Files are visited in name order and their findings yielded in that
+    order, so results are deterministic.
+    """
+    paths = sorted(
+        Path(entry.path) for entry in os.scandir(review_dir)
+        if entry.name.startswith("REVIEW-") and entry.name.endswith(".md") and entry.is_file()
     )
+    for review in _bounded_map(Review.read, paths, max_workers):
+        yield from review.findings
+
+
+def top_findings(findings: Iterable[Finding], limit: int) -> list[Finding]:
+    """Best `limit` findings by rank, in rank order, using a bounded heap.
 
-    # Generate tasks (max 10)
-    generated_tasks: list[TaskEntity] = []
-    current_ids = existing_task_ids.copy()
+    Ties keep arrival order, matching a stable sort over all findings.
+    """
+    if limit <= 0:
+        return []
+    # Root is the worst finding kept: highest rank, latest arrival
+    heap: list[tuple[tuple[int, int], int, Finding]] = []
+    for seq, finding in enumerate(findings):
+        priority, confidence = finding.rank
+        entry = ((-priority, -confidence), -seq, finding)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    return [f for _, _, f in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+
+def _bounded_map(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """Ordered map over a thread pool with at most 2 x max_workers items in flight."""
+    window = max(1, max_workers) * 2
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        pending: deque = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _prepare_allocator(
+    allocator: TaskIdAllocator | None,
+    existing_task_ids: Iterable[str] | None,
+    output_dir: Path,
+) -> TaskIdAllocator:
+    """Allocator whose floor is above every known and on-disk task ID."""
+    allocator = allocator or get_task_id_allocator()
+    allocator.observe(existing_task_ids or ())
+    allocator.observe_dir(output_dir, "TASK-*.md")
+    return allocator
 
-    for finding in eligible[:10]:
-        task = generate_task_from_finding(finding, current_ids)
-        current_ids.add(task.id)
 
-        # Write task file
-        task_path = output_dir / f"{task.id}.md"
-        task_path.write_text(task.to_markdown(), encoding="utf-8")
+def write_task(finding: Finding, output_dir: Path, allocator: TaskIdAllocator) -> TaskEntity:
+    """Generate and write the task for one finding."""
+    task = generate_task_from_finding(finding, set(), task_id=allocator.allocate())
 
-        # Update finding with generated task ID
-        finding.generated_task = task.id
-        generated_tasks.append(task)
+    # Write task file
+    task_path = output_dir / f"{task.id}.md"
+    task_path.write_text(task.to_markdown(), encoding="utf-8")
 
-    return generated_tasks
+    # Update finding with generated task ID
+    finding.generated_task = task.id
+    return task
 
 
-def deduplicate_findings(findings: list[Finding]) -> list[Finding]:
+def deduplicate_findings(
+    findings: list[Finding],
+    mode: str = "exact",
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> list[Finding]:
     """Deduplicate overlapping findings.
 
     Merge findings that reference the same file and have similar issues.
 
+    Modes:
+        exact: merge findings with the same (file, category)
+        similar: additionally merge findings in the same file whose line
+            ranges overlap and whose title/description/suggestion word
+            shingles have Jaccard similarity >= threshold. Candidates come
+            from MinHash LSH buckets, so no all-pairs comparison is made.
+
     Args:
         findings: List of findings from multiple reviews
+        mode: "exact" or "similar"
+        threshold: Jaccard similarity for mode="similar"
 
     Returns:
         Deduplicated list with merged findings
+
+    Raises:
+        ValueError: If mode is unknown
     """
+    if mode not in ("exact", "similar"):
+        raise ValueError(f"Unknown dedup mode {mode!r}, expected 'exact' or 'similar'")
+
     # Group by (file, category)
-    groups: dict[tuple[str, str], list[Finding]] = {}
+    groups: dict[tuple[str, str], list[int]] = {}
 
-    for finding in findings:
+    for i, finding in enumerate(findings):
         key = (finding.file, finding.category)
         if key not in groups:
             groups[key] = []
-        groups[key].append(finding)
+        groups[key].append(i)
+
+    # Union-find over finding indexes; exact groups are merged up front
+    parent = list(range(len(findings)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for members in groups.values():
+        for i in members[1:]:
+            parent[find(i)] = find(members[0])
+
+    if mode == "similar":
+        _merge_similar(findings, threshold, find, parent)
+
+    clusters: dict[int, list[Finding]] = {}
+    for i, finding in enumerate(findings):
+        clusters.setdefault(find(i), []).append(finding)
 
     # Merge groups
     unique: list[Finding] = []
 
-    for key, group in groups.items():
+    for group in clusters.values():
         if len(group) == 1:
             unique.append(group[0])
         else:
@@ -365,13 +625,41 @@ def deduplicate_findings(findings: list[Finding]) -> list[Finding]:
     return unique
 
 
+def _merge_similar(
+    findings: list[Finding],
+    threshold: float,
+    find: Callable[[int], int],
+    parent: list[int],
+) -> None:
+    """Union near-duplicate findings (same file, overlapping lines)."""
+    index = LSHIndex(threshold)
+    sets = [shingles(f.text) for f in findings]
+    for i, finding in enumerate(findings):
+        index.add(i, sets[i], scope=finding.file)
+
+    for a, b in index.candidates():
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b:
+            continue
+        if not _lines_overlap(findings[a].line_span, findings[b].line_span):
+            continue
+        if jaccard(sets[a], sets[b]) >= threshold:
+            parent[root_b] = root_a
+
+
+def _lines_overlap(a: tuple[int, int] | None, b: tuple[int, int] | None) -> bool:
+    if a is None or b is None:
+        return True  # Whole-file finding
+    return a[0] <= b[1] and b[0] <= a[1]
+
+
 def merge_findings(findings: list[Finding]) -> Finding:
     """Merge multiple findings into one.
 
     Uses highest confidence and priority, combines descriptions.
     """
     # Sort by priority then confidence
-    findings.sort(key=lambda f: (0 if f.priority == "P0" else 1, -f.confidence))
+    findings.sort(key=lambda f: f.rank)
     primary = findings[0]
 
     # Combine descriptions
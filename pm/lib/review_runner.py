@@ -0,0 +1,374 @@
+"""Parallel review runner - fans reviewers out and synthesizes as they land.
+
+Runs the test, value and mlflow reviewers concurrently (at most
+`max_concurrency` at a time) through a pluggable backend, and feeds each
+REVIEW-*.md into incremental synthesis (tasks, summary.json), and
+optionally assignment, as soon as it is written, while the other
+reviewers are still running.
+
+A backend is any callable taking a ReviewJob that writes `job.output`
+(or raises). Two are provided:
+  - CommandBackend: runs an external command per reviewer, e.g. an agent
+    CLI, with {agent}, {review_type}, {branch}, {commit}, {output}
+    placeholders (the Makefile reads it from $REVIEW_COMMAND)
+  - StubBackend: writes canned reviews locally, for tests and dry runs
+
+Usage:
+    runner = ReviewRunner(StubBackend(), task_dir=Path("entities/examples"))
+    for outcome in runner.run(runner.jobs(Path("../reviews/main"), "main", "abc123")):
+        print(outcome.job.agent, outcome.ok, outcome.tasks)
+
+    python3 -m lib.review_runner --review-dir ../reviews/main --backend stub
+
+schema: N/A (core library)
+depends_on:
+  - lib/assignment_algorithm.py
+  - lib/review_generator.py
+  - lib/review_synthesis.py
+depended_by:
+  - Makefile (review-l1-parallel, review-l2-full, review-l3-implement)
+semver: minor
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .assignment_algorithm import AssignmentResult, process_assignments
+from .review_generator import MAX_GENERATED_TASKS
+from .review_synthesis import ReviewSynthesizer
+from .task_ids import TaskIdAllocator
+
+
+# review_type -> reviewer agent (agents/*.md)
+REVIEWERS: dict[str, str] = {
+    "test": "test-reviewer",
+    "value": "value-reviewer",
+    "mlflow": "mlflow-analyzer",
+}
+
+# Reviewers running at once across the whole run
+DEFAULT_CONCURRENCY = 3
+
+# Seconds a CommandBackend reviewer may run
+DEFAULT_TIMEOUT = 1800
+
+
+@dataclass
+class ReviewJob:
+    """One reviewer run and where its review must be written."""
+    review_type: str
+    agent: str
+    branch: str
+    commit: str
+    output: Path
+
+    @property
+    def id(self) -> str:
+        return f"REVIEW-{self.review_type}-{self.commit}"
+
+
+@dataclass
+class ReviewOutcome:
+    """Result of one reviewer, after its review was synthesized."""
+    job: ReviewJob
+    ok: bool
+    elapsed: float  # Seconds the backend took
+    error: str = ""
+    tasks: list[str] = field(default_factory=list)  # Task IDs generated from it
+    assignments: AssignmentResult | None = None  # Refreshed assignments, if any
+
+
+ReviewBackend = Callable[[ReviewJob], None]
+
+
+class CommandBackend:
+    """Runs an external command per reviewer.
+
+    The command is split like a shell command line and each argument is
+    formatted with the job's fields, so values are never shell-expanded:
+
+        CommandBackend("review-agent --agent {agent} --out {output}")
+
+    Args:
+        command: Command template
+        timeout: Seconds before a reviewer is killed
+        cwd: Working directory (default: the PM root)
+
+    Raises (per call):
+        RuntimeError: If the command exits non-zero
+        subprocess.TimeoutExpired: If it runs longer than timeout
+    """
+
+    def __init__(self, command: str, timeout: float | None = DEFAULT_TIMEOUT, cwd: Path | None = None):
+        self.argv = shlex.split(command)
+        if not self.argv:
+            raise ValueError("empty review command")
+        self.timeout = timeout
+        self.cwd = cwd or Path(__file__).parent.parent
+
+    def __call__(self, job: ReviewJob) -> None:
+        fields = {
+            "agent": job.agent,
+            "review_type": job.review_type,
+            "branch": job.branch,
+            "commit": job.commit,
+            "output": str(job.output),
+        }
+        result = subprocess.run(
+            [arg.format(**fields) for arg in self.argv],
+            cwd=self.cwd,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+        )
+        if result.returncode != 0:
+            detail = (result.stderr or result.stdout).strip().splitlines()[-1:]
+            message = f"{job.agent} exited {result.returncode}"
+            raise RuntimeError(f"{message}: {detail[0]}" if detail else message)
+
+
+class StubBackend:
+    """Writes canned reviews locally instead of running a reviewer.
+
+    Args:
+        findings: review_type -> findings (review schema dicts); none by default
+        delay: Seconds to sleep per review, or review_type -> seconds
+    """
+
+    def __init__(
+        self,
+        findings: dict[str, list[dict[str, Any]]] | None = None,
+        delay: float | dict[str, float] = 0.0,
+    ):
+        self.findings = findings or {}
+        self.delay = delay
+
+    def __call__(self, job: ReviewJob) -> None:
+        delay = self.delay.get(job.review_type, 0.0) if isinstance(self.delay, dict) else self.delay
+        if delay > 0:
+            time.sleep(delay)
+
+        findings = self.findings.get(job.review_type, [])
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        payload = json.dumps({"findings": findings}, indent=2)
+        job.output.parent.mkdir(parents=True, exist_ok=True)
+        job.output.write_text(f'''---
+id: "{job.id}"
+version: "1.0.0"
+type: review
+status: completed
+created: {now}
+updated: {now}
+
+branch: "{job.branch}"
+commit: "{job.commit}"
+
+reviewer_agent: "{job.agent}"
+review_type: {job.review_type}
+
+findings_count: {len(findings)}
+---
+
+# Stub {job.review_type} review
+
+```json
+{payload}
+```
+''', encoding="utf-8")
+
+
+class ReviewRunner:
+    """Runs reviewers concurrently and synthesizes each review as it lands.
+
+    Reviewers run on a pool of `max_concurrency` threads (each backend
+    call typically waits on a subprocess). Synthesis happens on the
+    consuming thread, one review at a time, so task IDs and the
+    assignments file are never written concurrently.
+
+    Args:
+        backend: Callable that produces a review for a ReviewJob
+        max_concurrency: Reviewers running at once
+        task_dir: Where to write generated tasks (None = no synthesis)
+        assignments_path: Where to write assignments.json after new tasks
+            (None = no assignment; requires task_dir)
+        allocator: Task ID allocator (default: the shared one)
+        limit: Maximum tasks generated by one run. Each landed review
+            gets an even share of what is left (the last one gets the
+            rest), and each sync picks the best taskless eligible findings
+            of the whole manifest, so a slow reviewer's P0 is never
+            starved by an earlier reviewer's P1s
+    """
+
+    def __init__(
+        self,
+        backend: ReviewBackend,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        task_dir: Path | None = None,
+        assignments_path: Path | None = None,
+        allocator: TaskIdAllocator | None = None,
+        limit: int = MAX_GENERATED_TASKS,
+    ):
+        self.backend = backend
+        self.max_concurrency = max(1, max_concurrency)
+        self.task_dir = task_dir
+        self.assignments_path = assignments_path
+        self.allocator = allocator
+        self.limit = limit
+        self._synthesizers: dict[Path, ReviewSynthesizer] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def jobs(
+        review_dir: Path,
+        branch: str,
+        commit: str,
+        reviewers: Iterable[str] = REVIEWERS,
+    ) -> list[ReviewJob]:
+        """One job per review type, writing REVIEW-{type}-{commit}.md.
+
+        Raises:
+            ValueError: For an unknown review type
+        """
+        jobs = []
+        for review_type in reviewers:
+            if review_type not in REVIEWERS:
+                raise ValueError(
+                    f"unknown reviewer {review_type!r} (expected one of {', '.join(REVIEWERS)})"
+                )
+            jobs.append(ReviewJob(
+                review_type=review_type,
+                agent=REVIEWERS[review_type],
+                branch=branch,
+                commit=commit,
+                output=review_dir / f"REVIEW-{review_type}-{commit}.md",
+            ))
+        return jobs
+
+    def run(self, jobs: Iterable[ReviewJob]) -> Iterator[ReviewOutcome]:
+        """Run jobs concurrently, yielding each outcome in completion order.
+
+        A failing reviewer yields an outcome with ok=False; the others
+        keep running. Closing the iterator early cancels jobs not yet
+        started.
+        """
+        pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="reviewer")
+        try:
+            futures = [pool.submit(self._review, job) for job in jobs]
+            remaining = self.limit
+            for outstanding, future in zip(range(len(futures), 0, -1), as_completed(futures)):
+                outcome = future.result()
+                if outcome.ok:
+                    share = -(-remaining // outstanding)  # ceil: the last review gets the rest
+                    self._synthesize(outcome, share)
+                    remaining -= len(outcome.tasks)
+                yield outcome
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _review(self, job: ReviewJob) -> ReviewOutcome:
+        start = time.perf_counter()
+        try:
+            job.output.parent.mkdir(parents=True, exist_ok=True)
+            self.backend(job)
+        except Exception as e:
+            return ReviewOutcome(job, False, time.perf_counter() - start, error=str(e) or repr(e))
+
+        elapsed = time.perf_counter() - start
+        if not job.output.is_file():
+            return ReviewOutcome(job, False, elapsed, error=f"no review written to {job.output}")
+        return ReviewOutcome(job, True, elapsed)
+
+    def _synthesize(self, outcome: ReviewOutcome, limit: int) -> None:
+        if self.task_dir is None:
+            return
+        try:
+            with self._lock:
+                review_dir = outcome.job.output.parent
+                synthesizer = self._synthesizers.get(review_dir)
+                if synthesizer is None:
+                    synthesizer = self._synthesizers[review_dir] = ReviewSynthesizer(
+                        review_dir, self.task_dir, allocator=self.allocator
+                    )
+                tasks = synthesizer.sync([outcome.job.output], limit=limit).tasks
+                outcome.tasks = [t.id for t in tasks]
+
+                if tasks and self.assignments_path is not None:
+                    outcome.assignments = process_assignments(
+                        self.task_dir, self.assignments_path, outcome.job.branch
+                    )
+        except Exception as e:
+            outcome.ok = False
+            outcome.error = f"synthesis failed: {e}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--review-dir", type=Path, required=True, help="Where reviews are written")
+    parser.add_argument("--branch", default="main")
+    parser.add_argument("--commit", default="unknown")
+    parser.add_argument("--reviewers", default=",".join(REVIEWERS),
+                        help="Comma-separated review types (default: all)")
+    parser.add_argument("--backend", choices=("command", "stub"), default="command")
+    parser.add_argument("--command", default=os.environ.get("REVIEW_COMMAND", ""),
+                        help="Reviewer command template (default: $REVIEW_COMMAND)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Seconds per reviewer (command backend)")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--tasks-dir", type=Path, help="Generate tasks here as reviews land")
+    parser.add_argument("--assignments", type=Path,
+                        help="Refresh this assignments.json after new tasks (needs --tasks-dir)")
+    parser.add_argument("--limit", type=int, default=MAX_GENERATED_TASKS,
+                        help="Maximum tasks generated by the whole run")
+    args = parser.parse_args(argv)
+
+    if args.assignments and not args.tasks_dir:
+        parser.error("--assignments requires --tasks-dir")
+    if args.backend == "stub":
+        backend: ReviewBackend = StubBackend()
+    elif args.command.strip():
+        backend = CommandBackend(args.command, timeout=args.timeout)
+    else:
+        parser.error("no reviewer command: set REVIEW_COMMAND, pass --command, or use --backend stub")
+
+    reviewers = [r.strip() for r in args.reviewers.split(",") if r.strip()]
+    runner = ReviewRunner(
+        backend, args.max_concurrency, args.tasks_dir, args.assignments, limit=args.limit
+    )
+    try:
+        jobs = runner.jobs(args.review_dir, args.branch, args.commit, reviewers)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"  Running {len(jobs)} reviewer(s), max {runner.max_concurrency} at once...")
+    failed = 0
+    for outcome in runner.run(jobs):
+        name = outcome.job.agent
+        if not outcome.ok:
+            failed += 1
+            print(f"  ✗ {name} ({outcome.elapsed:.1f}s): {outcome.error}")
+            continue
+        print(f"  ✓ {name} ({outcome.elapsed:.1f}s) -> {outcome.job.output}")
+        if outcome.tasks:
+            print(f"    Tasks: {', '.join(outcome.tasks)}")
+        if outcome.assignments is not None:
+            print(f"    Assignments: {args.assignments}")
+            unscheduled = outcome.assignments.stats.get("unscheduled", 0)
+            if unscheduled:
+                print(f"    ⚠ {unscheduled} task(s) on or behind a dependency cycle (last group)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
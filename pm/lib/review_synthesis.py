@@ -0,0 +1,451 @@
+"""Incremental review synthesis - only new or changed reviews are re-read.
+
+A manifest next to the reviews (`synthesis-manifest.json`) records, per
+REVIEW-*.md, its stat tuple and SHA256, the findings it contained and the
+task generated from each. A sync stats every review, hashes only those
+whose stat changed, and parses only those whose content changed; the rest
+cost one stat. `summary.json` is rebuilt from the manifest, never from the
+review files.
+
+Findings are matched across edits of a review by fingerprint (file,
+category, title), so a finding that already has a task keeps it: existing
+TASK-*.md files are never rewritten, and only findings without a task can
+produce new ones (the best `limit` per sync, by priority then confidence).
+Eligible findings that miss the cut stay taskless in the manifest and
+compete again on the next sync, even if their review is unchanged. Tasks
+of findings that disappear are left on disk.
+
+Usage:
+    synthesizer = ReviewSynthesizer(Path("../reviews/main"), Path("entities/examples"))
+    result = synthesizer.sync()      # parses only new/changed reviews
+    result.tasks                     # tasks created by this sync
+
+    python3 -m lib.review_synthesis --review-dir ../reviews/main --tasks-dir entities/examples
+
+schema: N/A (core library)
+depends_on:
+  - lib/frontmatter.py
+  - lib/merkle.py
+  - lib/review_generator.py
+  - lib/task_ids.py
+depended_by:
+  - lib/review_runner.py
+semver: minor
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from .frontmatter import get_body, parse_frontmatter
+from .merkle import stat_key
+from .review_generator import (
+    MAX_GENERATED_TASKS,
+    Finding,
+    Review,
+    TaskEntity,
+    write_task,
+)
+from .task_ids import TaskIdAllocator, get_task_id_allocator
+
+
+MANIFEST_NAME = "synthesis-manifest.json"
+MANIFEST_VERSION = 1
+SUMMARY_NAME = "summary.json"
+
+PRIORITIES = ("P0", "P1", "P2", "P3")
+
+
+def fingerprint(finding: Finding) -> str:
+    """Identity of a finding across edits of its review."""
+    key = "\0".join((finding.file, finding.category, finding.title.strip().lower()))
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+@dataclass
+class SynthesisManifest:
+    """review file name -> {stat, sha256, review, findings}, persisted as JSON."""
+
+    path: Path
+    reviews: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "SynthesisManifest":
+        """Load the manifest, returning an empty one if missing or invalid."""
+        manifest = cls(path=path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+
+        if data.get("version") != MANIFEST_VERSION:
+            return manifest
+        manifest.reviews = data.get("reviews", {})
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically (compact JSON)."""
+        data = {"version": MANIFEST_VERSION, "reviews": self.reviews}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+
+    @property
+    def task_ids(self) -> set[str]:
+        """Every task ID recorded in the manifest."""
+        return {
+            f["task"] for entry in self.reviews.values()
+            for f in entry["findings"] if f.get("task")
+        }
+
+
+@dataclass
+class SynthesisResult:
+    """What one sync did."""
+    added: list[str] = field(default_factory=list)  # Review files seen for the first time
+    changed: list[str] = field(default_factory=list)  # Content changed, re-parsed
+    removed: list[str] = field(default_factory=list)  # Gone from the directory
+    unchanged: int = 0  # Skipped without parsing
+    tasks: list[TaskEntity] = field(default_factory=list)  # Created by this sync
+    summary: dict[str, Any] = field(default_factory=dict)  # Empty if not rewritten
+
+    @property
+    def parsed(self) -> int:
+        return len(self.added) + len(self.changed)
+
+
+class ReviewSynthesizer:
+    """Keeps tasks and summary.json in step with a branch's review directory.
+
+    Args:
+        review_dir: Directory containing REVIEW-*.md files
+        output_dir: Directory to write generated TASK-*.md files
+        manifest_path: Manifest location (default: review_dir/synthesis-manifest.json)
+        allocator: Task ID allocator (default: the shared one)
+    """
+
+    def __init__(
+        self,
+        review_dir: Path,
+        output_dir: Path,
+        manifest_path: Path | None = None,
+        allocator: TaskIdAllocator | None = None,
+    ):
+        self.review_dir = Path(review_dir)
+        self.output_dir = Path(output_dir)
+        self.manifest = SynthesisManifest.load(manifest_path or self.review_dir / MANIFEST_NAME)
+        self.allocator = allocator
+
+    def sync(
+        self,
+        paths: Iterable[Path] | None = None,
+        limit: int = MAX_GENERATED_TASKS,
+        existing_task_ids: set[str] | None = None,
+    ) -> SynthesisResult:
+        """Bring the manifest, tasks and summary.json up to date.
+
+        Args:
+            paths: Only look at these review files (default: every
+                REVIEW-*.md in review_dir, and forget deleted ones)
+            limit: Maximum new tasks created by this sync
+            existing_task_ids: Task IDs that must not be reused
+
+        Returns:
+            SynthesisResult
+        """
+        result = SynthesisResult()
+        reviews = self.manifest.reviews
+        full_scan = paths is None
+        if full_scan:
+            paths = [
+                Path(entry.path) for entry in os.scandir(self.review_dir)
+                if entry.name.startswith("REVIEW-") and entry.name.endswith(".md")
+                and entry.is_file()
+            ] if self.review_dir.is_dir() else []
+
+        seen: set[str] = set()
+        touched = False  # Stat changed without a content change
+        parsed: dict[int, Finding] = {}  # id(record) -> finding, for reviews parsed now
+        for path in sorted(Path(p) for p in paths):
+            name = path.name
+            seen.add(name)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+
+            entry = reviews.get(name)
+            key = list(stat_key(st))
+            if entry is not None and entry["stat"] == key:
+                result.unchanged += 1
+                continue
+
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is not None and entry["sha256"] == digest:
+                entry["stat"] = key
+                touched = True
+                result.unchanged += 1
+                continue
+
+            (result.changed if entry is not None else result.added).append(name)
+            content = raw.decode("utf-8", errors="ignore")
+            review = Review.from_parts(path, parse_frontmatter(content), get_body(content))
+            previous = {f["fingerprint"]: f.get("task") for f in entry["findings"]} if entry else {}
+            reviews[name] = {
+                "stat": key,
+                "sha256": digest,
+                "mtime_ns": st.st_mtime_ns,
+                "review": _review_info(review),
+                "findings": [],
+            }
+            for finding in review.findings:
+                record = _finding_record(finding)
+                record["task"] = previous.get(record["fingerprint"])
+                reviews[name]["findings"].append(record)
+                parsed[id(record)] = finding
+
+        if full_scan:
+            result.removed = sorted(name for name in reviews if name not in seen)
+            for name in result.removed:
+                del reviews[name]
+
+        # Taskless eligible findings of every review, not just those parsed now,
+        # so findings cut by an earlier limit still get their turn
+        pending = [
+            (name, record, parsed.get(id(record)))
+            for name in sorted(reviews)
+            for record in reviews[name]["findings"]
+            if record["eligible"] and record.get("task") is None
+        ]
+        if pending:
+            result.tasks = self._create_tasks(pending, limit, existing_task_ids)
+
+        if result.parsed or result.removed or result.tasks or not self.summary_path.exists():
+            self.manifest.save()
+            result.summary = self.write_summary()
+        elif touched:
+            self.manifest.save()
+        return result
+
+    def _create_tasks(
+        self,
+        pending: list[tuple[str, dict[str, Any], Finding | None]],
+        limit: int,
+        existing_task_ids: set[str] | None,
+    ) -> list[TaskEntity]:
+        """Write tasks for the best `limit` of (review name, record, finding).
+
+        Findings of reviews not parsed by this sync (finding None) are
+        ranked from their records; only the reviews owning selected ones
+        are read again.
+        """
+        if limit <= 0:
+            return []
+        # Stable, like top_findings: ties keep manifest order
+        best = heapq.nsmallest(limit, pending, key=lambda item: _record_rank(item[1]))
+        selected = self._resolve(best)
+        if not selected:
+            return []
+
+        allocator = self.allocator or get_task_id_allocator()
+        allocator.observe(existing_task_ids or ())
+        allocator.observe(self.manifest.task_ids)
+        allocator.observe_dir(self.output_dir, "TASK-*.md")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        tasks = []
+        allocator.reserve(len(selected))
+        try:
+            for record, finding in selected:
+                task = write_task(finding, self.output_dir, allocator)
+                record["task"] = task.id
+                tasks.append(task)
+        finally:
+            allocator.release()
+        return tasks
+
+    def _resolve(
+        self, items: list[tuple[str, dict[str, Any], Finding | None]]
+    ) -> list[tuple[dict[str, Any], Finding]]:
+        """Pair each record with its Finding, re-reading reviews as needed.
+
+        Records whose finding can no longer be found (review unreadable or
+        edited outside this sync's paths) are dropped and stay taskless.
+        """
+        by_review: dict[str, dict[str, list[Finding]]] = {}
+        resolved = []
+        for name, record, finding in items:
+            if finding is None:
+                if name not in by_review:
+                    by_review[name] = {}
+                    try:
+                        review = Review.read(self.review_dir / name)
+                    except (OSError, ValueError):
+                        review = None
+                    for f in review.findings if review else ():
+                        by_review[name].setdefault(fingerprint(f), []).append(f)
+                matches = by_review[name].get(record["fingerprint"])
+                if not matches:
+                    continue
+                finding = matches.pop(0)
+            resolved.append((record, finding))
+        return resolved
+
+    @property
+    def summary_path(self) -> Path:
+        return self.review_dir / SUMMARY_NAME
+
+    def build_summary(self) -> dict[str, Any]:
+        """summary.json contents, computed from the manifest alone."""
+        entries = sorted(self.manifest.reviews.values(), key=lambda e: e["mtime_ns"])
+        latest = entries[-1]["review"] if entries else {}
+        findings = [(e["review"]["id"], f) for e in entries for f in e["findings"]]
+
+        # Exact duplicates: same file and category (deduplicate_findings' default)
+        groups: dict[tuple[str, str], list[tuple[str, dict[str, Any]]]] = {}
+        for review_id, f in findings:
+            groups.setdefault((f["file"], f["category"]), []).append((review_id, f))
+
+        files: dict[str, list[dict[str, Any]]] = {}
+        for _, f in findings:
+            if f["file"]:
+                files.setdefault(f["file"], []).append(f)
+
+        tasks = [
+            {
+                "task_id": f["task"],
+                "source_review": review_id,
+                "source_finding": f["id"],
+                "priority": f["priority"],
+                "confidence": f["confidence"],
+                "title": f"Fix {f['category']}: {f['title']}",
+            }
+            for review_id, f in findings if f.get("task")
+        ]
+
+        return {
+            "branch": latest.get("branch", ""),
+            "commit": latest.get("commit", ""),
+            "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "reviews": [e["review"] for e in entries],
+            "aggregated": {
+                "total_findings": len(findings),
+                "unique_findings": len(groups),
+                "merged_count": len(findings) - len(groups),
+                **_priority_counts(f for _, f in findings),
+            },
+            "task_generation": {
+                "eligible_findings": sum(1 for _, f in findings if f["eligible"]),
+                "tasks_created": len(tasks),
+                "tasks": tasks,
+            },
+            "files_affected": [
+                {
+                    "path": path,
+                    "finding_count": len(group),
+                    "highest_priority": min(
+                        (f["priority"] for f in group),
+                        key=lambda p: PRIORITIES.index(p) if p in PRIORITIES else len(PRIORITIES),
+                    ),
+                }
+                for path, group in sorted(files.items())
+            ],
+            "deduplication_log": [
+                {
+                    "merged_into": group[0][1]["id"],
+                    "merged_from": [f"{review_id}:{f['id']}" for review_id, f in group],
+                    "reason": "Same file and category",
+                }
+                for group in groups.values() if len(group) > 1
+            ],
+        }
+
+    def write_summary(self) -> dict[str, Any]:
+        """Rebuild and write summary.json; returns its contents."""
+        summary = self.build_summary()
+        tmp = self.summary_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        tmp.replace(self.summary_path)
+        return summary
+
+
+def _review_info(review: Review) -> dict[str, Any]:
+    return {
+        "id": review.id,
+        "type": review.review_type,
+        "branch": review.branch,
+        "commit": review.commit,
+        "findings_count": len(review.findings),
+        **{k: v for k, v in _priority_counts(vars(f) for f in review.findings).items()
+           if k != "p3_count"},
+    }
+
+
+def _record_rank(record: dict[str, Any]) -> tuple[int, int]:
+    """Finding.rank computed from a manifest record."""
+    return (0 if record["priority"] == "P0" else 1, -record["confidence"])
+
+
+def _finding_record(finding: Finding) -> dict[str, Any]:
+    return {
+        "id": finding.id,
+        "fingerprint": fingerprint(finding),
+        "priority": finding.priority,
+        "confidence": finding.confidence,
+        "category": finding.category,
+        "file": finding.file,
+        "title": finding.title,
+        "eligible": finding.is_task_eligible,
+    }
+
+
+def _priority_counts(findings: Iterable[dict[str, Any]]) -> dict[str, int]:
+    counts = {f"{p.lower()}_count": 0 for p in PRIORITIES}
+    for f in findings:
+        key = f"{str(f['priority']).lower()}_count"
+        if key in counts:
+            counts[key] += 1
+    return counts
+
+
+def synthesize_reviews(
+    review_dir: Path,
+    output_dir: Path,
+    existing_task_ids: set[str] | None = None,
+    limit: int = MAX_GENERATED_TASKS,
+) -> SynthesisResult:
+    """Sync a review directory's tasks and summary.json (see ReviewSynthesizer)."""
+    return ReviewSynthesizer(review_dir, output_dir).sync(
+        limit=limit, existing_task_ids=existing_task_ids
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--review-dir", type=Path, required=True)
+    parser.add_argument("--tasks-dir", type=Path, required=True)
+    parser.add_argument("--limit", type=int, default=MAX_GENERATED_TASKS,
+                        help="Maximum new tasks")
+    args = parser.parse_args(argv)
+
+    result = synthesize_reviews(args.review_dir, args.tasks_dir, limit=args.limit)
+    print(f"  Reviews: {len(result.added)} new, {len(result.changed)} changed, "
+          f"{len(result.removed)} removed, {result.unchanged} unchanged")
+    if result.tasks:
+        print(f"  Tasks: {', '.join(t.id for t in result.tasks)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
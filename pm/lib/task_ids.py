@@ -0,0 +1,229 @@
+"""Task ID allocator - collision-free TASK-NNN numbers across processes.
+
+A counter per ID prefix lives in a small sqlite database under `.index/`.
+Numbers are claimed in blocks inside an immediate (write-locked)
+transaction, so review pipelines running in parallel never hand out the
+same ID, and handing out an ID from a claimed block is O(1).
+
+The counter never goes below a caller-supplied floor (the highest ID
+already on disk), so a fresh or deleted database picks up after existing
+tasks instead of reusing their numbers. Unused numbers of a block are
+given back on `release()` when no other process has claimed past them;
+otherwise they are skipped (IDs may have gaps, never duplicates).
+
+Usage:
+    allocator = get_task_id_allocator()
+    allocator.observe(existing_ids)     # raise the floor once
+    allocator.reserve(5)                # claim a block for the next 5 IDs
+    task_id = allocator.allocate()      # "TASK-101"
+
+schema: N/A (core library)
+depends_on: []
+depended_by:
+  - lib/review_generator.py
+  - lib/review_runner.py
+semver: minor
+"""
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable
+
+
+DEFAULT_ALLOCATOR_PATH = Path(__file__).parent.parent / ".index" / "task-ids.sqlite"
+
+# First review-generated task is TASK-101
+DEFAULT_START = 101
+
+# Numbers claimed per round trip when the caller doesn't say how many it needs
+BATCH_SIZE = 16
+
+
+class TaskIdAllocator:
+    """Hands out PREFIX-NNN IDs from blocks claimed in a shared counter.
+
+    If the database can't be opened or written (read-only checkout,
+    corrupt file) the allocator falls back to an in-process counter above
+    the floor: IDs stay unique within the process, as before, but are no
+    longer coordinated with other processes. `shared` tells which mode is
+    active.
+
+    Args:
+        path: sqlite database holding the counters
+        prefix: ID prefix ("TASK" -> "TASK-101")
+        start: First number handed out for a new prefix
+        batch: Default block size for implicit reservations
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_ALLOCATOR_PATH,
+        prefix: str = "TASK",
+        start: int = DEFAULT_START,
+        batch: int = BATCH_SIZE,
+    ):
+        self.path = Path(path)
+        self.prefix = prefix
+        self.start = start
+        self.batch = max(1, batch)
+        self._id_re = re.compile(rf"{re.escape(prefix)}-(\d+)")
+        self._floor = start - 1  # Highest number known to be taken on disk
+        self._next = self._end = 0  # Current block [_next, _end)
+        self._local_next = start  # Counter used when the database is unavailable
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._lock = threading.RLock()
+
+    @property
+    def shared(self) -> bool:
+        """Whether IDs are coordinated through the database."""
+        with self._lock:
+            return self._connect() is not None
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode; transactions are explicit BEGIN IMMEDIATE
+            conn = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sequences "
+                "(prefix TEXT PRIMARY KEY, next INTEGER NOT NULL)"
+            )
+        except (OSError, sqlite3.Error):
+            self._disabled = True
+            return None
+
+        self._conn = conn
+        return conn
+
+    def observe(self, ids: Iterable[str]) -> int:
+        """Raise the floor above every matching ID in `ids`.
+
+        Returns:
+            The new floor (highest number known to be taken)
+        """
+        match = self._id_re.fullmatch
+        numbers = (int(m.group(1)) for m in map(match, ids) if m)
+        with self._lock:
+            self._floor = max(self._floor, max(numbers, default=self._floor))
+            return self._floor
+
+    def observe_dir(self, directory: Path | str, pattern: str = "*.md") -> int:
+        """Raise the floor above the IDs of files named like PREFIX-NNN.md."""
+        directory = Path(directory)
+        if not directory.is_dir():
+            return self._floor
+        return self.observe(path.stem for path in directory.glob(pattern))
+
+    def reserve(self, count: int) -> range:
+        """Claim the next `count` numbers as this allocator's current block.
+
+        Any unused part of the previous block is released first.
+
+        Returns:
+            The claimed numbers
+        """
+        count = max(1, count)
+        with self._lock:
+            self.release()
+            first = self._claim(count)
+            self._next, self._end = first, first + count
+            return range(first, first + count)
+
+    def _claim(self, count: int) -> int:
+        conn = self._connect()
+        if conn is not None:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT next FROM sequences WHERE prefix = ?", (self.prefix,)
+                    ).fetchone()
+                    first = max(row[0] if row else self.start, self._floor + 1)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO sequences (prefix, next) VALUES (?, ?)",
+                        (self.prefix, first + count),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                return first
+            except sqlite3.Error:
+                self._disabled = True
+                self._conn = None
+                conn.close()
+
+        first = max(self._local_next, self._floor + 1)
+        self._local_next = first + count
+        return first
+
+    def allocate(self) -> str:
+        """Next ID from the current block, claiming a new block when empty."""
+        with self._lock:
+            # Skip numbers observed on disk after the block was claimed
+            self._next = max(self._next, min(self._floor + 1, self._end))
+            if self._next >= self._end:
+                self.reserve(self.batch)
+            number = self._next
+            self._next += 1
+            return f"{self.prefix}-{number}"
+
+    def allocate_many(self, count: int) -> list[str]:
+        """`count` IDs claimed in a single round trip."""
+        if count <= 0:
+            return []
+        with self._lock:
+            if self._end - self._next < count:
+                self.reserve(count)
+            return [self.allocate() for _ in range(count)]
+
+    def release(self) -> None:
+        """Give back the unused tail of the current block, if still possible.
+
+        The counter is only rolled back when nobody has claimed past this
+        block in the meantime; otherwise the numbers are skipped.
+        """
+        with self._lock:
+            if self._next >= self._end:
+                return
+            start, end = self._next, self._end
+            self._next = self._end = 0
+            conn = self._connect()
+            if conn is None:
+                if self._local_next == end:
+                    self._local_next = start
+                return
+            try:
+                conn.execute(
+                    "UPDATE sequences SET next = ? WHERE prefix = ? AND next = ?",
+                    (start, self.prefix, end),
+                )
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        """Release the current block and close the database."""
+        with self._lock:
+            self.release()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_allocator: TaskIdAllocator | None = None
+
+
+def get_task_id_allocator() -> TaskIdAllocator:
+    """Get the process-wide TASK ID allocator (.index/task-ids.sqlite)."""
+    global _allocator
+    if _allocator is None:
+        _allocator = TaskIdAllocator()
+    return _allocator
@@ -11,14 +11,40 @@ Usage with Agent SDK:
     tools = PMTools(project_root)
     result = tools.l0_test()
     result = tools.l2_pr_open()
+
+Execution order for index and file tools (lint, hash, frontmatter, arch,
+index): in-process native call, then the index daemon (`make indexd`) if
+running, then `make` as the fallback.
+
+Single-file reads (lint, hash, frontmatter) are memoized in
+`lib.result_cache` by (tool, file, the file's stat, code fingerprint);
+cache hits have `ToolResult.cached` set. Tools that run make or rewrite
+files (test, arch, index, validate) always run.
+
+For long L2/L3 pipelines with streamed output, progress and cancellation,
+see `lib.async_tools.AsyncPMTools`.
 """
 
 import subprocess
 import json
-from dataclasses import dataclass
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
+from . import indexd
+from .architecture import write_architecture
+from .frontmatter import parse_file
+from .index_builder import refresh_index, write_agent_summary
+from .merkle import digest_file, stat_key
+from .parse_cache import ParseCache
+from .result_cache import ResultCache, cache_key, code_fingerprint
+from .validators import ValidationError, validate_entity
+
 
 @dataclass
 class ToolResult:
@@ -28,6 +54,50 @@ class ToolResult:
     level: int
     tool: str
     tokens_approx: int  # Approximate output tokens
+    cached: bool = False  # Served from the result cache
+
+
+# Default worker pool size for PMTools.parallel
+MAX_PARALLEL_TOOLS = 4
+
+# Seconds before a single make invocation is killed
+MAKE_TIMEOUT = 30
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    """Kill a tool subprocess and everything it spawned (make, recipes)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+@dataclass
+class _Call:
+    """Subprocesses started by one PMTools.parallel call, killed on timeout."""
+
+    procs: list[subprocess.Popen] = field(default_factory=list)
+    cancelled: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, proc: subprocess.Popen) -> None:
+        with self.lock:
+            self.procs.append(proc)
+            if self.cancelled:
+                _kill(proc)
+
+    def cancel(self) -> None:
+        with self.lock:
+            self.cancelled = True
+            for proc in self.procs:
+                _kill(proc)
+
+
+def _tool_identity(tool: Callable[[], ToolResult]) -> tuple[int, str]:
+    """Best-effort (level, name) for a tool callable, e.g. l1_validate -> (1, "l1-validate")."""
+    name = getattr(tool, "__name__", "tool")
+    level = int(name[1]) if len(name) > 2 and name[0] == "l" and name[1].isdigit() else -1
+    return level, name.replace("_", "-")
 
 
 class PMTools:
@@ -37,23 +107,49 @@ class PMTools:
     Latency-optimized: Higher levels parallelize where possible.
     """
 
-    def __init__(self, project_root: Path | str = None):
+    def __init__(
+        self,
+        project_root: Path | str = None,
+        use_daemon: bool = True,
+        max_workers: int = MAX_PARALLEL_TOOLS,
+        native: bool = True,
+        use_cache: bool = True,
+    ):
         self.root = Path(project_root) if project_root else Path(__file__).parent.parent
+        self.use_daemon = use_daemon
+        self.max_workers = max_workers
+        self.native = native
+        self._parse_cache = ParseCache(self.root / ".index" / "parse-cache.sqlite")
+        self.cache = ResultCache(self.root / ".index" / "tool-cache.sqlite") if use_cache else None
+        self._local = threading.local()  # .call: _Call of the running parallel() call
 
     def _run(self, cmd: str, level: int, tool: str) -> ToolResult:
         """Execute command and return structured result."""
         try:
-            result = subprocess.run(
+            # Own process group, so a timeout kills make's children too
+            proc = subprocess.Popen(
                 cmd,
                 shell=True,
                 cwd=self.root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=30
+                start_new_session=True,
             )
-            output = result.stdout.strip() or result.stderr.strip()
+            call = getattr(self._local, "call", None)
+            if call is not None:
+                call.add(proc)
+            try:
+                stdout, stderr = proc.communicate(timeout=MAKE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                _kill(proc)
+                proc.communicate()
+                raise
+            if call is not None and call.cancelled:
+                return ToolResult(False, "timeout", level, tool, 1)
+            output = stdout.strip() or stderr.strip()
             return ToolResult(
-                success=result.returncode == 0,
+                success=proc.returncode == 0,
                 output=output[:500],  # Cap output for token efficiency
                 level=level,
                 tool=tool,
@@ -64,6 +160,77 @@ class PMTools:
         except Exception as e:
             return ToolResult(False, str(e)[:100], level, tool, 10)
 
+    def _daemon(self, cmd: str, level: int, tool: str, **args: Any) -> ToolResult | None:
+        """Answer from a running index daemon, or None if there isn't one."""
+        if not self.use_daemon:
+            return None
+        response = indexd.query(cmd, self.root / ".index" / "indexd.sock", **args)
+        if response is None:
+            return None
+        output = str(response["output"])
+        return ToolResult(
+            success=response["ok"],
+            output=output[:500],
+            level=level,
+            tool=tool,
+            tokens_approx=len(output.split())
+        )
+
+    def _native(self, fn: Callable[[], str], level: int, tool: str) -> ToolResult | None:
+        """Run a tool in-process, or None to fall back to daemon/make.
+
+        Only environment problems (a missing module, an unreadable file)
+        fall back. Any other exception is a bug in the in-process path and
+        is returned as a failed result rather than hidden by the fallback.
+        """
+        if not self.native:
+            return None
+        try:
+            output = fn()
+        except (ImportError, OSError):
+            return None
+        except Exception as e:
+            output = f"{tool} failed in-process: {type(e).__name__}: {e}"
+            return ToolResult(False, output[:500], level, tool, len(output.split()))
+        return ToolResult(
+            success=True,
+            output=output[:500],
+            level=level,
+            tool=tool,
+            tokens_approx=len(output.split())
+        )
+
+    def _file_state(self, file: str) -> tuple[int, int, int] | None:
+        """Stat tuple of a tool's target file, or None if it can't be read."""
+        try:
+            return stat_key(self._path(file).stat())
+        except OSError:
+            return None
+
+    def _cached(self, tool: str, file: str, fn: Callable[[], ToolResult]) -> ToolResult:
+        """Memoize a single-file read by (tool, file, file stat, code fingerprint).
+
+        Only for tools whose output depends on nothing but the file and
+        the code behind them, and which change nothing. One stat of the
+        target plus a stat of the tool code per call; no tree walk.
+        Only successful results are stored.
+        """
+        if self.cache is None:
+            return fn()
+        state = self._file_state(file)
+        if state is None:
+            return fn()
+
+        key = cache_key(tool, {"file": file, "stat": state}, code_fingerprint(self.root))
+        hit = self.cache.get(key)
+        if hit is not None:
+            return ToolResult(**{**hit, "cached": True})
+
+        result = fn()
+        if result.success:
+            self.cache.put(key, asdict(result))
+        return result
+
     def _make(self, target: str, level: int, **kwargs) -> ToolResult:
         """Run make target with optional args."""
         args = " ".join(f"{k}={v}" for k, v in kwargs.items())
@@ -80,15 +247,22 @@ class PMTools:
 
     def l0_arch(self) -> ToolResult:
         """Generate architecture. ~30 tokens output."""
-        return self._make("l0-arch", 0)
+        return (self._native(self._native_arch, 0, "l0-arch")
+                or self._make("l0-arch", 0))
 
     def l0_lint(self, file: str) -> ToolResult:
         """Lint single file. ~5 tokens output."""
-        return self._make("l0-lint", 0, FILE=file)
+        return self._cached("l0-lint", file, lambda: (
+            self._native(lambda: self._native_lint(file), 0, "l0-lint")
+            or self._daemon("lint", 0, "l0-lint", file=file)
+            or self._make("l0-lint", 0, FILE=file)))
 
     def l0_hash(self, file: str) -> ToolResult:
         """Get file hash. ~20 tokens output."""
-        return self._make("l0-hash", 0, FILE=file)
+        return self._cached("l0-hash", file, lambda: (
+            self._native(lambda: self._native_hash(file), 0, "l0-hash")
+            or self._daemon("hash", 0, "l0-hash", file=file)
+            or self._make("l0-hash", 0, FILE=file)))
 
     def l0_commit_check(self) -> ToolResult:
         """Check commit message. ~5 tokens output."""
@@ -96,7 +270,10 @@ class PMTools:
 
     def l0_frontmatter(self, file: str) -> ToolResult:
         """Extract frontmatter. ~50 tokens output."""
-        return self._make("l0-frontmatter", 0, FILE=file)
+        return self._cached("l0-frontmatter", file, lambda: (
+            self._native(lambda: self._native_frontmatter(file), 0, "l0-frontmatter")
+            or self._daemon("frontmatter", 0, "l0-frontmatter", file=file)
+            or self._make("l0-frontmatter", 0, FILE=file)))
 
     # =========================================================================
     # LEVEL 1: COMPOSED
@@ -104,7 +281,9 @@ class PMTools:
 
     def l1_index(self) -> ToolResult:
         """Check and regenerate index. ~30 tokens output."""
-        return self._make("l1-index", 1)
+        return (self._native(self._native_index, 1, "l1-index")
+                or self._daemon("index", 1, "l1-index")
+                or self._make("l1-index", 1))
 
     def l1_validate(self) -> ToolResult:
         """Run tests + check index. ~60 tokens output."""
@@ -150,6 +329,37 @@ class PMTools:
         """Full pipeline with release. ~400 tokens output."""
         return self._make("l3-full", 3)
 
+    # =========================================================================
+    # NATIVE IMPLEMENTATIONS (same output as the Makefile targets)
+    # =========================================================================
+
+    def _path(self, file: str) -> Path:
+        path = Path(file)
+        return path if path.is_absolute() else self.root / path
+
+    def _native_lint(self, file: str) -> str:
+        try:
+            validate_entity(self._path(file), self._parse_cache)
+        except (ValidationError, OSError):
+            return f"✗ {file}"
+        return "✓"
+
+    def _native_hash(self, file: str) -> str:
+        path = self._path(file)
+        return digest_file(path).sha256[:16] if path.exists() else "not-found"
+
+    def _native_frontmatter(self, file: str) -> str:
+        return json.dumps(parse_file(self._path(file), self._parse_cache), indent=2)
+
+    def _native_arch(self) -> str:
+        return "\n".join(write_architecture(self.root)[-3:])
+
+    def _native_index(self) -> str:
+        result = refresh_index(self.root, parse_cache=self._parse_cache)
+        if result.changed:
+            write_agent_summary(self.root)
+        return result.summary()
+
     # =========================================================================
     # CHAINING HELPERS
     # =========================================================================
@@ -168,12 +378,75 @@ class PMTools:
                 break
         return results
 
-    def parallel(self, *tools: Callable[[], ToolResult]) -> list[ToolResult]:
-        """Execute tools in parallel (future: actual parallelism).
+    def parallel(
+        self,
+        *tools: Callable[[], ToolResult],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ) -> list[ToolResult]:
+        """Execute tools concurrently, return results in submission order.
+
+        Latency is the slowest tool rather than the sum. Tools run on a
+        bounded thread pool (each L0+ tool is a subprocess, so threads
+        are enough).
+
+        Args:
+            *tools: Zero-argument tool callables
+            max_workers: Pool size (defaults to self.max_workers)
+            timeout: Per-call timeout in seconds, measured from when the
+                call starts running (not from submission). A call that
+                times out has its make subprocess killed, freeing its
+                worker; a queued call that gets no worker within
+                `timeout` is cancelled.
 
-        Currently sequential, but API supports future optimization.
+        Example:
+            tools.parallel(tools.l1_validate, tools.l1_arch_check, tools.l0_commit_check)
         """
-        return [tool() for tool in tools]
+        if not tools:
+            return []
+
+        started = [threading.Event() for _ in tools]
+        start_times = [0.0] * len(tools)
+        calls = [_Call() for _ in tools]
+
+        def run(i: int, tool: Callable[[], ToolResult]) -> ToolResult:
+            start_times[i] = time.monotonic()
+            started[i].set()
+            self._local.call = calls[i]
+            try:
+                return tool()
+            finally:
+                self._local.call = None
+
+        pool = ThreadPoolExecutor(max_workers=min(len(tools), max_workers or self.max_workers))
+        futures = [pool.submit(run, i, tool) for i, tool in enumerate(tools)]
+
+        results: list[ToolResult] = []
+        try:
+            for i, (tool, future) in enumerate(zip(tools, futures)):
+                try:
+                    if timeout is None:
+                        results.append(future.result())
+                        continue
+                    # Earlier calls have finished or been killed by now, so a
+                    # worker frees up promptly unless a native call is stuck
+                    if not started[i].wait(timeout) and future.cancel():
+                        raise FutureTimeout
+                    remaining = timeout - (time.monotonic() - start_times[i])
+                    results.append(future.result(timeout=max(remaining, 0)))
+                except FutureTimeout:
+                    calls[i].cancel()
+                    level, name = _tool_identity(tool)
+                    results.append(ToolResult(False, "timeout", level, name, 1))
+                except Exception as e:
+                    level, name = _tool_identity(tool)
+                    results.append(ToolResult(False, str(e)[:100], level, name, 10))
+        finally:
+            # Don't block on timed-out calls; killed subprocesses end them
+            # shortly, in-process calls finish in the background
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return results
 
     def to_json(self, result: ToolResult) -> str:
         """Convert result to JSON for Agent SDK consumption."""
@@ -182,7 +455,8 @@ class PMTools:
             "output": result.output,
             "level": result.level,
             "tool": result.tool,
-            "tokens": result.tokens_approx
+            "tokens": result.tokens_approx,
+            "cached": result.cached
         })
 
 
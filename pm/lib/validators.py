@@ -4,13 +4,29 @@ Shared across:
 - tests/run-tests.sh
 - tests/validate-entity.sh
 - Pre-commit hooks
+
+`validate_entity` checks one file and raises on the first problem;
+`validate_corpus` checks a whole tree in one pass (fields, IDs, SemVer,
+duplicate IDs and cross-entity dependencies) and reports every problem.
+References to entities outside the scanned set are reported as warnings.
+
+Usage:
+    python3 scripts/validate-entities.py                    # whole tree
+    python3 scripts/validate-entities.py entities/examples --no-deps
 """
 
+import os
 import re
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
+from .corpus import Entity, EntityCorpus, get_corpus
 from .frontmatter import parse_file
+from .merkle import iter_index_files
+
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
 
 
 # Valid entity types
@@ -31,6 +47,21 @@ ID_PATTERNS = {
 # SemVer pattern
 SEMVER_PATTERN = r"^\d+\.\d+\.\d+$"
 
+# Compiled once at import
+SEMVER_RE = re.compile(SEMVER_PATTERN)
+ID_REGEXES = {entity_type: re.compile(p) for entity_type, p in ID_PATTERNS.items()}
+
+# With strict_status, work items must carry one of these statuses
+# (see entities/*.schema.md and tests/validate-entity.sh)
+WORK_ITEM_TYPES = {"epic", "story", "task", "subtask"}
+WORK_ITEM_STATUSES = {"pending", "in_progress", "completed", "blocked"}
+
+# Types that don't need a parent
+ROOT_TYPES = {"epic", "library", "agent", "schema", "doc"}
+
+# blockedBy entries with these prefixes point outside the entity graph
+EXTERNAL_PREFIXES = ("npm:", "pip:", "agents/")
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -49,7 +80,7 @@ def validate_semver(version: str) -> bool:
     Raises:
         ValidationError: If invalid
     """
-    if not re.match(SEMVER_PATTERN, version):
+    if not isinstance(version, str) or not SEMVER_RE.match(version):
         raise ValidationError(f"Invalid SemVer: {version} (expected X.Y.Z)")
     return True
 
@@ -67,19 +98,20 @@ def validate_id(id_value: str, entity_type: str) -> bool:
     Raises:
         ValidationError: If invalid
     """
-    pattern = ID_PATTERNS.get(entity_type)
-    if pattern and not re.match(pattern, id_value):
+    pattern = ID_REGEXES.get(entity_type)
+    if pattern and not (isinstance(id_value, str) and pattern.match(id_value)):
         raise ValidationError(
             f"Invalid ID format: {id_value} (expected {entity_type.upper()}-XXX)"
         )
     return True
 
 
-def validate_entity(path: Path) -> dict[str, Any]:
+def validate_entity(path: Path, cache: "ParseCache | None" = None) -> dict[str, Any]:
     """Validate an entity file.
 
     Args:
         path: Path to entity file
+        cache: Optional persistent ParseCache for the frontmatter parse
 
     Returns:
         Parsed frontmatter if valid
@@ -91,46 +123,89 @@ def validate_entity(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Entity not found: {path}")
 
-    frontmatter = parse_file(path)
+    frontmatter = parse_file(path, cache)
 
     if not frontmatter:
         raise ValidationError(f"No frontmatter in {path}")
 
-    # Required fields
-    required = ["id", "version", "type"]
-    for field in required:
-        if field not in frontmatter:
-            raise ValidationError(f"Missing required field: {field}")
+    errors = check_entity(frontmatter)
+    if errors:
+        raise ValidationError(errors[0])
 
-    # Validate type
-    entity_type = frontmatter["type"]
-    if entity_type not in ENTITY_TYPES:
-        raise ValidationError(f"Invalid type: {entity_type}")
+    return frontmatter
 
-    # Validate version
-    validate_semver(frontmatter["version"])
 
-    # Validate ID format
-    validate_id(frontmatter["id"], entity_type)
+def check_entity(frontmatter: dict[str, Any], strict_status: bool = False) -> list[str]:
+    """Run every field check on parsed frontmatter without raising.
 
-    # Validate status if present
-    if "status" in frontmatter and frontmatter["status"] not in STATUSES:
-        raise ValidationError(f"Invalid status: {frontmatter['status']}")
+    Args:
+        frontmatter: Parsed, non-empty frontmatter
+        strict_status: Require epics/stories/tasks/subtasks to have a
+            status from WORK_ITEM_STATUSES (as tests/validate-entity.sh does)
+
+    Returns:
+        Error messages in check order (empty if valid)
+    """
+    # Required fields - nothing else is checkable without them
+    missing = [f for f in ("id", "version", "type") if f not in frontmatter]
+    if missing:
+        return [f"Missing required field: {f}" for f in missing]
+
+    errors = []
+    entity_type = frontmatter["type"]
+    if entity_type not in ENTITY_TYPES:
+        errors.append(f"Invalid type: {entity_type}")
+
+    version = frontmatter["version"]
+    if not isinstance(version, str) or not SEMVER_RE.match(version):
+        errors.append(f"Invalid SemVer: {version} (expected X.Y.Z)")
+
+    id_value = frontmatter["id"]
+    pattern = ID_REGEXES.get(entity_type)
+    if pattern and not (isinstance(id_value, str) and pattern.match(id_value)):
+        errors.append(f"Invalid ID format: {id_value} (expected {entity_type.upper()}-XXX)")
+
+    status = frontmatter.get("status")
+    if strict_status and entity_type in WORK_ITEM_TYPES:
+        if status is None:
+            errors.append("Missing required field: status")
+        elif status not in WORK_ITEM_STATUSES:
+            errors.append(f"Invalid status: {status}")
+    elif status is not None and status not in STATUSES:
+        errors.append(f"Invalid status: {status}")
 
-    # Task-specific validation
     if entity_type in ("task", "subtask"):
         if "subject" not in frontmatter:
-            raise ValidationError(f"Tasks require 'subject' field")
+            errors.append(f"Tasks require 'subject' field")
         if "activeForm" not in frontmatter:
-            raise ValidationError(f"Tasks require 'activeForm' field")
+            errors.append(f"Tasks require 'activeForm' field")
 
-    # Non-epic entities need parent
-    if entity_type not in ("epic", "library", "agent", "schema", "doc"):
+    if entity_type not in ROOT_TYPES:
         parent = frontmatter.get("parent")
         if not parent or parent == "null":
-            raise ValidationError(f"Non-epic entities require 'parent' field")
+            errors.append(f"Non-epic entities require 'parent' field")
 
-    return frontmatter
+    return errors
+
+
+def check_dependencies(frontmatter: dict[str, Any], all_ids: set[str]) -> list[str]:
+    """Dependency checks for one entity without raising.
+
+    Returns:
+        One message per reference to an unknown entity
+    """
+    errors = []
+    for dep in _as_list(frontmatter.get("blockedBy")):
+        if dep.startswith(EXTERNAL_PREFIXES):
+            continue  # External dependencies
+        if dep not in all_ids:
+            errors.append(f"blockedBy references unknown entity: {dep}")
+
+    for dep in _as_list(frontmatter.get("blocks")):
+        if dep not in all_ids:
+            errors.append(f"blocks references unknown entity: {dep}")
+
+    return errors
 
 
 def validate_dependencies(frontmatter: dict[str, Any], all_ids: set[str]) -> bool:
@@ -146,14 +221,187 @@ def validate_dependencies(frontmatter: dict[str, Any], all_ids: set[str]) -> boo
     Raises:
         ValidationError: If dependency references non-existent entity
     """
-    for dep in frontmatter.get("blockedBy", []):
-        if dep.startswith(("npm:", "pip:", "agents/")):
-            continue  # External dependencies
-        if dep not in all_ids:
-            raise ValidationError(f"blockedBy references unknown entity: {dep}")
-
-    for dep in frontmatter.get("blocks", []):
-        if dep not in all_ids:
-            raise ValidationError(f"blocks references unknown entity: {dep}")
+    errors = check_dependencies(frontmatter, all_ids)
+    if errors:
+        raise ValidationError(errors[0])
 
     return True
+
+
+def _as_list(value: Any) -> list[str]:
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return [value] if isinstance(value, str) and value else []
+
+
+# =============================================================================
+# Corpus validation
+# =============================================================================
+
+
+@dataclass
+class ValidationIssue:
+    """One problem found by validate_corpus."""
+    path: str
+    message: str
+    entity_id: str = ""
+    kind: str = "field"  # field, dependency, duplicate or read
+    severity: str = "error"  # error or warning (unknown dependency references)
+
+
+@dataclass
+class CorpusReport:
+    """Every problem found across a tree, plus what was checked."""
+    root: str
+    files: int = 0  # Markdown files scanned
+    entities: int = 0  # Files whose frontmatter has an id or type
+    issues: list[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def errors(self) -> list[ValidationIssue]:
+        return [i for i in self.issues if i.severity == "error"]
+
+    @property
+    def warnings(self) -> list[ValidationIssue]:
+        return [i for i in self.issues if i.severity == "warning"]
+
+    @property
+    def ok(self) -> bool:
+        """True when there are no errors (warnings don't count)."""
+        return not self.errors
+
+    def by_path(self) -> dict[str, list[ValidationIssue]]:
+        """Issues grouped by file, in path order."""
+        grouped: dict[str, list[ValidationIssue]] = {}
+        for issue in sorted(self.issues, key=lambda i: i.path):
+            grouped.setdefault(issue.path, []).append(issue)
+        return grouped
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "root": self.root,
+            "files": self.files,
+            "entities": self.entities,
+            "ok": self.ok,
+            "issues": [asdict(i) for i in self.issues],
+        }
+
+
+def _load(
+    corpus: EntityCorpus, files: list[str], max_workers: int | None
+) -> list[tuple[str, Entity | None, str]]:
+    """Load files through the corpus.
+
+    Returns:
+        (path, entity or None, read error) per file, in input order
+    """
+    try:
+        loaded = corpus.get_many(files, max_workers=max_workers)
+        return [(f, loaded[Path(f)], "") for f in files]
+    except OSError:
+        pass  # Find out which ones failed
+
+    results = []
+    for f in files:
+        try:
+            results.append((f, corpus.get(f), ""))
+        except OSError as e:
+            results.append((f, None, f"Cannot read: {e.strerror or e}"))
+    return results
+
+
+def _collect_paths(root: Path, paths: Iterable[Path | str] | None) -> list[str]:
+    if paths is None:
+        base = str(root)
+        return [os.path.join(base, rel) for rel, _ in iter_index_files(root) if rel.endswith(".md")]
+
+    files = []
+    for p in paths:
+        p = Path(p)
+        p = p if p.is_absolute() else root / p
+        if p.is_dir():
+            files.extend(str(f) for f in sorted(p.rglob("*.md")))
+        else:
+            files.append(str(p))
+    return files
+
+
+def validate_corpus(
+    root: Path | str,
+    paths: Iterable[Path | str] | None = None,
+    check_deps: bool = True,
+    max_workers: int | None = None,
+    strict_status: bool = False,
+    corpus: EntityCorpus | None = None,
+) -> CorpusReport:
+    """Validate every entity under a tree in one pass.
+
+    Files are loaded through the shared EntityCorpus, so unchanged files
+    are not read or parsed again. Field, ID, SemVer and status checks run
+    per file; then the ID set is built once for duplicate-ID and
+    dependency checks. A blocks/blockedBy reference to an ID outside the
+    scanned files is a warning, since it may live in another tree.
+
+    Args:
+        root: PM root directory (report paths are relative to it)
+        paths: Files or directories to check; defaults to every *.md under root
+        check_deps: Also check blocks/blockedBy against the scanned IDs
+        max_workers: Thread pool size for loading changed files
+        strict_status: See check_entity
+        corpus: Entity corpus to load from (default: the shared one)
+
+    Returns:
+        CorpusReport listing every issue found
+    """
+    root = Path(root)
+    files = _collect_paths(root, paths)
+    report = CorpusReport(root=str(root), files=len(files))
+
+    if corpus is None:
+        corpus = get_corpus()
+    loaded = _load(corpus, files, max_workers)
+
+    prefix = str(root) + os.sep
+
+    def rel(path: str) -> str:
+        return path[len(prefix):] if path.startswith(prefix) else path
+
+    entities: list[tuple[str, dict[str, Any]]] = []
+    first_seen: dict[str, str] = {}
+    for path, entity, read_error in loaded:
+        if entity is None:
+            report.issues.append(ValidationIssue(rel(path), read_error, kind="read"))
+            continue
+        frontmatter = entity.frontmatter
+        if "id" not in frontmatter and "type" not in frontmatter:
+            continue  # Not an entity
+
+        entity_id = str(frontmatter.get("id", ""))
+        report.issues.extend(
+            ValidationIssue(rel(path), msg, entity_id)
+            for msg in check_entity(frontmatter, strict_status)
+        )
+        entities.append((path, frontmatter))
+        if entity_id:
+            if entity_id in first_seen:
+                report.issues.append(ValidationIssue(
+                    rel(path), f"Duplicate id {entity_id} (also in {first_seen[entity_id]})",
+                    entity_id, "duplicate",
+                ))
+            else:
+                first_seen[entity_id] = rel(path)
+
+    report.entities = len(entities)
+
+    if check_deps:
+        all_ids = set(first_seen)
+        for path, frontmatter in entities:
+            report.issues.extend(
+                ValidationIssue(
+                    rel(path), msg, str(frontmatter.get("id", "")), "dependency", "warning"
+                )
+                for msg in check_dependencies(frontmatter, all_ids)
+            )
+
+    return report
+
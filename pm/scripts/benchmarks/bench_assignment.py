@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark assign_files_to_agents scaling.
+
+Generates synthetic review runs (tasks touching a few files each, drawn
+from a pool of source paths across every domain, some of them shared)
+at increasing sizes and times `assign_files_to_agents`. Time per task
+should stay roughly flat as the run grows.
+
+Usage:
+    python3 scripts/benchmarks/bench_assignment.py
+    python3 scripts/benchmarks/bench_assignment.py --tasks 10000 --files 50000 --steps 4
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PM_DIR = Path(__file__).parent.parent.parent
+
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
+
+from lib.assignment_algorithm import TaskFiles, assign_files_to_agents
+
+
+DIRECTORIES = [
+    "src/auth", "src/api", "src/routes", "src/db", "migrations", "src/components",
+    "src/pages", "tests", "scripts", "infra", "src/utils", "src/shared", "src/services",
+]
+DOMAINS = ["auth", "api", "data", "frontend", "testing", "infrastructure", "backend"]
+PRIORITIES = ["P0", "P1", "P2", "P3"]
+
+
+def build_tasks(tasks: int, files: int, files_per_task: int, seed: int) -> list[TaskFiles]:
+    """Synthetic tasks; file popularity is skewed so some files conflict."""
+    rng = random.Random(seed)
+    pool = [f"{DIRECTORIES[i % len(DIRECTORIES)]}/module_{i}.ts" for i in range(files)]
+    result = []
+    for i in range(tasks):
+        touched = {pool[min(int(rng.paretovariate(1.2)) - 1 + rng.randrange(files), files - 1)]
+                   for _ in range(files_per_task)}
+        result.append(TaskFiles(
+            task_id=f"TASK-{i:05d}",
+            priority=rng.choice(PRIORITIES),
+            files=sorted(touched),
+            domain=rng.choice(DOMAINS),
+            agent_hours=rng.choice([0.5, 1, 2, 3, 5]),
+        ))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10_000, help="Tasks at the largest step")
+    parser.add_argument("--files", type=int, default=50_000, help="Files at the largest step")
+    parser.add_argument("--files-per-task", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=4, help="Sizes from 1/steps to full")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'files':>8} {'conflicts':>10} {'seconds':>9} {'µs/task':>9}")
+    for step in range(1, args.steps + 1):
+        n_tasks = args.tasks * step // args.steps
+        n_files = args.files * step // args.steps
+        tasks = build_tasks(n_tasks, n_files, args.files_per_task, args.seed)
+
+        best = float("inf")
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            result = assign_files_to_agents(tasks, "bench")
+            best = min(best, time.perf_counter() - start)
+
+        print(f"{n_tasks:>8} {n_files:>8} {result.stats['conflicts_found']:>10} "
+              f"{best:>9.3f} {best * 1e6 / n_tasks:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
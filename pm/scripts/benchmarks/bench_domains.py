@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark path -> domain classification.
+
+Times the shared DomainClassifier on synthetic repository paths, cold
+(every path classified for the first time) and warm (memoized), against
+the previous loop of `re.search` calls over the pattern table.
+
+Usage:
+    python3 scripts/benchmarks/bench_domains.py
+    python3 scripts/benchmarks/bench_domains.py --paths 1000000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+PM_DIR = Path(__file__).parent.parent.parent
+
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
+
+from lib.domains import DEFAULT_DOMAIN, DOMAIN_RULES, DomainClassifier
+
+
+DIRECTORIES = [
+    "src/auth", "src/middleware", "src/api", "src/routes", "src/db", "migrations",
+    "app", "src/components", "tests", "src/__tests__", "scripts", "infra", "k8s",
+    "src/utils", "src/shared", "src/services", "src/models", "pkg/core/internal",
+]
+SUFFIXES = [".ts", ".tsx", ".test.ts", "_test.go", ".py", ".md"]
+
+
+def legacy_classify(file_path: str) -> str:
+    """The previous classify_domain: one re.search per pattern."""
+    path = file_path.lower()
+    for pattern, domain in DOMAIN_RULES:
+        if re.search(pattern, path):
+            return domain
+    return DEFAULT_DOMAIN
+
+
+def build_paths(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(DIRECTORIES)}/{'nested/' * rng.randint(0, 3)}module_{i}{rng.choice(SUFFIXES)}"
+        for i in range(count)
+    ]
+
+
+def timed(fn, paths: list[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        fn(path)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    paths = build_paths(args.paths, args.seed)
+    classifier = DomainClassifier(DOMAIN_RULES)
+
+    legacy = timed(legacy_classify, paths)
+    cold = timed(classifier.classify, paths)
+    warm = timed(classifier.classify, paths)
+
+    mismatches = sum(classifier.classify(p) != legacy_classify(p) for p in paths)
+    print(f"Paths: {len(paths)} (mismatches vs legacy: {mismatches})")
+    for label, seconds in (("legacy re.search", legacy), ("classifier cold", cold),
+                           ("classifier warm", warm)):
+        print(f"{label:17} {seconds * 1000:8.1f} ms ({seconds * 1e6 / len(paths):.2f} µs/path)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark frontmatter parsing against the previous regex parser.
+
+Generates a synthetic corpus of entity files (example entities with their
+bodies padded to a realistic size) in a temp directory, then times
+`parse_file` against the pre-2 parser (whole-file read, DOTALL regex,
+line split).
+
+Usage:
+    python3 scripts/benchmarks/bench_frontmatter.py
+    python3 scripts/benchmarks/bench_frontmatter.py --files 50000 --body-kb 8
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PM_DIR = Path(__file__).parent.parent.parent
+
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
+
+from lib.frontmatter import parse_file
+
+
+def legacy_parse_frontmatter(content: str) -> dict:
+    """Parser version 1, kept verbatim as the baseline."""
+    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    if not match:
+        return {}
+
+    frontmatter = {}
+    current_key = None
+    current_list = None
+
+    for line in match.group(1).split("\n"):
+        line = line.rstrip()
+        if not line:
+            continue
+        if line.startswith("  - "):
+            if current_list is not None:
+                current_list.append(line[4:].strip().strip('"').strip("'"))
+            continue
+        if ":" in line:
+            if current_key and current_list is not None:
+                frontmatter[current_key] = current_list
+                current_list = None
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            if value == "" or value == "[]":
+                current_key = key
+                current_list = []
+            else:
+                frontmatter[key] = value.strip('"').strip("'")
+                current_key = key
+
+    if current_key and current_list is not None:
+        frontmatter[current_key] = current_list
+
+    return frontmatter
+
+
+def legacy_parse_file(path: Path) -> dict:
+    return legacy_parse_frontmatter(path.read_text(encoding="utf-8", errors="ignore"))
+
+
+def build_corpus(directory: Path, files: int, body_kb: int) -> list[Path]:
+    """Write `files` entity files cycling through the repo's examples."""
+    templates = [
+        p.read_text() for p in sorted((PM_DIR / "entities" / "examples").glob("*.md"))
+    ]
+    padding = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * (body_kb * 18)
+
+    paths = []
+    for i in range(files):
+        path = directory / f"ENTITY-{i:06d}.md"
+        path.write_text(templates[i % len(templates)] + padding)
+        paths.append(path)
+    return paths
+
+
+def time_parser(parse, paths: list[Path]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        parse(path)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--body-kb", type=int, default=4, help="Body padding per file (KiB)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = build_corpus(Path(tmp), args.files, args.body_kb)
+        print(f"Corpus: {len(paths)} files, ~{args.body_kb} KiB body each")
+
+        # Warm the page cache so both parsers read from memory
+        time_parser(lambda p: p.read_bytes(), paths)
+
+        legacy = min(time_parser(legacy_parse_file, paths) for _ in range(args.rounds))
+        current = min(time_parser(parse_file, paths) for _ in range(args.rounds))
+
+    per_file = 1e6 / len(paths)
+    print(f"legacy parser:  {legacy:.3f}s ({legacy * per_file:.1f} µs/file)")
+    print(f"current parser: {current:.3f}s ({current * per_file:.1f} µs/file)")
+    print(f"speedup: {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Analyse entity dependencies (lib/dependency_graph.py DependencyGraph).
+
+Prints the critical path, cycles, one-sided blocks/blockedBy pairs and
+references to unknown entities. Exits non-zero if there are cycles.
+
+Usage:
+    python3 scripts/dependency-graph.py                     # entities/
+    python3 scripts/dependency-graph.py entities/examples --no-depends-on
+    python3 scripts/dependency-graph.py --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PM_DIR = Path(__file__).parent.parent
+
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
+
+from lib.dependency_graph import DependencyGraph
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Analyse entity dependencies")
+    parser.add_argument("directory", nargs="?", default=PM_DIR / "entities", type=Path)
+    parser.add_argument("--no-depends-on", action="store_true",
+                        help="Only use blocks/blockedBy edges")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    graph = DependencyGraph.from_directory(args.directory, depends_on=not args.no_depends_on)
+    report = graph.analyze()
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(f"{report.nodes} entities, {report.edges} dependencies")
+        print(f"Critical path: {report.critical_hours:g}h "
+              f"({' -> '.join(report.critical_path) or 'none'})")
+        for cycle in report.cycles:
+            print(f"✗ Cycle: {' -> '.join(cycle)}")
+        for issue in report.inconsistencies:
+            print(f"⚠ {issue.message}")
+        for entity_id, refs in report.unknown.items():
+            print(f"⚠ {entity_id} references unknown: {', '.join(refs)}")
+
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Validate PM entities in one pass (lib/validators.py validate_corpus).
+
+Reports every problem found (fields, IDs, SemVer, duplicate IDs and
+blocks/blockedBy references) and exits non-zero if there are errors.
+References to entities outside the checked files are warnings only.
+
+Usage:
+    python3 scripts/validate-entities.py                    # whole tree
+    python3 scripts/validate-entities.py entities/examples --no-deps
+    python3 scripts/validate-entities.py --strict-status --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PM_DIR = Path(__file__).parent.parent
+
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
+
+from lib.validators import validate_corpus
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Validate PM entities")
+    parser.add_argument("paths", nargs="*", help="Files or directories (default: whole tree)")
+    parser.add_argument("--root", type=Path, default=PM_DIR)
+    parser.add_argument("--no-deps", action="store_true", help="Skip dependency checks")
+    parser.add_argument(
+        "--strict-status", action="store_true",
+        help="Require work items to have a pending/in_progress/completed/blocked status",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = validate_corpus(
+        args.root,
+        args.paths or None,
+        check_deps=not args.no_deps,
+        strict_status=args.strict_status,
+    )
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        for path, issues in report.by_path().items():
+            for issue in issues:
+                mark = "⚠" if issue.severity == "warning" else "✗"
+                print(f"{mark} {path}: {issue.message}")
+        status = "✓" if report.ok else "✗"
+        print(
+            f"{status} {report.entities} entities, "
+            f"{len(report.errors)} error(s), {len(report.warnings)} warning(s)"
+        )
+
+    sys.exit(0 if report.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Pytest fixtures for PM library tests.
+
+Run from pm/: python3 -m pytest tests
+
+depends_on:
+  - lib/review_runner.py
+  - lib/task_ids.py
+depended_by:
+  - tests/test_*.py
+semver: patch
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+PM_DIR = Path(__file__).parent.parent
+
+# Add lib to path
+sys.path.insert(0, str(PM_DIR))
+
+from lib.review_runner import ReviewJob, ReviewRunner, StubBackend  # noqa: E402
+from lib.task_ids import TaskIdAllocator  # noqa: E402
+
+
+@pytest.fixture
+def allocator(tmp_path: Path) -> Iterator[TaskIdAllocator]:
+    """Task ID allocator backed by a throwaway database."""
+    allocator = TaskIdAllocator(tmp_path / "task-ids.sqlite")
+    yield allocator
+    allocator.close()
+
+
+@pytest.fixture
+def make_finding() -> Callable[..., dict[str, Any]]:
+    """Factory for review-schema finding dicts (task-eligible by default)."""
+
+    def make(
+        finding_id: str,
+        priority: str = "P1",
+        confidence: int = 90,
+        file: str | None = None,
+        title: str | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "id": finding_id,
+            "priority": priority,
+            "confidence": confidence,
+            "category": "bug",
+            "file": file or f"src/{finding_id.lower()}.py",
+            "lines": [1],
+            "title": title or f"Issue {finding_id}",
+            "description": "Something is wrong",
+            "suggestion": "Fix it",
+        }
+
+    return make
+
+
+@pytest.fixture
+def write_review(tmp_path: Path) -> Callable[..., Path]:
+    """Write a REVIEW-{type}-{commit}.md into tmp_path/reviews; returns its path."""
+
+    def write(
+        findings: list[dict[str, Any]],
+        review_type: str = "test",
+        commit: str = "abc1234",
+    ) -> Path:
+        job: ReviewJob = ReviewRunner.jobs(tmp_path / "reviews", "main", commit, [review_type])[0]
+        StubBackend({review_type: findings})(job)
+        return job.output
+
+    return write
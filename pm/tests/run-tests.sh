@@ -14,11 +14,18 @@ FAILED=0
 # Test 1: Schema Validation
 echo "▶️ Test 1: Schema Validation"
 SCHEMA_PASS=true
-for f in "$PM_DIR"/entities/examples/*.md; do
-  if ! "$SCRIPT_DIR/validate-entity.sh" "$f"; then
+if command -v python3 >/dev/null 2>&1; then
+  # One process for the whole directory (lib/validators.py validate_corpus)
+  if ! (cd "$PM_DIR" && python3 scripts/validate-entities.py --no-deps --strict-status entities/examples); then
     SCHEMA_PASS=false
   fi
-done
+else
+  for f in "$PM_DIR"/entities/examples/*.md; do
+    if ! "$SCRIPT_DIR/validate-entity.sh" "$f"; then
+      SCHEMA_PASS=false
+    fi
+  done
+fi
 
 if $SCHEMA_PASS; then
   echo "✅ PASS: Schema Validation"
@@ -83,6 +90,13 @@ for f in "$PM_DIR"/entities/examples/*.md; do
   fi
 done
 
+# blocks/blockedBy references (one pass over entities/); warnings only
+if command -v python3 >/dev/null 2>&1; then
+  if ! (cd "$PM_DIR" && python3 scripts/validate-entities.py entities); then
+    echo "  ⚠️ entity validation reported errors"
+  fi
+fi
+
 if $DEPS_PASS; then
   echo "✅ PASS: Dependency Consistency"
   ((PASSED++))
@@ -142,6 +156,26 @@ else
 fi
 echo ""
 
+# Test 6: Python Unit Tests
+echo "▶️ Test 6: Python Unit Tests"
+UNIT_PASS=true
+if python3 -c "import pytest" >/dev/null 2>&1; then
+  if ! (cd "$PM_DIR" && python3 -m pytest -q tests); then
+    UNIT_PASS=false
+  fi
+else
+  echo "  ⚠️ pytest not installed, skipping"
+fi
+
+if $UNIT_PASS; then
+  echo "✅ PASS: Python Unit Tests"
+  ((PASSED++))
+else
+  echo "❌ FAIL: Python Unit Tests"
+  ((FAILED++))
+fi
+echo ""
+
 # Summary
 echo "=== Summary ==="
 echo "Passed: $PASSED"
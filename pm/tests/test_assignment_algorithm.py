@@ -0,0 +1,291 @@
+"""Tests for task assignment: groups, conflicts and agent scheduling.
+
+depends_on:
+  - lib/assignment_algorithm.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from lib.assignment_algorithm import (
+    AgentSchedule,
+    TaskFiles,
+    assign_files_to_agents,
+    extract_file_ranges_from_body,
+    find_conflicts,
+    find_line_conflicts,
+    form_parallel_groups,
+    index_files,
+    parse_line_spec,
+    schedule_agents,
+    schedule_parallel_groups,
+    split_line_ref,
+)
+
+
+def task(
+    task_id: str, *files: str, hours: float = 0.5, priority: str = "P1", domain: str = ""
+) -> TaskFiles:
+    return TaskFiles(task_id, priority, list(files), domain=domain, agent_hours=hours)
+
+
+def timeline(schedule: AgentSchedule) -> dict[str, tuple[float, float]]:
+    """task_id -> (start, end)."""
+    return {t.task_id: (t.start, t.end) for t in schedule.tasks}
+
+
+class TestParallelGroups:
+    """Waves of independent tasks, with cycles kept in a final group."""
+
+    def test_waves(self) -> None:
+        """Each task runs one wave after its last blocker."""
+        groups = form_parallel_groups(
+            ["A", "B", "C", "D"],
+            {"C": {"A"}, "D": {"B", "C"}},
+        )
+
+        assert groups == [["A", "B"], ["C"], ["D"]]
+
+    def test_max_group_size_rolls_over(self) -> None:
+        """Overflow goes first in the next wave."""
+        groups = form_parallel_groups(["A", "B", "C", "D"], {"D": {"A"}}, max_group_size=2)
+
+        assert groups == [["A", "B"], ["C", "D"]]
+
+    def test_cycle_and_blocked_form_final_group(self) -> None:
+        """Tasks on a cycle and those waiting on it are not dropped."""
+        blocked_by = {"B": {"C"}, "C": {"B"}, "D": {"C"}, "E": {"A"}}
+
+        schedule = schedule_parallel_groups(["A", "B", "C", "D", "E"], blocked_by)
+        groups = form_parallel_groups(["A", "B", "C", "D", "E"], blocked_by)
+
+        assert schedule.groups == [["A"], ["E"]]
+        assert [sorted(c) for c in schedule.cycles] == [["B", "C"]]
+        assert schedule.blocked == ["D"]
+        assert groups == [["A"], ["E"], ["B", "C", "D"]]
+
+    def test_everything_on_a_cycle(self) -> None:
+        """With no schedulable task, the only group is the unschedulable one."""
+        assert form_parallel_groups(["A", "B"], {"A": {"B"}, "B": {"A"}}) == [["A", "B"]]
+
+
+class TestIndexing:
+    """Inverted file -> task index and the default assignment built on it."""
+
+    def test_index_files(self) -> None:
+        """Tasks per file in task order; a file listed twice by one task counts once."""
+        index = index_files({"T1": ["a.py", "b.py", "a.py"], "T2": ["b.py"], "T3": []})
+
+        assert index == {"a.py": ["T1"], "b.py": ["T1", "T2"]}
+
+    def test_find_conflicts(self) -> None:
+        """Only files shared by two or more tasks conflict."""
+        task_files = {"T1": ["a.py", "b.py"], "T2": ["b.py", "c.py"], "T3": ["c.py", "b.py"]}
+
+        assert find_conflicts(task_files) == {"b.py": ["T1", "T2", "T3"], "c.py": ["T2", "T3"]}
+        assert find_conflicts(task_files, index_files(task_files)) == find_conflicts(task_files)
+
+    def test_default_assignment(self) -> None:
+        """Agents get their domain's files and every task touching them, in task order."""
+        tasks = [
+            task("TASK-1", "src/auth/login.py", "tests/test_login.py"),
+            task("TASK-2", "src/auth/login.py", priority="P0"),
+            task("TASK-3", "src/api/routes.py"),
+        ]
+
+        result = assign_files_to_agents(tasks, "main")
+
+        assert {a: (x.files, x.tasks) for a, x in result.assignments.items()} == {
+            "staff-engineer-1": (["src/auth/login.py"], ["TASK-1", "TASK-2"]),
+            "tester-1": (["tests/test_login.py"], ["TASK-1"]),
+            "staff-engineer-2": (["src/api/routes.py"], ["TASK-3"]),
+        }
+        assert result.serialized["src/auth/login.py"]["order"] == ["TASK-2", "TASK-1"]
+        assert [g["tasks"] for g in result.parallel_groups] == [["TASK-2", "TASK-3"], ["TASK-1"]]
+
+
+class TestLineRanges:
+    """`path:lines` references in task bodies."""
+
+    def test_extract_file_ranges(self) -> None:
+        """Spans per file in order of first mention; any bare mention means the whole file."""
+        body = (
+            "## Files\n"
+            "- `src/a.py:10-20` - Modify\n"
+            "- `src/b.py` - Create\n"
+            "**File**: `src/a.py:31, 40-35`\n"
+            "**File**: `src/c.py:7`\n"
+            "The bug in `src/c.py` is older\n"
+        )
+
+        assert extract_file_ranges_from_body(body) == {
+            "src/a.py": [(10, 20), (31, 31), (35, 40)],
+            "src/b.py": [],
+            "src/c.py": [],
+        }
+
+    def test_split_line_ref(self) -> None:
+        """Only a trailing line spec is split off."""
+        assert split_line_ref("src/a.py:1-2,5") == ("src/a.py", [(1, 2), (5, 5)])
+        assert split_line_ref("src/a.py") == ("src/a.py", None)
+        assert split_line_ref("C:/src/a.py") == ("C:/src/a.py", None)
+        assert split_line_ref("src/a.py:main") == ("src/a.py:main", None)
+
+    def test_parse_line_spec(self) -> None:
+        """Single lines become one-line spans; reversed spans are swapped."""
+        assert parse_line_spec("42") == [(42, 42)]
+        assert parse_line_spec("10-20, 31, 9-3") == [(10, 20), (31, 31), (3, 9)]
+
+
+class TestLineConflicts:
+    """Sweep-line clustering of overlapping spans within a shared file."""
+
+    @staticmethod
+    def conflicts(
+        spans: dict[str, list[tuple[int, int]]],
+    ) -> list[tuple[list[str], tuple[int, int] | None]]:
+        """Clusters for one file "f.py", given each task's spans in it ([] = whole file)."""
+        result = find_line_conflicts(
+            {"f.py": list(spans)},
+            {task_id: {"f.py": s} for task_id, s in spans.items()},
+        )
+        return result.get("f.py", [])
+
+    def test_overlapping_ranges_conflict(self) -> None:
+        """Spans sharing even one line are serialized."""
+        assert self.conflicts({"T1": [(10, 20)], "T2": [(20, 30)]}) == [(["T1", "T2"], (10, 30))]
+
+    def test_adjacent_ranges_do_not_conflict(self) -> None:
+        """Back-to-back spans (20 then 21) touch no common line."""
+        assert self.conflicts({"T1": [(10, 20)], "T2": [(21, 30)]}) == []
+
+    def test_transitive_merging(self) -> None:
+        """A overlaps B and B overlaps C, so all three form one cluster."""
+        clusters = self.conflicts({
+            "A": [(1, 10)], "B": [(8, 15)], "C": [(14, 20)], "D": [(30, 40)],
+        })
+
+        assert clusters == [(["A", "B", "C"], (1, 20))]
+
+    def test_task_with_several_spans_bridges_clusters(self) -> None:
+        """Tasks overlapping different spans of the same task are merged."""
+        clusters = self.conflicts({"T1": [(1, 5), (50, 60)], "T2": [(3, 4)], "T3": [(55, 70)]})
+
+        assert clusters == [(["T1", "T2", "T3"], (1, 70))]
+
+    def test_separate_clusters(self) -> None:
+        """Disjoint hunks give independent clusters."""
+        clusters = self.conflicts({
+            "T1": [(1, 10)], "T2": [(5, 6)], "T3": [(100, 110)], "T4": [(105, 120)],
+        })
+
+        assert clusters == [(["T1", "T2"], (1, 10)), (["T3", "T4"], (100, 120))]
+
+    def test_whole_file_overlaps_everything(self) -> None:
+        """A reference without lines conflicts with every span; the cluster has no span."""
+        clusters = self.conflicts({"T1": [(1, 10)], "T2": [], "T3": [(500, 510)]})
+
+        assert clusters == [(["T1", "T2", "T3"], None)]
+
+    def test_disjoint_hunks_run_in_parallel(self) -> None:
+        """In assignments, tasks on disjoint hunks of a file share a group."""
+        tasks = [task("TASK-1", "src/a.py"), task("TASK-2", "src/a.py"), task("TASK-3", "src/a.py")]
+        tasks[0].line_ranges = {"src/a.py": [(1, 10)]}
+        tasks[1].line_ranges = {"src/a.py": [(11, 20)]}
+        tasks[2].line_ranges = {"src/a.py": [(15, 16)]}
+
+        result = assign_files_to_agents(tasks, "main")
+
+        assert list(result.serialized) == ["src/a.py:11-20"]
+        assert [g["tasks"] for g in result.parallel_groups] == [["TASK-1", "TASK-2"], ["TASK-3"]]
+
+
+class TestScheduleAgents:
+    """List scheduling on agent timelines."""
+
+    # A (1h) -> C (4h); B and D (3h each) are independent
+    DAG_TASKS = [task("A", hours=1), task("B", hours=3), task("C", hours=4), task("D", hours=3)]
+    DAG_BLOCKED_BY = {"C": {"A"}}
+    TWO_AGENTS = {"agent-1": 1, "agent-2": 1}
+
+    def test_lpt_starts_longest_first(self) -> None:
+        """LPT runs B and D first, so the A -> C chain starts late."""
+        schedule = schedule_agents(self.DAG_TASKS, self.DAG_BLOCKED_BY, self.TWO_AGENTS, "lpt")
+
+        assert timeline(schedule) == {
+            "B": (0.0, 3.0), "D": (0.0, 3.0), "A": (3.0, 4.0), "C": (4.0, 8.0),
+        }
+        assert schedule.makespan == 8.0
+
+    def test_critical_path_starts_longest_chain_first(self) -> None:
+        """Critical path ranks A by A + C (5h), so C overlaps with B and D."""
+        schedule = schedule_agents(self.DAG_TASKS, self.DAG_BLOCKED_BY, self.TWO_AGENTS)
+
+        assert timeline(schedule) == {
+            "A": (0.0, 1.0), "B": (0.0, 3.0), "C": (1.0, 5.0), "D": (3.0, 6.0),
+        }
+        assert schedule.makespan == 6.0
+
+    def test_makespan_in_hours(self) -> None:
+        """Makespan and utilisation come from agentHours, not task counts."""
+        tasks = [task("A", hours=1.5), task("B", hours=2.5), task("C", hours=1)]
+
+        one = schedule_agents(tasks, {}, {"agent-1": 1})
+        two = schedule_agents(tasks, {}, {"agent-1": 2})
+
+        assert one.makespan == 5.0
+        assert one.busy_hours == {"agent-1": 5.0}
+        assert one.utilisation == {"agent-1": 1.0}
+        assert two.makespan == 2.5  # B alone; A then C on the other slot
+        assert two.utilisation == {"agent-1": 1.0}
+
+    def test_chain_is_serial(self) -> None:
+        """A blocker must finish before its dependent starts, whatever the agent count."""
+        tasks = [task("A", hours=2), task("B", hours=3)]
+
+        schedule = schedule_agents(tasks, {"B": {"A"}}, self.TWO_AGENTS)
+
+        assert timeline(schedule) == {"A": (0.0, 2.0), "B": (2.0, 5.0)}
+
+    def test_domain_owner_preferred(self) -> None:
+        """A free agent owning the task's domain gets it over a less loaded one."""
+        tasks = [task("T1", hours=1, domain="tests")]
+
+        schedule = schedule_agents(tasks, {}, {"staff-engineer-1": 1, "tester-1": 1})
+
+        assert [t.agent for t in schedule.tasks] == ["tester-1"]
+
+    def test_cycle_is_unscheduled(self) -> None:
+        """Tasks on or behind a cycle are reported, not placed."""
+        tasks = [task("A"), task("B"), task("C"), task("D")]
+
+        schedule = schedule_agents(tasks, {"B": {"C"}, "C": {"B"}, "D": {"B"}}, {"agent-1": 1})
+
+        assert [t.task_id for t in schedule.tasks] == ["A"]
+        assert schedule.unscheduled == ["B", "C", "D"]
+
+    def test_rejects_bad_input(self) -> None:
+        """Unknown priorities and agents without capacity are errors."""
+        with pytest.raises(ValueError):
+            schedule_agents(self.DAG_TASKS, {}, self.TWO_AGENTS, "fifo")
+        with pytest.raises(ValueError):
+            schedule_agents(self.DAG_TASKS, {}, {"agent-1": 0})
+
+    def test_assignments_serialize_shared_files(self) -> None:
+        """In scheduling mode, tasks sharing a file never overlap in time."""
+        tasks = [
+            task("TASK-1", "src/shared.py", hours=2, priority="P0"),
+            task("TASK-2", "src/shared.py", hours=1),
+            task("TASK-3", "src/other.py", hours=1),
+        ]
+
+        result = assign_files_to_agents(tasks, "main", agents=self.TWO_AGENTS)
+        spans = {e["task"]: (e["start"], e["end"]) for e in result.schedule}
+
+        assert spans["TASK-2"][0] >= spans["TASK-1"][1]
+        assert result.stats["makespan_hours"] == 3.0
+        assert result.stats["total_hours"] == 4.0
+        assert sum(a.estimated_hours for a in result.assignments.values()) == 4.0
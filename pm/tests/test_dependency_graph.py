@@ -0,0 +1,151 @@
+"""Tests for the dependency graph (Tarjan SCC, cycles, critical path).
+
+depends_on:
+  - lib/dependency_graph.py
+  - scripts/dependency-graph.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from lib.dependency_graph import DependencyGraph
+
+PM_DIR = Path(__file__).parent.parent
+
+
+def entity(entity_id: str, hours: float = 1, **deps: Any) -> dict[str, Any]:
+    return {"id": entity_id, "agentHours": str(hours), **deps}
+
+
+def graph(*entities: dict[str, Any]) -> DependencyGraph:
+    return DependencyGraph.from_frontmatter(entities)
+
+
+class TestComponents:
+    """Tarjan's SCC over the "must finish before" edges."""
+
+    def test_dag_is_singletons_in_topological_order(self) -> None:
+        """Without cycles every node is its own component, prerequisites first."""
+        g = graph(
+            entity("C", blockedBy=["B"]),
+            entity("B", blockedBy=["A"]),
+            entity("A"),
+            entity("D", dependsOn=["A"]),
+        )
+
+        components = g.strongly_connected_components()
+        order = g.topological_order()
+
+        assert all(len(c) == 1 for c in components)
+        assert sorted(order) == ["A", "B", "C", "D"]
+        assert order.index("A") < order.index("B") < order.index("C")
+        assert order.index("A") < order.index("D")
+        assert g.cycles() == []
+
+    def test_cycles_found(self) -> None:
+        """Two separate cycles and a self-dependency, with an acyclic tail."""
+        g = graph(
+            entity("A", blocks=["B"]),
+            entity("B", blocks=["C"]),
+            entity("C", blocks=["A", "D"]),
+            entity("D", blocks=["E"]),
+            entity("E", blocks=["D"]),
+            entity("F", blocks=["F"]),
+            entity("G", blockedBy=["E"]),
+        )
+
+        assert sorted(g.cycles()) == [["A", "B", "C"], ["D", "E"], ["F"]]
+        order = g.topological_order()
+        assert order.index("C") < order.index("D") < order.index("G")
+        assert not g.analyze().ok
+
+    def test_cycle_topological_position(self) -> None:
+        """A cycle's component sits after its prerequisites and before its dependents."""
+        g = graph(
+            entity("X", blocks=["A"]),
+            entity("A", blocks=["B"]),
+            entity("B", blocks=["A", "Y"]),
+            entity("Y"),
+        )
+
+        assert g.strongly_connected_components() == [["X"], ["A", "B"], ["Y"]]
+
+    def test_deep_chain_has_no_recursion_limit(self) -> None:
+        """A chain far longer than the recursion limit is handled iteratively."""
+        n = sys.getrecursionlimit() * 3
+        g = graph(*(entity(f"T{i}", blockedBy=[f"T{i - 1}"] if i else []) for i in range(n)))
+
+        assert g.cycles() == []
+        assert g.topological_order()[:3] == ["T0", "T1", "T2"]
+        hours, path = g.critical_path()
+        assert hours == n and len(path) == n
+
+
+class TestCriticalPath:
+    """Longest agentHours-weighted chain."""
+
+    def test_heaviest_chain_wins(self) -> None:
+        """The longest path by hours, not by number of steps."""
+        g = graph(
+            entity("A", 1, blocks=["B", "D"]),
+            entity("B", 1, blocks=["C"]),
+            entity("C", 1),
+            entity("D", 5),
+        )
+
+        assert g.critical_path() == (6.0, ["A", "D"])
+
+    def test_diamond_join(self) -> None:
+        """Both branches feed the join; the heavier one is on the path."""
+        g = graph(
+            entity("A", 2),
+            entity("B", 3, blockedBy=["A"]),
+            entity("C", 1, blockedBy=["A"]),
+            entity("D", 4, blockedBy=["B", "C"]),
+        )
+
+        assert g.critical_path() == (9.0, ["A", "B", "D"])
+        assert g.transitive_blockers("D") == {"A", "B", "C"}
+
+    def test_cycle_collapses_to_one_step(self) -> None:
+        """A cycle counts once, with the sum of its members' hours."""
+        g = graph(
+            entity("A", 1, blocks=["B"]),
+            entity("B", 2, blocks=["C"]),
+            entity("C", 3, blocks=["B", "D"]),
+            entity("D", 1),
+        )
+
+        assert g.critical_path() == (7.0, ["A", "B", "C", "D"])
+
+    def test_empty_and_unweighted(self) -> None:
+        """No entities gives an empty path; missing or bad hours weigh 0."""
+        assert graph().critical_path() == (0.0, [])
+        g = graph({"id": "A", "agentHours": "n/a", "blocks": ["B"]}, {"id": "B"})
+        assert g.critical_path()[0] == 0.0
+
+
+class TestScript:
+    """scripts/dependency-graph.py."""
+
+    def test_cycle_exits_non_zero(self, tmp_path: Path) -> None:
+        """The CLI reports the cycle, exits 1, and prints no runpy warning."""
+        for entity_id, other in (("TASK-001", "TASK-002"), ("TASK-002", "TASK-001")):
+            (tmp_path / f"{entity_id}.md").write_text(
+                f'---\nid: "{entity_id}"\ntype: task\nblocks:\n  - "{other}"\n---\n'
+            )
+
+        result = subprocess.run(
+            [sys.executable, str(PM_DIR / "scripts" / "dependency-graph.py"), str(tmp_path)],
+            capture_output=True, text=True, check=False,
+        )
+
+        assert result.returncode == 1
+        assert "✗ Cycle: TASK-001 -> TASK-002" in result.stdout
+        assert result.stderr == ""
@@ -0,0 +1,101 @@
+"""Tests for the shared entity index and how it is kept current.
+
+depends_on:
+  - lib/entity_index.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lib.corpus import EntityCorpus
+from lib.entity_index import get_entity_index, update_entity_indexes
+
+
+def write(path: Path, entity_id: str, status: str = "pending") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'---\nid: "{entity_id}"\ntype: task\nstatus: {status}\n---\n')
+    st = path.stat()  # Make sure a rewrite within one mtime tick is still seen
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    return path
+
+
+class CountingCorpus(EntityCorpus):
+    """EntityCorpus that counts directory scans."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.scans = 0
+
+    def iter_scan(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.scans += 1
+        return super().iter_scan(*args, **kwargs)
+
+
+@pytest.fixture
+def corpus() -> CountingCorpus:
+    return CountingCorpus()
+
+
+class TestGetEntityIndex:
+    """One scan per process; lookups never touch the tree."""
+
+    def test_lookups_do_not_rescan(self, tmp_path: Path, corpus: CountingCorpus) -> None:
+        """Only the first call scans the directory."""
+        write(tmp_path / "TASK-001.md", "TASK-001")
+
+        first = get_entity_index(tmp_path, corpus)
+        second = get_entity_index(tmp_path, corpus)
+
+        assert second is first
+        assert corpus.scans == 1
+        assert [r.id for r in second.find(type="task")] == ["TASK-001"]
+
+    def test_explicit_refresh(self, tmp_path: Path, corpus: CountingCorpus) -> None:
+        """refresh=True rescans and picks up unannounced changes."""
+        write(tmp_path / "TASK-001.md", "TASK-001")
+        get_entity_index(tmp_path, corpus)
+        write(tmp_path / "TASK-002.md", "TASK-002")
+
+        stale = get_entity_index(tmp_path, corpus)
+        assert [r.id for r in stale.find(type="task")] == ["TASK-001"]
+
+        fresh = get_entity_index(tmp_path, corpus, refresh=True)
+        assert corpus.scans == 2
+        assert sorted(r.id for r in fresh.find(type="task")) == ["TASK-001", "TASK-002"]
+
+
+class TestUpdateEntityIndexes:
+    """Known changed paths are applied without a scan."""
+
+    def test_changed_added_and_removed(self, tmp_path: Path, corpus: CountingCorpus) -> None:
+        """Edits, new files and deletions under the directory are applied."""
+        one = write(tmp_path / "TASK-001.md", "TASK-001")
+        gone = write(tmp_path / "TASK-002.md", "TASK-002")
+        index = get_entity_index(tmp_path, corpus)
+
+        write(one, "TASK-001", status="in_progress")
+        new = write(tmp_path / "sub" / "TASK-003.md", "TASK-003")
+        gone.unlink()
+        update_entity_indexes([one, new, gone], corpus)
+
+        assert corpus.scans == 1
+        assert [r.id for r in index.find(status="in_progress")] == ["TASK-001"]
+        assert sorted(r.id for r in index.find(type="task")) == ["TASK-001", "TASK-003"]
+
+    def test_paths_outside_directory_ignored(self, tmp_path: Path, corpus: CountingCorpus) -> None:
+        """A changed file elsewhere, or a non-markdown file, is not indexed."""
+        index = get_entity_index(tmp_path / "entities", corpus)
+        outside = write(tmp_path / "docs" / "TASK-009.md", "TASK-009")
+        script = tmp_path / "entities" / "run.sh"
+        script.parent.mkdir(exist_ok=True)
+        script.write_text("echo\n")
+
+        update_entity_indexes([outside, script], corpus)
+
+        assert len(index.find(type="task")) == 0
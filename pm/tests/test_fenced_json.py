@@ -0,0 +1,125 @@
+"""Tests for fenced JSON block scanning and streaming array decode.
+
+depends_on:
+  - lib/fenced_json.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+import pytest
+
+from lib.fenced_json import find_json_block, iter_array_items, iter_fenced_blocks
+
+FINDINGS = [
+    {"id": "F1", "confidence": 123456789, "title": "Retry loop"},
+    {"id": "F2", "suggestion": "Wrap it in ```python``` fences, not ``` alone"},
+    {"id": "F3", "lines": [1, 2, 3], "nested": {"a": [{"b": "}]"}]}},
+]
+
+
+def review(*blocks: str, prose: str = "# Review\n\nSome text.\n") -> str:
+    return prose + "".join(f"\n```json\n{block}\n```\n" for block in blocks)
+
+
+def stream(text: str, key: str = "findings", chunk_size: int = 7, **kw: Any) -> list[Any]:
+    return list(iter_array_items(io.StringIO(text), key, chunk_size=chunk_size, **kw))
+
+
+class TestFencedBlocks:
+    """Block boundaries found by str.find."""
+
+    def test_blocks_in_order(self) -> None:
+        """Only ```json blocks; other languages and inline mentions are skipped."""
+        text = "Inline ```json is not a fence.\n```python\nx = 1\n```\n" + review("1", "2")
+
+        assert list(iter_fenced_blocks(text)) == ["1", "2"]
+
+    def test_unterminated_fence(self) -> None:
+        """A block without a closing fence is not a block."""
+        complete = json.dumps({"findings": FINDINGS})
+        text = review(complete) + "\n```json\n" + json.dumps({"findings": []})
+
+        assert list(iter_fenced_blocks(text)) == [complete]
+        assert find_json_block("```json\n" + complete, "findings") is None
+
+    def test_backticks_inside_strings(self) -> None:
+        """Backticks in a JSON string don't close the block (no newline before them)."""
+        text = review(json.dumps({"findings": FINDINGS}, indent=2))
+
+        assert find_json_block(text, "findings") == {"findings": FINDINGS}
+
+    def test_first_block_with_key(self) -> None:
+        """Blocks without the key, or malformed ones, are passed over."""
+        text = review(
+            '{"metrics": {"files": 3}}',
+            '{"findings": [1, }',
+            '["findings"]',
+            '{"findings": [2]}',
+            '{"findings": [3]}',
+        )
+
+        assert find_json_block(text, "findings") == {"findings": [2]}
+        assert find_json_block(text, "missing") is None
+
+
+class TestStreaming:
+    """iter_array_items decodes one element at a time across chunk seams."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 64, 1 << 16])
+    def test_every_chunk_size(self, chunk_size: int) -> None:
+        """Same items whatever the seams split: keys, strings, numbers, fences."""
+        text = review(json.dumps({"findings": FINDINGS}, indent=2))
+
+        assert stream(text, chunk_size=chunk_size) == FINDINGS
+
+    def test_matches_find_json_block(self) -> None:
+        """Streaming agrees with decoding the whole block."""
+        text = review(
+            '{"summary": "no findings key"}',
+            json.dumps({"metrics": {"n": 3}, "findings": FINDINGS, "after": True}),
+        )
+
+        assert stream(text) == find_json_block(text, "findings")["findings"]
+
+    def test_extras_before_the_array(self) -> None:
+        """Members preceding the array are collected; skipped blocks leave no trace."""
+        text = review(
+            '{"metrics": {"wrong": 1}}',
+            '{"metrics": {"files": 2}, "status": "ok", "findings": [1, 2], "late": 0}',
+        )
+        extras: dict[str, Any] = {}
+
+        assert stream(text, extras=extras) == [1, 2]
+        assert extras == {"metrics": {"files": 2}, "status": "ok"}
+
+    def test_empty_and_missing(self) -> None:
+        """An empty array yields nothing; so does a document without the key."""
+        assert stream(review('{"findings": []}', '{"findings": [1]}')) == []
+        assert stream(review('{"other": [1]}')) == []
+        assert stream("no fences at all") == []
+
+    def test_malformed_block_before_the_array_is_skipped(self) -> None:
+        """A block that breaks before the array starts doesn't stop the search."""
+        text = review('{"metrics": {"files": }', '{"findings": [1, 2]}')
+
+        assert stream(text, chunk_size=3) == [1, 2]
+
+    def test_malformed_array_stops_after_yielded_items(self) -> None:
+        """Once items were yielded, a broken array ends iteration there."""
+        text = review('{"findings": [1, {"id": }, 3]}', '{"findings": [9]}')
+
+        assert stream(text) == [1]
+
+    def test_unterminated_fence_streams_complete_items(self) -> None:
+        """Without a closing fence, every complete item up to end of stream is yielded."""
+        body = json.dumps({"findings": FINDINGS})
+        truncated = "```json\n" + body[:body.index('{"id": "F3"') + 10]
+
+        assert stream("```json\n" + body) == FINDINGS
+        assert stream(truncated) == FINDINGS[:2]
@@ -0,0 +1,212 @@
+"""Tests for the header-only frontmatter parser.
+
+Pins the constructs where the current parser differs from the original
+line-based one (nested maps, lists of maps, inline lists, trailing
+comments), plus the edge cases both must agree on.
+
+depends_on:
+  - lib/frontmatter.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lib.frontmatter import (
+    HEADER_CHUNK,
+    _parse_flat,
+    _Parser,
+    get_body,
+    parse_file,
+    parse_frontmatter,
+    read_head,
+)
+
+
+def doc(header: str, body: str = "\n# Body\n") -> str:
+    return f"---\n{header}\n---\n{body}"
+
+
+class TestNesting:
+    """Indented blocks nest instead of flattening into top-level keys."""
+
+    def test_nested_map(self) -> None:
+        """Was: steering == [] plus top-level token_budget/turn_budget keys."""
+        fm = parse_frontmatter(doc(
+            "name: test-reviewer\n"
+            "steering:\n"
+            "  token_budget: 160000\n"
+            "  turn_budget: 25\n"
+            "  limits:\n"
+            "    soft: 0.8"
+        ))
+
+        assert fm == {
+            "name": "test-reviewer",
+            "steering": {
+                "token_budget": "160000",
+                "turn_budget": "25",
+                "limits": {"soft": "0.8"},
+            },
+        }
+
+    def test_list_of_maps(self) -> None:
+        """Was: TaskCompleted == [] plus a stray '- command' key (hooks in agents/*.md)."""
+        fm = parse_frontmatter(doc(
+            "hooks:\n"
+            "  TaskCompleted:\n"
+            "    - command: \"echo '[sdm] done'\"\n"
+            "      timeout: 5\n"
+            "    - command: true"
+        ))
+
+        assert fm == {"hooks": {"TaskCompleted": [
+            {"command": "echo '[sdm] done'", "timeout": "5"},
+            {"command": "true"},
+        ]}}
+
+    def test_block_list_at_any_indent(self) -> None:
+        """Was: only '  - ' items were collected; unindented ones were dropped."""
+        fm = parse_frontmatter(doc("a:\n- x\n- y\nb:\n    - z"))
+
+        assert fm == {"a": ["x", "y"], "b": ["z"]}
+
+
+class TestScalars:
+    """Quoting, comments and empty values."""
+
+    def test_inline_list(self) -> None:
+        """Was: the raw string '["auth", "jwt"]' (quotes stripped from the ends only)."""
+        fm = parse_frontmatter(doc('tags: ["auth", "jwt", "a, b"]\nempty: []\nmap: {a: 1}'))
+
+        assert fm == {"tags": ["auth", "jwt", "a, b"], "empty": [], "map": {"a": "1"}}
+
+    def test_trailing_comment(self) -> None:
+        """Was: 'EPIC-002"  # Payments need auth' kept the comment and a stray quote."""
+        fm = parse_frontmatter(doc(
+            'id: "EPIC-001"  # the epic\n'
+            "status: pending # for now\n"
+            "blocks:\n"
+            '  - "EPIC-002"  # Payments need auth\n'
+            "  - TASK-006 # plain"
+        ))
+
+        assert fm == {"id": "EPIC-001", "status": "pending", "blocks": ["EPIC-002", "TASK-006"]}
+
+    def test_quoted_hash_is_not_a_comment(self) -> None:
+        """'#' inside quotes, or not preceded by a space, is part of the value."""
+        fm = parse_frontmatter(doc(
+            'title: "Fix #12 # and more"\n'
+            "single: 'it''s # here'\n"
+            "ref: a#b\n"
+            "items:\n"
+            '  - "# heading"'
+        ))
+
+        assert fm == {
+            "title": "Fix #12 # and more",
+            "single": "it's # here",
+            "ref": "a#b",
+            "items": ["# heading"],
+        }
+
+    def test_empty_values(self) -> None:
+        """A key with no value and no children is an empty list (as before)."""
+        fm = parse_frontmatter(doc('a:\nb: ""\nc: []\nd:\n# comment\n\ne: x'))
+
+        assert fm == {"a": [], "b": "", "c": [], "d": [], "e": "x"}
+
+    def test_block_scalars(self) -> None:
+        """| keeps line breaks, > folds them; was: the indicator character itself."""
+        fm = parse_frontmatter(doc("lit: |\n  one\n  two\nfold: >-\n  one\n  two\nnext: x"))
+
+        assert fm == {"lit": "one\ntwo\n", "fold": "one two", "next": "x"}
+
+
+class TestFences:
+    """Where the frontmatter starts and ends."""
+
+    def test_dashes_in_body(self) -> None:
+        """Only the first closing fence ends the header; later '---' stay in the body."""
+        content = doc("id: X", body="\nIntro\n---\nnot: frontmatter\n---\n")
+
+        assert parse_frontmatter(content) == {"id": "X"}
+        assert get_body(content) == "\nIntro\n---\nnot: frontmatter\n---\n"
+
+    def test_no_frontmatter(self) -> None:
+        """No opening fence, or no closing fence, means no frontmatter."""
+        assert parse_frontmatter("# Title\n---\nid: X\n---\n") == {}
+        assert parse_frontmatter("---\nid: X\n") == {}
+        assert get_body("# Title\n") == "# Title\n"
+
+
+class TestFastPath:
+    """_parse_flat must agree with the full parser on the headers it accepts."""
+
+    @pytest.mark.parametrize("header", [
+        'id: "TASK-1"\nversion: "1.0.0"\ntags: [a, b]',
+        "blocks:\n  - A  # why\n  - 'B'\nempty:\nnext: x",
+        'title: "a # b"\nplain: x # y\nlist:\n- 1\n- 2',
+    ])
+    def test_matches_full_parser(self, header: str) -> None:
+        """Same result from both paths."""
+        flat = _parse_flat(header)
+
+        assert flat is not None
+        assert flat == _Parser(header).parse()
+
+    @pytest.mark.parametrize("header", [
+        "a:\n  b: c",  # nested map
+        "a:\n  - b: c",  # list of maps
+        "a: |\n  text",  # block scalar
+        '"quoted": key',  # quoted key
+    ])
+    def test_defers_to_full_parser(self, header: str) -> None:
+        """Anything beyond flat keys and scalar lists falls through."""
+        assert _parse_flat(header) is None
+
+
+class TestReadHead:
+    """read_head stops at the closing fence, across HEADER_CHUNK reads."""
+
+    def test_head_over_chunk_limit(self, tmp_path: Path) -> None:
+        """A header longer than HEADER_CHUNK is read to its closing fence."""
+        items = "".join(f"  - TASK-{i:04d}\n" for i in range(HEADER_CHUNK // 10))
+        content = f"---\nid: EPIC-001\nblocks:\n{items}last: yes\n---\n" + "body\n" * 5000
+        path = tmp_path / "big.md"
+        path.write_text(content)
+
+        head = read_head(path)
+
+        assert len(head) > HEADER_CHUNK
+        assert head.endswith(b"last: yes\n---")
+        fm = parse_file(path)
+        assert fm == parse_frontmatter(content)
+        assert fm["last"] == "yes" and len(fm["blocks"]) == HEADER_CHUNK // 10
+
+    @pytest.mark.parametrize("offset", [-3, -2, -1, 0, 1])
+    def test_fence_on_chunk_seam(self, tmp_path: Path, offset: int) -> None:
+        """A closing fence split across two reads is still found."""
+        prefix = "---\nnote: "
+        filler = "x" * (HEADER_CHUNK + offset - len(prefix))
+        content = f"{prefix}{filler}\n---\nbody\n"
+        path = tmp_path / "seam.md"
+        path.write_text(content)
+
+        assert read_head(path) == f"{prefix}{filler}\n---".encode()
+        assert parse_file(path) == {"note": filler}
+
+    def test_no_fence(self, tmp_path: Path) -> None:
+        """No frontmatter reads nothing; an unterminated header reads to EOF."""
+        plain = tmp_path / "plain.md"
+        plain.write_text("# Title\n")
+        open_only = tmp_path / "open.md"
+        open_only.write_text("---\nid: X\n" + "y" * HEADER_CHUNK)
+
+        assert read_head(plain) == b""
+        assert read_head(open_only) == open_only.read_bytes()
+        assert parse_file(open_only) == {}
@@ -0,0 +1,66 @@
+"""Tests for incremental Merkle index updates across index format versions.
+
+depends_on:
+  - lib/index_builder.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from lib.corpus import EntityCorpus
+from lib.index_builder import INDEX_VERSION, build_index, refresh_index, update_index
+
+
+def make_tree(root: Path) -> None:
+    (root / "entities").mkdir(parents=True)
+    (root / "entities" / "TASK-001.md").write_text('---\nid: "TASK-001"\ntype: task\n---\n# A\n')
+    (root / "README.md").write_text("# Readme\n")
+
+
+def old_format(index: dict) -> dict:
+    """The same index as an older INDEX_VERSION would have written it."""
+    return {**index, "version": "1.0.0", "root": "stale", "directories": {}}
+
+
+class TestIndexVersion:
+    """An index in another format is rebuilt, never patched."""
+
+    def test_update_index_rebuilds_other_version(self, tmp_path: Path) -> None:
+        """update_index on an old-format index returns a full, current build."""
+        make_tree(tmp_path)
+        current = build_index(tmp_path, EntityCorpus())
+
+        updated = update_index(tmp_path, old_format(current), ["README.md"], EntityCorpus())
+
+        assert updated["version"] == INDEX_VERSION
+        assert updated["root"] == current["root"]
+        assert updated["directories"] == current["directories"]
+
+    def test_refresh_index_full_on_other_version(self, tmp_path: Path) -> None:
+        """refresh_index ignores an on-disk index from another version."""
+        make_tree(tmp_path)
+        first = refresh_index(tmp_path, corpus=EntityCorpus())
+        index_file = tmp_path / ".index" / "merkle-tree.json"
+        index_file.write_text(json.dumps(old_format(first.index)))
+
+        second = refresh_index(tmp_path, corpus=EntityCorpus())
+
+        assert second.mode == "full"
+        assert json.loads(index_file.read_text())["version"] == INDEX_VERSION
+        assert second.index["root"] == first.index["root"]
+
+    def test_refresh_index_incremental_on_same_version(self, tmp_path: Path) -> None:
+        """A current index with nothing changed is neither rebuilt nor rewritten."""
+        make_tree(tmp_path)
+        refresh_index(tmp_path, corpus=EntityCorpus())
+        index_file = tmp_path / ".index" / "merkle-tree.json"
+        before = index_file.read_text()
+
+        result = refresh_index(tmp_path, corpus=EntityCorpus())
+
+        assert (result.mode, result.changed) == ("incremental", [])
+        assert index_file.read_text() == before
@@ -0,0 +1,55 @@
+"""Tests for the machine-local stat cache.
+
+depends_on:
+  - lib/merkle.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from lib.merkle import STAT_CACHE_NAME, STAT_CACHE_VERSION, StatCache
+
+
+class TestStatCacheSave:
+    """Atomic, concurrency-safe writes of stat-cache.json."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Saved entries load back unchanged."""
+        cache = StatCache.load(tmp_path)
+        cache.entries["a.md"] = (1, 2, 3, "abc")
+        cache.save()
+
+        assert StatCache.load(tmp_path).entries == {"a.md": (1, 2, 3, "abc")}
+
+    def test_concurrent_saves(self, tmp_path: Path) -> None:
+        """Threads saving at once each write their own temp file; one complete file wins."""
+        def save(n: int) -> None:
+            cache = StatCache.load(tmp_path)
+            cache.entries = {f"f{i}.md": (n, i, 0, "x" * 64) for i in range(200)}
+            for _ in range(20):
+                cache.save()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save, range(8)))
+
+        data = json.loads((tmp_path / STAT_CACHE_NAME).read_text())
+        assert data["version"] == STAT_CACHE_VERSION
+        assert len(data["files"]) == 200
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_failed_save_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        """If the rename fails, the temporary file is removed."""
+        (tmp_path / STAT_CACHE_NAME).mkdir()  # A directory can't be replaced by a file
+        cache = StatCache.load(tmp_path)
+
+        with pytest.raises(OSError):
+            cache.save()
+
+        assert list(tmp_path.glob("*.tmp")) == []
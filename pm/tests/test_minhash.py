@@ -0,0 +1,150 @@
+"""Tests for MinHash signatures and LSH candidate pairs.
+
+depends_on:
+  - lib/minhash.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import random
+
+from lib.minhash import LSHIndex, choose_bands, jaccard, shingles, signature
+
+ORIGINAL = (
+    "The retry loop in fetch_user swallows the timeout exception and returns "
+    "None, so callers treat a network failure as a missing user and create a "
+    "duplicate account instead of surfacing the error to the request handler"
+)
+NEAR_DUPLICATE = (
+    "The retry loop in fetch_user swallows the timeout exception and returns "
+    "None, so callers treat a network failure as a missing user and create a "
+    "second account rather than surfacing the error to the request handler"
+)
+UNRELATED = (
+    "Pagination in list_orders builds the SQL offset from unvalidated query "
+    "parameters, allowing negative pages and full table scans on large tenants"
+)
+
+
+def perturb(words: list[str], rng: random.Random, edits: int) -> str:
+    """Replace `edits` random words with fresh ones."""
+    words = words[:]
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = f"w{rng.randrange(10**9)}"
+    return " ".join(words)
+
+
+class TestShingles:
+    """Hashed word k-grams and exact Jaccard."""
+
+    def test_case_and_punctuation_insensitive(self) -> None:
+        """Only lower-cased word tokens matter."""
+        assert shingles("Fix the Bug!") == shingles("fix, the bug")
+        assert len(shingles("one two three")) == 2
+
+    def test_short_text_falls_back_to_words(self) -> None:
+        """Fewer than k words gives the single-word shingles."""
+        assert len(shingles("timeout")) == 1
+        assert shingles("") == frozenset()
+
+    def test_k_grams_agree(self) -> None:
+        """The k=2 fast path and the general loop count the same shingles."""
+        text = "a b c a b c d"
+        assert len(shingles(text, k=2)) == 4
+        assert len(shingles(text, k=3)) == 4
+
+    def test_jaccard(self) -> None:
+        """Intersection over union; two empty sets are identical."""
+        assert jaccard({1, 2, 3}, {2, 3, 4}) == 0.5
+        assert jaccard(set(), set()) == 1.0
+        assert jaccard({1}, set()) == 0.0
+
+
+class TestSignature:
+    """One-permutation MinHash with densification."""
+
+    def test_identical_sets_identical_signatures(self) -> None:
+        """Order of shingles doesn't matter; every bin is filled."""
+        items = shingles(ORIGINAL)
+        sig = signature(items)
+
+        assert sig == signature(sorted(items, reverse=True))
+        assert len(sig) == 64 and min(sig) >= 0
+
+    def test_empty_set(self) -> None:
+        """No shingles leaves every bin empty."""
+        assert signature([], 8) == (-1,) * 8
+
+    def test_agreement_estimates_jaccard(self) -> None:
+        """The share of equal slots tracks the exact similarity."""
+        rng = random.Random(7)
+        base = [f"t{i}" for i in range(400)]
+        a = shingles(" ".join(base))
+        b = shingles(perturb(base, rng, 60))
+
+        sa, sb = signature(a, 256), signature(b, 256)
+        estimate = sum(x == y for x, y in zip(sa, sb)) / 256
+
+        assert abs(estimate - jaccard(a, b)) < 0.1
+
+
+class TestLSHRecall:
+    """Near-duplicates land in a shared bucket; unrelated text doesn't."""
+
+    def test_choose_bands(self) -> None:
+        """The S-curve midpoint sits at least 0.1 under the threshold."""
+        bands, rows = choose_bands(0.6)
+
+        assert bands * rows == 64
+        assert (1 / bands) ** (1 / rows) <= 0.5
+
+    def test_known_near_duplicate_pair(self) -> None:
+        """Two wordings of one finding pair up; an unrelated finding doesn't."""
+        a, b, c = shingles(ORIGINAL), shingles(NEAR_DUPLICATE), shingles(UNRELATED)
+        assert jaccard(a, b) >= 0.6
+
+        index = LSHIndex(threshold=0.6)
+        index.add("a", a)
+        index.add("b", b)
+        index.add("c", c)
+        pairs = {frozenset(p) for p in index.candidates()}
+
+        assert frozenset({"a", "b"}) in pairs
+        assert not any("c" in p for p in pairs)
+
+    def test_recall_above_threshold(self) -> None:
+        """Nearly every pair at or above the threshold becomes a candidate."""
+        rng = random.Random(1)
+        index = LSHIndex(threshold=0.6)
+        expected = set()
+        for n in range(100):
+            base = [f"d{n}x{i}" for i in range(60)]
+            a, b = shingles(" ".join(base)), shingles(perturb(base, rng, 4))
+            index.add((n, "a"), a)
+            index.add((n, "b"), b)
+            if jaccard(a, b) >= 0.6:
+                expected.add(n)
+
+        found = {p[0][0] for p in index.candidates() if p[0][0] == p[1][0]}
+
+        assert len(expected) > 50
+        assert len(found & expected) / len(expected) >= 0.95
+
+    def test_scope_separates(self) -> None:
+        """Identical text in different scopes (e.g. files) never pairs."""
+        index = LSHIndex()
+        index.add("a", shingles(ORIGINAL), scope="src/a.py")
+        index.add("b", shingles(ORIGINAL), scope="src/b.py")
+        index.add("c", shingles(ORIGINAL), scope="src/a.py")
+
+        assert list(index.candidates()) == [("a", "c")]
+
+    def test_empty_document_not_indexed(self) -> None:
+        """Documents with no shingles can't pair with anything."""
+        index = LSHIndex()
+        index.add("a", frozenset())
+        index.add("b", frozenset())
+
+        assert list(index.candidates()) == []
@@ -0,0 +1,95 @@
+"""Tests for the parallel review runner's run-wide task limit.
+
+depends_on:
+  - lib/review_runner.py
+  - tests/conftest.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+from lib.frontmatter import parse_frontmatter
+from lib.review_runner import ReviewRunner, StubBackend
+from lib.task_ids import TaskIdAllocator
+
+
+def run(
+    tmp_path: Path,
+    allocator: TaskIdAllocator,
+    findings: dict[str, list[dict[str, Any]]],
+    limit: int,
+    delay: dict[str, float] | None = None,
+) -> dict[str, list[str]]:
+    """Run the stub reviewers; returns review_type -> source findings of its new tasks."""
+    runner = ReviewRunner(
+        StubBackend(findings, delay=delay or {}),
+        task_dir=tmp_path / "tasks",
+        allocator=allocator,
+        limit=limit,
+    )
+    jobs = runner.jobs(tmp_path / "reviews", "main", "abc1234", list(findings))
+    created: dict[str, list[str]] = {}
+    for outcome in runner.run(jobs):
+        assert outcome.ok, outcome.error
+        created[outcome.job.review_type] = [
+            parse_frontmatter((tmp_path / "tasks" / f"{task}.md").read_text())["source_finding"]
+            for task in outcome.tasks
+        ]
+    return created
+
+
+class TestRunLimit:
+    """`limit` caps the whole run, not each landed review."""
+
+    def test_three_reviewers_share_the_limit(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+    ) -> None:
+        """Three reviews with five P0s each create `limit` tasks in total."""
+        findings = {
+            rt: [make_finding(f"{rt[0].upper()}{i}", "P0") for i in range(5)]
+            for rt in ("test", "value", "mlflow")
+        }
+
+        created = run(tmp_path, allocator, findings, limit=4)
+
+        assert sum(len(tasks) for tasks in created.values()) == 4
+        assert len(list((tmp_path / "tasks").glob("TASK-*.md"))) == 4
+
+    def test_slow_reviewer_keeps_a_share(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+    ) -> None:
+        """An early review cannot use up the whole limit before a later P0 lands."""
+        findings = {
+            "test": [make_finding(f"T{i}", "P1") for i in range(5)],
+            "value": [make_finding("V0", "P0")],
+        }
+
+        created = run(tmp_path, allocator, findings, limit=2, delay={"value": 0.2})
+
+        assert created == {"test": ["T0"], "value": ["V0"]}
+
+    def test_unused_share_passes_on(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+    ) -> None:
+        """A review with nothing eligible leaves its share to later ones."""
+        findings = {
+            "test": [],
+            "value": [make_finding(f"V{i}", "P0") for i in range(5)],
+        }
+
+        created = run(tmp_path, allocator, findings, limit=4, delay={"value": 0.2})
+
+        assert created == {"test": [], "value": ["V0", "V1", "V2", "V3"]}
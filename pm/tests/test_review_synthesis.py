@@ -0,0 +1,187 @@
+"""Tests for incremental review synthesis (manifest, task limits, ranking).
+
+depends_on:
+  - lib/review_synthesis.py
+  - tests/conftest.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from lib.review_synthesis import MANIFEST_NAME, ReviewSynthesizer
+from lib.task_ids import TaskIdAllocator
+
+
+def synthesizer(tmp_path: Path, allocator: TaskIdAllocator) -> ReviewSynthesizer:
+    """A fresh synthesizer, as a new process would create (manifest reloaded)."""
+    return ReviewSynthesizer(tmp_path / "reviews", tmp_path / "tasks", allocator=allocator)
+
+
+def manifest_tasks(tmp_path: Path) -> dict[str, list[str | None]]:
+    """review file name -> task of each finding, from the saved manifest."""
+    data = json.loads((tmp_path / "reviews" / MANIFEST_NAME).read_text())
+    return {
+        name: [f["task"] for f in entry["findings"]]
+        for name, entry in data["reviews"].items()
+    }
+
+
+class TestTaskLimit:
+    """Eligible findings beyond the per-sync limit."""
+
+    def test_over_limit_findings_get_tasks_later(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """Findings cut by the limit get tasks on a later sync of an unchanged review."""
+        write_review([make_finding(f"F{i}", "P0") for i in range(5)])
+
+        first = synthesizer(tmp_path, allocator).sync(limit=2)
+        second = synthesizer(tmp_path, allocator).sync(limit=10)
+
+        assert [t.id for t in first.tasks] == ["TASK-101", "TASK-102"]
+        assert second.parsed == 0 and second.unchanged == 1
+        assert [t.id for t in second.tasks] == ["TASK-103", "TASK-104", "TASK-105"]
+        assert list(manifest_tasks(tmp_path).values()) == [
+            ["TASK-101", "TASK-102", "TASK-103", "TASK-104", "TASK-105"]
+        ]
+        assert sorted(p.name for p in (tmp_path / "tasks").iterdir()) == [
+            f"TASK-{n}.md" for n in range(101, 106)
+        ]
+
+    def test_nothing_left_creates_nothing(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """Once every eligible finding has a task, a re-sync is a no-op."""
+        write_review([make_finding("F1")])
+        synthesizer(tmp_path, allocator).sync()
+
+        result = synthesizer(tmp_path, allocator).sync()
+
+        assert result.tasks == []
+        assert result.summary == {}  # summary.json not rewritten
+
+
+class TestCrossReviewRanking:
+    """Each sync ranks taskless findings of every review in the manifest."""
+
+    def test_later_p0_beats_earlier_leftover_p1s(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """A slow reviewer's P0 takes the next slot ahead of leftover P1s."""
+        write_review([make_finding(f"A{i}", "P1") for i in range(4)], review_type="test")
+        synthesizer(tmp_path, allocator).sync(limit=2)
+
+        late = write_review([make_finding("B0", "P0", confidence=80)], review_type="value")
+        result = synthesizer(tmp_path, allocator).sync([late], limit=1)
+
+        assert [t.source_finding for t in result.tasks] == ["B0"]
+
+    def test_ties_keep_manifest_order(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """Equal rank: earlier review (by file name), then finding order."""
+        write_review([make_finding("V0"), make_finding("V1")], review_type="value")
+        write_review([make_finding("T0"), make_finding("T1")], review_type="test")
+
+        result = synthesizer(tmp_path, allocator).sync(limit=3)
+
+        # REVIEW-test-... sorts before REVIEW-value-...
+        assert [t.source_finding for t in result.tasks] == ["T0", "T1", "V0"]
+
+    def test_higher_confidence_first(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """Within a priority, higher confidence wins across reviews."""
+        write_review([make_finding("T0", confidence=85)], review_type="test")
+        write_review([make_finding("V0", confidence=95)], review_type="value")
+
+        result = synthesizer(tmp_path, allocator).sync(limit=1)
+
+        assert [t.source_finding for t in result.tasks] == ["V0"]
+
+
+class TestChangeDetection:
+    """Stat-first, then SHA256, then parse."""
+
+    def test_changed_review_keeps_existing_tasks(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """New content is re-parsed; matched findings keep their task, new ones get one."""
+        path = write_review([make_finding("F1")])
+        synthesizer(tmp_path, allocator).sync()
+
+        write_review([make_finding("F1"), make_finding("F2")])
+        result = synthesizer(tmp_path, allocator).sync()
+
+        assert result.changed == [path.name]
+        assert [t.source_finding for t in result.tasks] == ["F2"]
+        assert manifest_tasks(tmp_path)[path.name] == ["TASK-101", "TASK-102"]
+
+    def test_touched_review_is_not_reparsed(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """A stat change with identical content only refreshes the stored stat."""
+        path = write_review([make_finding("F1")])
+        synthesizer(tmp_path, allocator).sync()
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        result = synthesizer(tmp_path, allocator).sync()
+        again = synthesizer(tmp_path, allocator).sync()
+
+        assert result.parsed == 0 and result.unchanged == 1
+        assert again.parsed == 0 and again.unchanged == 1
+
+    def test_deleted_review_is_forgotten(
+        self,
+        tmp_path: Path,
+        allocator: TaskIdAllocator,
+        make_finding: Callable[..., dict[str, Any]],
+        write_review: Callable[..., Path],
+    ) -> None:
+        """A full scan drops removed reviews from the manifest and summary; tasks stay."""
+        kept = write_review([make_finding("T0")], review_type="test")
+        gone = write_review([make_finding("V0")], review_type="value")
+        synthesizer(tmp_path, allocator).sync()
+
+        gone.unlink()
+        result = synthesizer(tmp_path, allocator).sync()
+
+        assert result.removed == [gone.name]
+        assert list(manifest_tasks(tmp_path)) == [kept.name]
+        assert [r["id"] for r in result.summary["reviews"]] == [kept.stem]
+        assert (tmp_path / "tasks" / "TASK-102.md").exists()
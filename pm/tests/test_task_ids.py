@@ -0,0 +1,129 @@
+"""Tests for the shared task ID allocator.
+
+depends_on:
+  - lib/task_ids.py
+  - tests/conftest.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from lib.task_ids import TaskIdAllocator
+
+PM_DIR = Path(__file__).parent.parent
+
+# Child process: wait for the go file, then allocate one ID per claim
+WORKER = """
+import sys, time
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from lib.task_ids import TaskIdAllocator
+db, go, count = Path(sys.argv[2]), Path(sys.argv[3]), int(sys.argv[4])
+allocator = TaskIdAllocator(db, batch=1)
+while not go.exists():
+    time.sleep(0.001)
+print("\\n".join(allocator.allocate() for _ in range(count)))
+allocator.close()
+"""
+
+
+class TestConcurrentProcesses:
+    """Blocks are claimed under BEGIN IMMEDIATE, so processes never collide."""
+
+    def test_two_processes_never_share_an_id(self, tmp_path: Path) -> None:
+        """Two processes racing one claim per ID hand out disjoint IDs."""
+        db, go, count = tmp_path / "task-ids.sqlite", tmp_path / "go", 200
+        TaskIdAllocator(db).close()  # Create the table before the race
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", WORKER, str(PM_DIR), str(db), str(go), str(count)],
+                stdout=subprocess.PIPE, text=True,
+            )
+            for _ in range(2)
+        ]
+        go.touch()
+        outputs = [w.communicate(timeout=60)[0].split() for w in workers]
+
+        assert [w.returncode for w in workers] == [0, 0]
+        ids = outputs[0] + outputs[1]
+        assert len(ids) == 2 * count and len(set(ids)) == 2 * count
+        assert sorted(int(i.split("-")[1]) for i in ids) == list(range(101, 101 + 2 * count))
+
+    def test_allocators_share_the_counter(self, tmp_path: Path) -> None:
+        """Blocks claimed by separate allocators follow each other."""
+        db = tmp_path / "task-ids.sqlite"
+        a, b = TaskIdAllocator(db, batch=4), TaskIdAllocator(db, batch=4)
+
+        assert [a.allocate(), b.allocate(), a.allocate()] == ["TASK-101", "TASK-105", "TASK-102"]
+        a.close()
+        b.close()
+
+
+class TestRelease:
+    """Unused numbers go back only when nobody claimed past them."""
+
+    def test_partly_used_block_is_released(
+        self, tmp_path: Path, allocator: TaskIdAllocator,
+    ) -> None:
+        """The unused tail of a block is handed out again after close()."""
+        allocator.reserve(10)
+        assert allocator.allocate_many(3) == ["TASK-101", "TASK-102", "TASK-103"]
+        allocator.close()
+
+        again = TaskIdAllocator(tmp_path / "task-ids.sqlite")
+        assert again.allocate() == "TASK-104"
+        again.close()
+
+    def test_tail_skipped_after_a_later_claim(self, tmp_path: Path) -> None:
+        """Once another allocator claimed past the block, its tail becomes a gap."""
+        db = tmp_path / "task-ids.sqlite"
+        a, b = TaskIdAllocator(db), TaskIdAllocator(db)
+        a.reserve(10)
+        a.allocate()
+        assert b.reserve(5) == range(111, 116)
+
+        a.release()
+        c = TaskIdAllocator(db)
+
+        assert c.allocate() == "TASK-116"
+        for allocator in (a, b, c):
+            allocator.close()
+
+    def test_reserve_releases_the_previous_block(self, allocator: TaskIdAllocator) -> None:
+        """A new reservation first gives back the unused part of the current one."""
+        allocator.reserve(10)
+        allocator.allocate()
+
+        assert allocator.reserve(2) == range(102, 104)
+
+
+class TestFloor:
+    """IDs already on disk are never handed out."""
+
+    def test_observed_ids_raise_the_floor(self, allocator: TaskIdAllocator) -> None:
+        """Observing TASK-250 starts allocation at TASK-251; other prefixes are ignored."""
+        assert allocator.observe(["TASK-250", "TASK-007", "EPIC-900", "notes"]) == 250
+
+        assert allocator.allocate() == "TASK-251"
+
+    def test_floor_skips_inside_a_block(self, allocator: TaskIdAllocator) -> None:
+        """IDs observed after a block was claimed are skipped within it."""
+        allocator.reserve(10)
+        allocator.observe(["TASK-105"])
+
+        assert allocator.allocate() == "TASK-106"
+
+    def test_unwritable_database_falls_back(self, tmp_path: Path) -> None:
+        """If the database can't be opened, IDs stay unique within the process."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        allocator = TaskIdAllocator(blocker / "task-ids.sqlite")
+
+        assert not allocator.shared
+        assert allocator.allocate_many(2) == ["TASK-101", "TASK-102"]
+        assert allocator.allocate() == "TASK-103"
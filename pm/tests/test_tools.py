@@ -0,0 +1,91 @@
+"""Tests for PMTools result caching and in-process execution.
+
+depends_on:
+  - lib/tools.py
+  - lib/result_cache.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lib.tools import PMTools, ToolResult
+
+
+@pytest.fixture
+def tools(tmp_path: Path) -> PMTools:
+    """PMTools on an empty tree, no daemon."""
+    (tmp_path / ".index").mkdir()
+    (tmp_path / "TASK-001.md").write_text('---\nid: "TASK-001"\nversion: "1.0.0"\n---\n')
+    return PMTools(tmp_path, use_daemon=False)
+
+
+class TestResultCache:
+    """Only side-effect-free single-file reads are cached."""
+
+    def test_frontmatter_cached_until_file_changes(self, tools: PMTools) -> None:
+        """A hit while the file's stat is unchanged; a fresh read after an edit."""
+        first = tools.l0_frontmatter("TASK-001.md")
+        second = tools.l0_frontmatter("TASK-001.md")
+
+        path = tools.root / "TASK-001.md"
+        path.write_text('---\nid: "TASK-002"\nversion: "1.0.0"\n---\n')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        third = tools.l0_frontmatter("TASK-001.md")
+
+        assert (first.cached, second.cached, third.cached) == (False, True, False)
+        assert second.output == first.output
+        assert "TASK-002" in third.output
+
+    def test_hash_and_lint_cached(self, tools: PMTools) -> None:
+        """l0_hash and l0_lint are served from the cache on repeat."""
+        assert [tools.l0_hash("TASK-001.md").cached for _ in range(2)] == [False, True]
+        assert [tools.l0_lint("TASK-001.md").cached for _ in range(2)] == [False, True]
+
+    def test_missing_file_not_cached(self, tools: PMTools) -> None:
+        """Without a stat there is no key, so every call runs."""
+        assert [tools.l0_hash("gone.md").cached for _ in range(2)] == [False, False]
+
+    @pytest.mark.parametrize("tool", ["l0_test", "l0_arch", "l1_validate", "l1_index"])
+    def test_side_effecting_tools_always_run(self, tools: PMTools, tool: str) -> None:
+        """Tools that run make or rewrite files are never served from the cache."""
+        calls = []
+
+        def fake(*args: object, **kwargs: object) -> ToolResult:
+            calls.append(args)
+            return ToolResult(True, "ok", 0, tool, 1)
+
+        tools.native = False
+        tools._make = fake  # type: ignore[method-assign]
+
+        results = [getattr(tools, tool)() for _ in range(2)]
+
+        assert len(calls) == 2
+        assert not any(r.cached for r in results)
+
+
+class TestNative:
+    """In-process calls fall back only on environment errors."""
+
+    def test_os_error_falls_back(self, tools: PMTools) -> None:
+        """An unreadable file lets the daemon/make path try instead."""
+        def fail() -> str:
+            raise FileNotFoundError("gone.md")
+
+        assert tools._native(fail, 0, "l0-frontmatter") is None
+
+    def test_bug_is_reported(self, tools: PMTools) -> None:
+        """Other exceptions become a failed result naming the error."""
+        def fail() -> str:
+            raise KeyError("files")
+
+        result = tools._native(fail, 0, "l1-index")
+
+        assert result is not None and not result.success
+        assert "KeyError" in result.output
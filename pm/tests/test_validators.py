@@ -0,0 +1,97 @@
+"""Tests for one-pass corpus validation.
+
+depends_on:
+  - lib/validators.py
+depended_by: []
+semver: patch
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from lib.corpus import EntityCorpus
+from lib.validators import validate_corpus
+
+EPIC = """---
+id: "EPIC-001"
+version: "1.0.0"
+type: epic
+status: pending
+blocks:
+  - "EPIC-002"
+---
+
+# Epic
+"""
+
+TASK = """---
+id: "TASK-001"
+version: "1.0.0"
+type: task
+status: pending
+parent: "EPIC-001"
+subject: "Do it"
+activeForm: "Doing it"
+blockedBy:
+  - "EPIC-001"
+  - "pip:requests"
+---
+
+# Task
+"""
+
+
+def write(root: Path, name: str, text: str) -> Path:
+    path = root / "entities" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+class TestValidateCorpus:
+    """Errors fail the report; unknown references only warn."""
+
+    def test_unknown_reference_is_a_warning(self, tmp_path: Path) -> None:
+        """blocks on an entity outside the scanned set does not fail validation."""
+        write(tmp_path, "EPIC-001.md", EPIC)
+        write(tmp_path, "TASK-001.md", TASK)
+
+        report = validate_corpus(tmp_path, ["entities"], corpus=EntityCorpus())
+
+        assert report.ok
+        assert report.entities == 2
+        assert [(i.path, i.kind, i.severity) for i in report.issues] == [
+            ("entities/EPIC-001.md", "dependency", "warning")
+        ]
+
+    def test_field_and_duplicate_errors_fail(self, tmp_path: Path) -> None:
+        """Invalid fields and duplicate IDs are errors."""
+        write(tmp_path, "EPIC-001.md", EPIC)
+        write(tmp_path, "copy.md", EPIC.replace('version: "1.0.0"', "version: 1.0"))
+
+        report = validate_corpus(tmp_path, ["entities"], check_deps=False, corpus=EntityCorpus())
+
+        assert not report.ok
+        assert sorted(i.kind for i in report.errors) == ["duplicate", "field"]
+
+    def test_unreadable_file_is_reported(self, tmp_path: Path) -> None:
+        """A missing file is a read error; the other files are still checked."""
+        write(tmp_path, "EPIC-001.md", EPIC)
+
+        report = validate_corpus(
+            tmp_path, ["entities/EPIC-001.md", "entities/gone.md"],
+            check_deps=False, corpus=EntityCorpus(),
+        )
+
+        assert report.entities == 1
+        assert [(i.path, i.kind) for i in report.errors] == [("entities/gone.md", "read")]
+
+    def test_uses_the_corpus(self, tmp_path: Path) -> None:
+        """Files are loaded into (and served from) the given corpus."""
+        path = write(tmp_path, "EPIC-001.md", EPIC)
+        corpus = EntityCorpus()
+
+        validate_corpus(tmp_path, ["entities"], corpus=corpus)
+
+        assert path in corpus